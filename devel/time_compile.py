@@ -0,0 +1,83 @@
+# Copyright (c) 2012-2018 by the GalSim developers team on GitHub
+# https://github.com/GalSim-developers
+#
+# This file is part of GalSim: The modular galaxy image simulation toolkit.
+# https://github.com/GalSim-developers/GalSim
+#
+# GalSim is free software: redistribution and use in source and binary forms,
+# with or without modification, are permitted provided that the following
+# conditions are met:
+#
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions, and the disclaimer given in the accompanying LICENSE
+#    file.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions, and the disclaimer given in the documentation
+#    and/or other materials provided with the distribution.
+#
+
+
+"""Time drawing realistic compound galaxy models with and without GSObject.compile().
+"""
+
+from __future__ import print_function
+import timeit
+import galsim
+
+def make_galaxy():
+    # A bulge + disk + knots galaxy, where each component is sheared and shifted, with an
+    # overall shear and shift.
+    bulge = galsim.DeVaucouleurs(half_light_radius=0.3, flux=0.3)
+    bulge = bulge.shear(e1=0.1, e2=0.05).shift(0.02, 0.01)
+    disk = galsim.Exponential(half_light_radius=0.8, flux=0.6)
+    disk = disk.shear(e1=0.3, e2=-0.1).shift(0.02, 0.01)
+    knots = galsim.Sum([galsim.Gaussian(sigma=0.05, flux=0.02).shift(x,y)
+                        for x,y in [(0.3,0.1), (-0.2,0.4), (0.1,-0.5), (-0.4,-0.2), (0.5,0.3)]])
+    return galsim.Sum(bulge, disk, knots).shear(g1=0.02, g2=-0.01).shift(0.1, -0.05)
+
+def make_psf():
+    # A double Gaussian atmospheric PSF, convolved with Gaussian charge diffusion and a shifted
+    # Gaussian for the tracking jitter.
+    atm = galsim.Sum(galsim.Gaussian(fwhm=0.7, flux=0.8), galsim.Gaussian(fwhm=1.4, flux=0.2))
+    atm = atm.shear(g1=0.03)
+    diffusion = galsim.Gaussian(sigma=0.1).shear(g2=0.05)
+    jitter = galsim.Gaussian(sigma=0.05).shift(0.01, 0.0)
+    return galsim.Convolve(atm, diffusion, jitter)
+
+def time_draw(obj, image, method, n):
+    obj.drawImage(image=image, method=method)
+    return min(timeit.repeat(lambda: obj.drawImage(image=image, method=method),
+                             repeat=5, number=n)) / n
+
+def time_kimage(obj, kimage, n):
+    obj.drawKImage(image=kimage)
+    return min(timeit.repeat(lambda: obj.drawKImage(image=kimage), repeat=5, number=n)) / n
+
+def main():
+    pixel = galsim.Pixel(0.2)
+    models = [
+        ('galaxy * psf', galsim.Convolve(make_galaxy(), make_psf())),
+        ('galaxy * psf * pixel', galsim.Convolve(make_galaxy(), make_psf(), pixel)),
+        ('psf', make_psf()),
+    ]
+    image = galsim.Image(64, 64, scale=0.2)
+    kimage = galsim.ImageCD(256, 256, scale=0.05)
+
+    n = 100
+    t = min(timeit.repeat(lambda: galsim.Convolve(make_galaxy(), make_psf()).compile(),
+                          repeat=5, number=n)) / n
+    print('Time to compile galaxy * psf: %.3f ms'%(t*1.e3))
+    print()
+    print('%-22s %-10s %10s %10s %8s'%('model', 'method', 'original', 'compiled', 'speedup'))
+    for name, obj in models:
+        compiled = obj.compile()
+        t1 = time_kimage(obj, kimage, 5)
+        t2 = time_kimage(compiled, kimage, 5)
+        print('%-22s %-10s %8.2fms %8.2fms %8.2f'%(name, 'drawKImage', t1*1.e3, t2*1.e3, t1/t2))
+        for method in ['no_pixel', 'fft']:
+            t1 = time_draw(obj, image, method, 20)
+            t2 = time_draw(compiled, image, method, 20)
+            print('%-22s %-10s %8.2fms %8.2fms %8.2f'%(name, method, t1*1.e3, t2*1.e3, t1/t2))
+
+if __name__ == "__main__":
+    main()
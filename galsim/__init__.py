@@ -159,7 +159,7 @@ from .chromatic import ChromaticConvolution, ChromaticDeconvolution, ChromaticAu
 from .chromatic import ChromaticAutoCorrelation, ChromaticTransformation
 from .chromatic import ChromaticFourierSqrtProfile
 from .chromatic import ChromaticOpticalPSF, ChromaticAiry, InterpolatedChromaticObject
-from .sed import SED
+from .sed import SED, SEDTemplateBank
 from .bandpass import Bandpass
 
 # WCS
@@ -28,7 +28,7 @@ from .sed import SED
 from . import utilities
 from . import integ
 from . import meta_data
-from .utilities import WeakMethod, combine_wave_list
+from .utilities import WeakMethod, lazy_property, combine_wave_list
 from .errors import GalSimRangeError, GalSimValueError, GalSimIncompatibleValuesError
 
 class Bandpass(object):
@@ -202,6 +202,16 @@ class Bandpass(object):
         else:
             self.func = WeakMethod(self._func_factor)
 
+    @lazy_property
+    def _tp_table(self):
+        # The wavelengths (in nm) and values of self._tp as numpy arrays, if it is a linear
+        # LookupTable, so that integrals against an SED can be done with plain numpy array
+        # operations.  Otherwise None.
+        if (not isinstance(self._tp, LookupTable) or self._tp.x_log or self._tp.f_log
+                or self._tp.interpolant != 'linear'):
+            return None
+        return np.array(self._tp.getArgs()) / self.wave_factor, np.array(self._tp.getVals())
+
     def _func_trivial(self, wave):
         return self._tp(np.asarray(wave,dtype=float))
 
@@ -614,6 +624,7 @@ class Bandpass(object):
         if not isinstance(d['_tp'], LookupTable):
             del d['_tp']
         del d['func']
+        d.pop('_tp_table',None)
         return d
 
     def __setstate__(self, d):
@@ -296,3 +296,59 @@ class TopHat(GSObject):
     @doc_inherit
     def _drawKImage(self, image):
         self._sbp.drawK(image._image, image.scale)
+
+
+def _box_list(obj):
+    """If `obj` is a Box (or Pixel), or a Sum or Transformation of them, where the
+    transformations don't shear or rotate them, return a list of tuples
+    (flux, xmin, xmax, ymin, ymax) giving the flux and extent of each component.
+    Otherwise return None.
+    """
+    from .sum import Sum
+    from .transform import Transformation
+    if isinstance(obj, Box):
+        return [ (obj.flux, -0.5*obj.width, 0.5*obj.width, -0.5*obj.height, 0.5*obj.height) ]
+    elif isinstance(obj, Transformation):
+        jac = obj._jac
+        if jac[0,1] != 0. or jac[1,0] != 0.:
+            return None
+        boxes = _box_list(obj.original)
+        if boxes is None: return None
+        ret = []
+        for flux, xmin, xmax, ymin, ymax in boxes:
+            x1, x2 = sorted((jac[0,0] * xmin, jac[0,0] * xmax))
+            y1, y2 = sorted((jac[1,1] * ymin, jac[1,1] * ymax))
+            ret.append((flux * obj._flux_scaling, x1 + obj.offset.x, x2 + obj.offset.x,
+                        y1 + obj.offset.y, y2 + obj.offset.y))
+        return ret
+    elif isinstance(obj, Sum):
+        boxes = []
+        for o in obj.obj_list:
+            b = _box_list(o)
+            if b is None: return None
+            boxes.extend(b)
+        return boxes
+    else:
+        return None
+
+def _draw_pixel_boxes(boxes, image, add_to_image=False):
+    """Draw a list of Boxes (in image coordinates, as returned by _box_list), convolved by the
+    unit pixel, onto image, which should have a pixel scale of 1.
+
+    Each Box is separable, so the pixel integrals are the outer product of the fractions of each
+    column and row that overlap the box.
+
+    @returns the total flux drawn.
+    """
+    x = np.arange(image.xmin, image.xmax+1, dtype=float)
+    y = np.arange(image.ymin, image.ymax+1, dtype=float)
+    values = np.zeros(image.array.shape)
+    for flux, xmin, xmax, ymin, ymax in boxes:
+        fx = np.clip(np.minimum(x+0.5, xmax) - np.maximum(x-0.5, xmin), 0., None)
+        fy = np.clip(np.minimum(y+0.5, ymax) - np.maximum(y-0.5, ymin), 0., None)
+        values += np.outer(flux / ((xmax-xmin) * (ymax-ymin)) * fy, fx)
+    if add_to_image:
+        image.array[:,:] = image.array + values
+    else:
+        image.array[:,:] = values
+    return values.sum(dtype=float)
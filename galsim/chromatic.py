@@ -29,7 +29,7 @@ different filters, or implementing wavelength-dependent point spread functions.
 import numpy as np
 
 from .gsobject import GSObject
-from .sed import SED
+from .sed import SED, _integrate_product
 from .bandpass import Bandpass
 from .position import PositionD, PositionI
 from .utilities import lazy_property, doc_inherit
@@ -194,7 +194,9 @@ class ChromaticObject(object):
         """ Cached integral of product of sed and bandpass."""
         wave_list = np.array(wave_list)
         if len(wave_list) > 0:
-            multiplier = np.trapz(sed(wave_list) * bandpass(wave_list), wave_list)
+            multiplier = _integrate_product(sed, bandpass, wave_list)
+            if multiplier is None:
+                multiplier = np.trapz(sed(wave_list) * bandpass(wave_list), wave_list)
         else:
             multiplier = integ.int1d(lambda w: sed(w) * bandpass(w),
                                      bandpass.blue_limit, bandpass.red_limit)
@@ -323,6 +325,14 @@ class ChromaticObject(object):
                                 interpolated SED at that wavelength.  Thus, the flux of the
                                 interpolated object should be correct, at the possible expense of
                                 other features. [default: True]
+        @param nproc            The number of processes to use for evaluating and drawing the
+                                profile at each wavelength.  If nproc <= 0, then use the number of
+                                cpus.  [default: 1]
+        @param cache_file       If given, the name of a FITS file in which to save the images.  If
+                                the file already exists and was made for the same object,
+                                wavelengths and oversample_fac, the images are read from it rather
+                                than being remade.  This can save the initialization time in
+                                subsequent runs.  [default: None]
 
         @returns the version of the Chromatic object that uses interpolation
                  (This will be an InterpolatedChromaticObject instance.)
@@ -389,6 +399,25 @@ class ChromaticObject(object):
             >>> integrator = galsim.ContinuousIntegrator(rule=galsim.integ.midptRule, N=100)
             >>> image = chromatic_obj.drawImage(bandpass, integrator=integrator)
 
+        Both integrators also take a `single_fft` argument.  If it is True, the weighted sum of the
+        profiles at all the wavelengths is drawn as a single profile, which needs only one inverse
+        FFT rather than one for each wavelength.  This is often much faster for non-separable
+        profiles like ChromaticAtmosphere.
+
+        There is also `galsim.integ.AdaptiveIntegrator`, which refines the wavelength sampling only
+        where the profile is changing, until the integral reaches a given relative accuracy.
+
+        When drawing with method='phot', you may also set `chromatic_phot=True`.  Then no
+        wavelength integration is done at all, and `integrator` is ignored.  Instead, the
+        wavelength of each photon is first drawn from the SED times the bandpass.  Then the photons
+        are grouped into `n_wave_bins` equal bins in wavelength, and the photons in each bin are
+        shot from the profile evaluated at their mean wavelength.  The photons keep their
+        wavelengths, so sensor effects that depend on wavelength will use them without needing a
+        `WavelengthSampler`.  The default number of bins is 100, which may be changed by passing
+        `n_wave_bins` as an additional keyword argument.  Separable profiles only need a single
+        bin.  For non-separable profiles, this approximates the profile as constant within each
+        bin, so e.g. the DCR of a ChromaticAtmosphere is applied as `n_wave_bins` discrete shifts.
+
         Finally, this method uses a cache to avoid recomputing the integral over the product of
         the bandpass and object SED when possible (i.e., for separable profiles).  Because the
         cache size is finite, users may find that it is more efficient when drawing many images
@@ -407,6 +436,9 @@ class ChromaticObject(object):
                                 the object has a `wave_list`.  [default: 'trapezoidal',
                                 which will try to select an appropriate integrator using the
                                 trapezoidal integration rule automatically.]
+        @param chromatic_phot   When drawing with method='phot', whether to draw the wavelength of
+                                each photon first, rather than integrating images drawn with
+                                photon shooting over wavelength.  See above. [default: False]
         @param **kwargs         For all other kwarg options, see GSObject.drawImage()
 
         @returns the drawn Image.
@@ -417,6 +449,9 @@ class ChromaticObject(object):
         if self.SED.dimensionless:
             raise GalSimSEDError("Can only draw ChromaticObjects with spectral SEDs.", self.SED)
 
+        if _use_chromatic_phot(kwargs):
+            return self._shootImage(bandpass, image, **kwargs)
+
         # setup output image using fiducial profile
         wave0, prof0 = self._fiducial_profile(bandpass)
         image = prof0.drawImage(image=image, setup_only=True, **kwargs)
@@ -426,7 +461,11 @@ class ChromaticObject(object):
         wave_list, _, _ = utilities.combine_wave_list(self, bandpass)
 
         if self.separable:
-            multiplier = ChromaticObject._multiplier_cache(self.SED, bandpass, tuple(wave_list))
+            if bandpass in self.SED._bank_fluxes:
+                multiplier = self.SED._bank_fluxes[bandpass]
+            else:
+                multiplier = ChromaticObject._multiplier_cache(self.SED, bandpass,
+                                                               tuple(wave_list))
             prof0 *= multiplier/self.SED(wave0)
             image = prof0.drawImage(image=image, **kwargs)
             return image
@@ -461,6 +500,69 @@ class ChromaticObject(object):
         self._last_wcs = image.wcs
         return image
 
+    def _shootImage(self, bandpass, image=None, n_wave_bins=100, n_photons=0., rng=None,
+                    max_extra_noise=0., poisson_flux=None, add_to_image=False, surface_ops=(),
+                    **kwargs):
+        """Draw the object with photon shooting, drawing the wavelength of each photon first.
+
+        This is what drawImage() does for method='phot' with chromatic_phot=True.  The
+        photons are grouped into `n_wave_bins` equal bins in wavelength across the bandpass, and
+        the photons in each bin are shot from the profile evaluated at their mean wavelength.
+        """
+        from .random import BaseDeviate
+        if n_wave_bins < 1:
+            raise GalSimRangeError("n_wave_bins must be >= 1", n_wave_bins, 1)
+        rng = BaseDeviate(rng)
+
+        # setup output image using fiducial profile
+        wave0, prof0 = self._fiducial_profile(bandpass)
+        image = prof0.drawImage(image=image, setup_only=True, **kwargs)
+        _remove_setup_kwargs(kwargs)
+        if not add_to_image:
+            image.setZero()
+
+        # Figure out the number of photons and the flux each one carries the same way
+        # GSObject.drawPhot does, using the fiducial profile with the total flux.
+        flux = self.calculateFlux(bandpass)
+        ref = prof0.withFlux(flux)
+        if poisson_flux is None:
+            poisson_flux = (n_photons == 0.)
+        Ntot, g = ref._calculate_nphotons(n_photons, poisson_flux, max_extra_noise, rng)
+        if Ntot == 0:
+            image.added_flux = 0.
+            self._last_wcs = image.wcs
+            return image
+        eta_factor = flux / (ref.positive_flux + ref.negative_flux)
+        flux_per_photon = g * flux / (Ntot * eta_factor)
+
+        # Draw all the wavelengths, and split them into bins.
+        waves = np.empty(Ntot)
+        self.SED._sampleWavelength(waves, bandpass, rng=rng)
+        waves.sort()
+        if self.separable:
+            n_wave_bins = 1
+        edges = np.linspace(bandpass.blue_limit, bandpass.red_limit, n_wave_bins+1)
+        bins = np.split(waves, np.searchsorted(waves, edges[1:-1]))
+
+        added_flux = 0.
+        n_eval = 0
+        for bin_waves in bins:
+            if len(bin_waves) == 0: continue
+            if self.separable:
+                prof = prof0
+            else:
+                prof = self.evaluateAtWavelength(np.mean(bin_waves))
+                n_eval += 1
+            prof = prof.withFlux(flux_per_photon * len(bin_waves))
+            ops = [_WavelengthSetter(bin_waves)] + list(surface_ops)
+            image = prof.drawImage(image=image, add_to_image=True, n_photons=len(bin_waves),
+                                   rng=rng, poisson_flux=False, surface_ops=ops, **kwargs)
+            added_flux += image.added_flux
+        image.added_flux = added_flux
+        self._last_n_eval = n_eval
+        self._last_wcs = image.wcs
+        return image
+
     def drawKImage(self, bandpass, image=None, integrator='trapezoidal', **kwargs):
         """Base implementation for drawing the Fourier transform of a ChromaticObject.
 
@@ -1010,10 +1112,47 @@ class ChromaticObject(object):
 
         return Transform(self, offset=offset)
 
+def _use_chromatic_phot(kwargs):
+    # Remove the chromatic_phot option from the drawImage kwargs, and return whether it is set.
+    chromatic_phot = kwargs.pop('chromatic_phot', False)
+    if chromatic_phot and kwargs.get('method', None) != 'phot':
+        raise GalSimIncompatibleValuesError(
+            "chromatic_phot is only valid with method='phot'",
+            chromatic_phot=chromatic_phot, method=kwargs.get('method', None))
+    return chromatic_phot
+
+class _WavelengthSetter(object):
+    # A surface operator that sets the wavelengths of successive batches of photons from the
+    # given array.  ChromaticObject._shootImage uses this for the photons in each wavelength bin.
+    def __init__(self, waves):
+        self.waves = waves
+        self.index = 0
+
+    def applyTo(self, photon_array, local_wcs=None):
+        n = len(photon_array)
+        photon_array.wavelength = self.waves[self.index:self.index+n]
+        self.index += n
+
 ChromaticObject._multiplier_cache = utilities.LRU_Cache(
     ChromaticObject._get_multiplier, maxsize=10)
 
 
+def _evaluate_interpolation_obj(args):
+    # The first step of InterpolatedChromaticObject._build_objs for each wavelength.  This is a
+    # module-level function, so it can be used with multiprocessing.  Only the properties of the
+    # profile are returned, not the profile itself, since some profiles (e.g. OpticalPSF) do not
+    # pickle the expensive parts, so they would need to be rebuilt in the parent process.
+    original, wave = args
+    obj = original.evaluateAtWavelength(wave)
+    return obj.nyquist_scale, obj.stepk, obj.maxk, obj.flux
+
+def _draw_interpolation_obj(args):
+    # The second step of InterpolatedChromaticObject._build_objs for each wavelength.
+    original, wave, scale, im_size = args
+    obj = original.evaluateAtWavelength(wave)
+    return obj.drawImage(scale=scale, nx=im_size, ny=im_size, method='no_pixel')
+
+
 class InterpolatedChromaticObject(ChromaticObject):
     """A ChromaticObject that uses interpolation of predrawn images to speed up subsequent
     rendering.
@@ -1045,12 +1184,22 @@ class InterpolatedChromaticObject(ChromaticObject):
                             interpolated SED at that wavelength.  Thus, the flux of the interpolated
                             object should be correct, at the possible expense of other features.
                             [default: True]
+    @param nproc            The number of processes to use for evaluating and drawing the profile
+                            at each wavelength.  If nproc <= 0, then use the number of cpus.
+                            [default: 1]
+    @param cache_file       If given, the name of a FITS file in which to save the images.  If the
+                            file already exists and was made for the same object, wavelengths and
+                            oversample_fac, the images are read from it rather than being remade.
+                            [default: None]
     """
-    def __init__(self, original, waves, oversample_fac=1.0, use_exact_SED=True):
+    def __init__(self, original, waves, oversample_fac=1.0, use_exact_SED=True, nproc=1,
+                 cache_file=None):
 
         self.waves = np.sort(np.array(waves))
         self.oversample = oversample_fac
         self.use_exact_SED = use_exact_SED
+        self.nproc = nproc
+        self.cache_file = cache_file
 
         self.separable = original.separable
         self.interpolated = True
@@ -1062,8 +1211,27 @@ class InterpolatedChromaticObject(ChromaticObject):
         self._build_objs()
 
     def _build_objs(self):
-        # Make the objects between which we are going to interpolate.  Note that these do not have
-        # to be saved for later, unlike the images.
+        import os
+        if self.cache_file is not None and os.path.isfile(self.cache_file):
+            if self._read_cache_file():
+                return
+
+        nproc = self.nproc
+        if nproc <= 0:
+            from multiprocessing import cpu_count
+            nproc = cpu_count()
+        nproc = min(nproc, len(self.waves))
+        if nproc > 1:
+            self._build_objs_parallel(nproc)
+        else:
+            self._build_objs_serial()
+
+        if self.cache_file is not None:
+            self._write_cache_file()
+
+    def _build_objs_serial(self):
+        # Make the objects between which we are going to interpolate.  Note that these objects do
+        # not have to be saved for later, unlike the images.
         objs = [ self.deinterpolated.evaluateAtWavelength(wave) for wave in self.waves ]
 
         # Find the Nyquist scale for each, and to be safe, choose the minimum value to use for the
@@ -1080,12 +1248,92 @@ class InterpolatedChromaticObject(ChromaticObject):
         # can force these values when instantiating InterpolatedImages before drawing.
         self.stepk_vals = [ obj.stepk for obj in objs ]
         self.maxk_vals = [ obj.maxk for obj in objs ]
+        self.fluxes = [ obj.flux for obj in objs ]
 
         # Finally, now that we have an image scale and size, draw all the images.  Note that
         # `no_pixel` is used (we want the object on its own, without a pixel response).
         self.ims = [ obj.drawImage(scale=scale, nx=im_size, ny=im_size, method='no_pixel')
                      for obj in objs ]
-        self.fluxes = [ obj.flux for obj in objs ]
+
+    def _build_objs_parallel(self, nproc):
+        # The same steps as _build_objs_serial, but each one is done in the worker processes.
+        # The profiles are never sent between processes, since they may be expensive to pickle
+        # or to rebuild after unpickling.  Rather, each worker evaluates the profile at the
+        # given wavelength itself, so the parent process never builds any of them.
+        from multiprocessing import Pool
+        pool = Pool(nproc)
+        try:
+            results = pool.map(_evaluate_interpolation_obj,
+                               [ (self.deinterpolated, wave) for wave in self.waves ])
+            scale = np.min([ r[0] for r in results ]) / self.oversample
+            self.stepk_vals = [ r[1] for r in results ]
+            self.maxk_vals = [ r[2] for r in results ]
+            self.fluxes = [ r[3] for r in results ]
+
+            # This is the size that getGoodImageSize(scale) gives for the smallest stepk value.
+            # It only depends on stepk, so we don't need the profiles here to calculate it.
+            Nd = 2. * np.pi / (scale * np.min(self.stepk_vals))
+            im_size = 2 * ((int(np.ceil(Nd*(1.-1.e-12))) + 1) // 2)
+
+            self.ims = pool.map(_draw_interpolation_obj,
+                                [ (self.deinterpolated, wave, scale, im_size)
+                                  for wave in self.waves ])
+        finally:
+            pool.close()
+            pool.join()
+
+    def _cache_key(self):
+        # A string identifying the images in a cache file.  This needs to be the same in different
+        # python sessions, so it cannot use hash().  Nor can it use repr, since numpy truncates
+        # the repr of large arrays.  The GalSim version is included, so files written by other
+        # versions are remade.
+        import hashlib
+        import pickle
+        import sys
+        from ._version import __version__
+        try:
+            data = pickle.dumps(self.deinterpolated, protocol=2)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # Objects that use lambda functions can't be pickled.  Then use the repr, but with
+            # all the array elements written out in full.
+            print_options = np.get_printoptions()
+            np.set_printoptions(threshold=sys.maxsize, precision=17)
+            try:
+                data = repr(self.deinterpolated).encode('utf-8')
+            finally:
+                np.set_printoptions(**print_options)
+        key = hashlib.md5(data)
+        key.update(np.asarray(self.waves, dtype=float).tobytes())
+        key.update(repr((float(self.oversample), __version__)).encode('utf-8'))
+        return key.hexdigest()
+
+    def _write_cache_file(self):
+        from ._pyfits import pyfits
+        from . import fits
+        hdu_list = pyfits.HDUList()
+        fits.writeCube(self.ims, hdu_list=hdu_list)
+        cols = [ pyfits.Column(name='wave', format='D', array=self.waves),
+                 pyfits.Column(name='stepk', format='D', array=self.stepk_vals),
+                 pyfits.Column(name='maxk', format='D', array=self.maxk_vals),
+                 pyfits.Column(name='flux', format='D', array=self.fluxes) ]
+        table = pyfits.BinTableHDU.from_columns(pyfits.ColDefs(cols))
+        table.header['GS_KEY'] = self._cache_key()
+        hdu_list.append(table)
+        fits.writeFile(self.cache_file, hdu_list)
+
+    def _read_cache_file(self):
+        # Returns whether the file was usable.
+        from ._pyfits import pyfits
+        from . import fits
+        with pyfits.open(self.cache_file) as hdu_list:
+            if len(hdu_list) < 2 or hdu_list[1].header.get('GS_KEY') != self._cache_key():
+                return False
+            data = hdu_list[1].data
+            self.stepk_vals = list(data['stepk'])
+            self.maxk_vals = list(data['maxk'])
+            self.fluxes = list(data['flux'])
+        self.ims = fits.readCube(self.cache_file)
+        return True
 
     @property
     def gsparams(self):
@@ -1285,6 +1533,8 @@ class InterpolatedChromaticObject(ChromaticObject):
         self._last_bp = bandpass
         if self.SED.dimensionless:
             raise GalSimSEDError("Can only draw ChromaticObjects with spectral SEDs.", self.SED)
+        if _use_chromatic_phot(kwargs):
+            return self._shootImage(bandpass, image, **kwargs)
 
         int_im = self._get_interp_image(bandpass, image=image, integrator=integrator, **kwargs)
         image = int_im.drawImage(image=image, **kwargs)
@@ -1702,7 +1952,8 @@ class ChromaticTransformation(ChromaticObject):
         self._last_bp = bandpass
         if self.SED.dimensionless:
             raise GalSimSEDError("Can only draw ChromaticObjects with spectral SEDs.", self.SED)
-        if isinstance(self.original, InterpolatedChromaticObject):
+        if (isinstance(self.original, InterpolatedChromaticObject) and
+                not kwargs.get('chromatic_phot', False)):
             # Pass self._flux_ratio, which *could* depend on wavelength, to _get_interp_image,
             # where it will be used to reweight the stored images.
             int_im = self.original._get_interp_image(bandpass, image=image, integrator=integrator,
@@ -2112,6 +2363,60 @@ class ChromaticConvolution(ChromaticObject):
 
         return InterpolatedImage(effective_prof_image, gsparams=gsparams)
 
+    @staticmethod
+    def _get_psf_basis(insep_obj, bandpass, iimult, waves):
+        # Draw insep_obj at each of the given wavelengths onto a common image, returning that
+        # image (to use as a template) and the stacked arrays.
+        _, prof0 = insep_obj._fiducial_profile(bandpass)
+        iiscale = prof0.nyquist_scale
+        if iimult is not None:
+            iiscale /= iimult
+        image = prof0.drawImage(scale=iiscale, method='no_pixel', dtype=float, setup_only=True)
+        image.setZero()
+        basis = np.empty((len(waves),) + image.array.shape)
+        for k, w in enumerate(waves):
+            prof = insep_obj.evaluateAtWavelength(w)
+            basis[k] = prof.drawImage(image=image.copy(), method='no_pixel').array
+        return image, basis
+
+    def _get_basis_effective_prof(self, insep_obj, seds, bandpass, iimult, integrator):
+        from .interpolatedimage import InterpolatedImage
+        # The same wavelengths are used for any SED, so with a string integrator, use the dense
+        # sampling of a ContinuousIntegrator rather than just the bandpass wave_list.  The cost
+        # of this is only incurred once per bandpass.
+        integrator = self._get_integrator(integrator, [])
+        rule = getattr(integrator, 'rule', None)
+        if rule not in integ._rule_weights:
+            raise GalSimIncompatibleValuesError(
+                "psf_basis requires an integrator using midptRule or trapzRule",
+                psf_basis=True, integrator=integrator)
+        waves = integrator.calculateWaves(bandpass)
+        if len(waves) < 2:
+            raise GalSimIncompatibleValuesError(
+                "Cannot use psf_basis when the Bandpass has fewer than 2 wavelengths to sample.",
+                psf_basis=True, integrator=integrator, bandpass=bandpass)
+        waves = np.asarray(waves, dtype=float)
+        image, basis = ChromaticConvolution._psf_basis_cache(insep_obj, bandpass, iimult,
+                                                             tuple(waves))
+        coeffs = integ._rule_weights[rule](waves) * bandpass(waves)
+        for sed in seds:
+            coeffs *= sed(waves)
+        image = image.copy()
+        image.array[:,:] = np.tensordot(coeffs, basis, axes=1)
+        return InterpolatedImage(image, gsparams=self._gsparams)
+
+    @staticmethod
+    def resize_psf_basis_cache(maxsize):
+        """ Resize the cache containing the images of inseparable profiles (generally PSFs) at
+        each wavelength, which are used by ChromaticConvolution.drawImage() with
+        `psf_basis=True`.
+
+        This is equivalent to `galsim.utilities.set_cache_size('psf_basis', maxsize)`.
+
+        @param maxsize  The new number of sets of images to cache.
+        """
+        utilities.set_cache_size('psf_basis', maxsize)
+
     @staticmethod
     def resize_effective_prof_cache(maxsize):
         """ Resize the cache containing effective profiles, (i.e., wavelength-integrated products
@@ -2151,7 +2456,8 @@ class ChromaticConvolution(ChromaticObject):
         return Convolve([obj.evaluateAtWavelength(wave) for obj in self.obj_list],
                         gsparams=self._gsparams, propagate_gsparams=self._propagate_gsparams)
 
-    def drawImage(self, bandpass, image=None, integrator='trapezoidal', iimult=None, **kwargs):
+    def drawImage(self, bandpass, image=None, integrator='trapezoidal', iimult=None,
+                  psf_basis=False, **kwargs):
         """Optimized draw method for the ChromaticConvolution class.
 
         Works by finding sums of profiles which include separable portions, which can then be
@@ -2165,6 +2471,11 @@ class ChromaticConvolution(ChromaticObject):
         cache more often.  The default cache size is 10, but may be resized using the
         `ChromaticConvolution.resize_effective_prof_cache()` method.
 
+        When drawing many galaxies with different SEDs through the same PSF, the `psf_basis`
+        option avoids redoing the wavelength integration for each one.  Instead, the PSF is drawn
+        at each of the integrator's wavelengths only once per bandpass (these are also cached),
+        and each galaxy's effective PSF is a weighted sum of these images.
+
         @param bandpass         A Bandpass object representing the filter against which to
                                 integrate.
         @param image            Optionally, the Image to draw onto.  (See GSObject.drawImage()
@@ -2178,6 +2489,16 @@ class ChromaticConvolution(ChromaticObject):
                                 trapezoidal integration rule automatically.]
         @param iimult           Oversample any intermediate InterpolatedImages created to hold
                                 effective profiles by this amount. [default: None]
+        @param psf_basis        Whether to draw the inseparable part of the profile (usually the
+                                PSF) at the integrator's wavelengths once for each bandpass, and
+                                then form the effective profile for each SED as a weighted sum of
+                                these images.  This is much faster when drawing many galaxies
+                                with different SEDs but the same PSF.  The wavelengths cannot
+                                depend on the SED, so a string `integrator` here means a
+                                ContinuousIntegrator with its default 250 wavelengths.
+                                Otherwise, it must be an integrator using midptRule or trapzRule,
+                                whose wavelengths should also sample the SEDs well enough.
+                                [default: False]
         @param **kwargs         For all other kwarg options, see GSObject.drawImage()
 
         @returns the drawn Image.
@@ -2187,6 +2508,8 @@ class ChromaticConvolution(ChromaticObject):
         self._last_bp = bandpass
         if self.SED.dimensionless:
             raise GalSimSEDError("Can only draw ChromaticObjects with spectral SEDs.", self.SED)
+        if _use_chromatic_phot(kwargs):
+            return self._shootImage(bandpass, image, **kwargs)
         # `ChromaticObject.drawImage()` can just as efficiently handle separable cases.
         if self.separable:
             image = ChromaticObject.drawImage(self, bandpass, image=image, **kwargs)
@@ -2243,7 +2566,8 @@ class ChromaticConvolution(ChromaticObject):
                 tmpobj = ChromaticConvolution(tmplist)
                 add_to_image = kwargs.pop('add_to_image', False)
                 image = tmpobj.drawImage(bandpass, image=image, integrator=integrator,
-                                         iimult=iimult, add_to_image=add_to_image, **kwargs)
+                                         iimult=iimult, psf_basis=psf_basis,
+                                         add_to_image=add_to_image, **kwargs)
                 # Now add in the rest of the summands in turn, i.e., B and C
                 for summand in obj.obj_list[1:]:
                     tmplist = list(self.obj_list)
@@ -2253,7 +2577,8 @@ class ChromaticConvolution(ChromaticObject):
                     # add to previously started image
                     _remove_setup_kwargs(kwargs)
                     image = tmpobj.drawImage(bandpass, image=image, integrator=integrator,
-                                             iimult=iimult, add_to_image=True, **kwargs)
+                                             iimult=iimult, psf_basis=psf_basis,
+                                             add_to_image=True, **kwargs)
                 # Return the image here, breaking the loop early.  If there are two ChromaticSum
                 # instances in obj_list, then the above procedure will repeat in the recursion,
                 # effectively distributing the multiplication over both sums.
@@ -2284,17 +2609,25 @@ class ChromaticConvolution(ChromaticObject):
                                  propagate_gsparams=self._propagate_gsparams)
 
         sep_profs = []
+        seds = []
         for obj in self.obj_list:
             if not obj.separable:
                 continue
             wave0, prof0 = obj._fiducial_profile(bandpass)
             sep_profs.append(prof0 / obj.SED(wave0))
-            insep_obj *= obj.SED
+            seds.append(obj.SED)
 
-        # Collapse inseparable profiles and chromatic normalizations into one effective profile
-        # Note that at this point, insep_obj.SED should *not* be None.
-        effective_prof = ChromaticConvolution._effective_prof_cache(
-                insep_obj, bandpass, iimult, integrator, self._gsparams)
+        if psf_basis:
+            # Integrate the SEDs against the cached images of insep_obj at each wavelength.
+            effective_prof = self._get_basis_effective_prof(insep_obj, seds, bandpass, iimult,
+                                                            integrator)
+        else:
+            for sed in seds:
+                insep_obj *= sed
+            # Collapse inseparable profiles and chromatic normalizations into one effective
+            # profile.  Note that at this point, insep_obj.SED should *not* be None.
+            effective_prof = ChromaticConvolution._effective_prof_cache(
+                    insep_obj, bandpass, iimult, integrator, self._gsparams)
 
         # append effective profile to separable profiles (which should all be GSObjects)
         sep_profs.append(effective_prof)
@@ -2324,6 +2657,8 @@ class ChromaticConvolution(ChromaticObject):
 
 ChromaticConvolution._effective_prof_cache = utilities.LRU_Cache(
     ChromaticConvolution._get_effective_prof, maxsize=10)
+ChromaticConvolution._psf_basis_cache = utilities.LRU_Cache(
+    ChromaticConvolution._get_psf_basis, maxsize=10)
 
 
 class ChromaticDeconvolution(ChromaticObject):
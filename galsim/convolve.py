@@ -22,8 +22,8 @@ from . import _galsim
 from .gsparams import GSParams
 from .gsobject import GSObject
 from .chromatic import ChromaticObject, ChromaticConvolution
-from .utilities import lazy_property, doc_inherit
-from .errors import GalSimError, convert_cpp_errors, galsim_warn
+from .utilities import lazy_property, doc_inherit, LRU_Cache
+from .errors import GalSimError, GalSimValueError, convert_cpp_errors, galsim_warn
 
 def Convolve(*args, **kwargs):
     """A function for convolving 2 or more GSObject or ChromaticObject instances.
@@ -107,6 +107,11 @@ class Convolution(GSObject):
     @param propagate_gsparams   Whether to propagate gsparams to each of the components.  This
                                 is normally a good idea, but there may be use cases where one
                                 would not want to do this. [default: True]
+    @param cache_kimage     A list of the objects being convolved whose k-space images should be
+                            cached when drawing with the FFT method.  This is useful when many
+                            galaxies are convolved by the same PSF, since the PSF's k-space image
+                            then only needs to be computed once for each FFT grid.  See below for
+                            more details. [default: ()]
 
     Note: if `gsparams` is unspecified (or None), then the Convolution instance will use the most
     restrictive combination of parameters from each of the component objects. Normally, this means
@@ -120,6 +125,27 @@ class Convolution(GSObject):
     However, if you want to keep the existing gsparams of the component objects, then you may
     set `propagate_gsparams=False`.
 
+    Caching k-space images
+    ----------------------
+
+    When drawing many objects convolved with the same PSF, most of the k-space calculation for
+    each FFT is spent evaluating the PSF on what is usually the same grid of k values every time.
+    You can tell the Convolution to keep the drawn k-space images of some of its components in a
+    cache by listing them in the `cache_kimage` parameter:
+
+        >>> psf = galsim.Kolmogorov(fwhm=0.7)
+        >>> for gal in galaxies:
+        ...     final = galsim.Convolve([gal, psf], cache_kimage=[psf])
+        ...     final.drawImage(image=stamp)
+
+    The cache is keyed by the (transformed) component, the bounds and scale of the k-space image,
+    and the data type, so only the non-cached components are evaluated for each new object that
+    is drawn on the same size stamp with the same pixel scale.  The least recently used images are
+    discarded once there are more than 10 of them.  (This number may be changed with
+    `galsim.utilities.set_cache_size('convolution_kimage', maxsize)`.)  The cached components do
+    not affect the profile being represented, so they are not considered in comparisons between
+    Convolution instances.
+
     Methods
     -------
 
@@ -147,6 +173,7 @@ class Convolution(GSObject):
         real_space = kwargs.pop("real_space", None)
         gsparams = kwargs.pop("gsparams", None)
         self._propagate_gsparams = kwargs.pop('propagate_gsparams', True)
+        cache_kimage = kwargs.pop('cache_kimage', ())
 
         # Make sure there is nothing left in the dict.
         if kwargs:
@@ -201,6 +228,13 @@ class Convolution(GSObject):
         # can be inspected later if necessary.
         self._real_space = bool(real_space)
 
+        # Figure out which components should have their k-space images cached.
+        for obj in cache_kimage:
+            if obj not in args:
+                raise GalSimValueError("Objects in cache_kimage must be among the objects being "
+                                       "convolved", cache_kimage)
+        self._cache_kimage = tuple(obj in cache_kimage for obj in args)
+
         # Figure out what gsparams to use
         if gsparams is None:
             # If none is given, take the most restrictive combination from the obj_list.
@@ -221,12 +255,38 @@ class Convolution(GSObject):
     @property
     def real_space(self): return self._real_space
 
+    @property
+    def cache_kimage(self):
+        "The components whose k-space images are cached when drawing."
+        return [ obj for obj, c in zip(self.obj_list, self._cache_kimage) if c ]
+
     @lazy_property
     def _sbp(self):
+        if self._gaussian_sum is not None:
+            return self._gaussian_sum._sbp
         SBList = [obj._sbp for obj in self.obj_list]
         with convert_cpp_errors():
             return _galsim.SBConvolve(SBList, self._real_space, self.gsparams._gsp)
 
+    # The maximum number of Gaussians in the analytic form of a convolution of Gaussian mixtures.
+    # Beyond this, evaluating all the components at each pixel is slower than the FFT.
+    _max_gaussian_components = 20
+
+    @lazy_property
+    def _gaussian_sum(self):
+        # If all the components are Gaussians, or sums or transformations of them, then the
+        # convolution is just a sum of Gaussians, which we can evaluate directly in real space.
+        from .gaussian import _gaussian_mixture, _make_gaussian_sum
+        if len(self.obj_list) == 1:
+            return None
+        mixture = _gaussian_mixture(self)
+        if mixture is None or len(mixture) > self._max_gaussian_components:
+            return None
+        if any(np.linalg.det(cov) <= 0. for cov, flux, offset in mixture):
+            # Probably from convolving DeltaFunctions.
+            return None
+        return _make_gaussian_sum(mixture, gsparams=self.gsparams)
+
     @lazy_property
     def _noise(self):
         # If one of the objects has a noise attribute, then we convolve it by the others.
@@ -252,11 +312,75 @@ class Convolution(GSObject):
         if gsparams is self.gsparams: return self
         from copy import copy
         ret = copy(self)
+        ret.__dict__.pop('_scratch', None)
         ret._gsparams = GSParams.check(gsparams)
         if self._propagate_gsparams:
             ret._obj_list = [ obj.withGSParams(gsparams) for obj in self.obj_list ]
         return ret
 
+    @doc_inherit
+    def compile(self):
+        from .transform import Transformation
+        from .position import PositionD
+        from .sum import Sum
+        from .gaussian import _gaussian_mixture, _make_gaussian
+        if self.real_space or any(self._cache_kimage): return self
+        if any(obj.noise is not None for obj in self.obj_list): return self
+
+        # Shifts and flux ratios commute with convolution, so pull them out to apply once.
+        # Then flatten any nested convolutions.
+        offset = PositionD(0.,0.)
+        flux_ratio = 1.
+        new_list = []
+        for obj in self.obj_list:
+            obj = obj.compile()
+            if isinstance(obj, Transformation) and (obj.offset != PositionD(0.,0.) or
+                                                    obj.flux_ratio != 1.):
+                offset += obj.offset
+                flux_ratio *= obj.flux_ratio
+                obj = Transformation(obj.original, obj.jac, gsparams=obj.gsparams).compile()
+            if type(obj) is Convolution and not obj.real_space and not obj.cache_kimage:
+                new_list.extend(obj.obj_list)
+            else:
+                new_list.append(obj)
+
+        # The convolution of Gaussians is a Gaussian whose covariance is the sum of theirs.
+        # And if another component is a sum of Gaussians (e.g. a double Gaussian PSF), convolving
+        # each of those with this Gaussian removes one term from the Convolution.
+        mixtures = [ _gaussian_mixture(obj) for obj in new_list ]
+        # Except for DeltaFunctions, which we leave alone, since they have zero size.
+        mixtures = [ None if m is not None and len(m) == 1 and not np.any(m[0][0]) else m
+                     for m in mixtures ]
+        singles = [ m[0] for m in mixtures if m is not None and len(m) == 1 ]
+        multiples = [ k for k, m in enumerate(mixtures) if m is not None and len(m) > 1 ]
+        if len(singles) > 1 or (len(singles) == 1 and len(multiples) > 0):
+            cov = np.sum([ m[0] for m in singles ], axis=0)
+            flux = np.prod([ m[1] for m in singles ])
+            cen = np.sum([ m[2] for m in singles ], axis=0)
+            if len(multiples) > 0:
+                k = multiples[0]
+                new_list[k] = Sum([ _make_gaussian(c + cov, f * flux, o + cen, self.gsparams)
+                                    for c, f, o in mixtures[k] ], gsparams=self.gsparams)
+                mixtures[k] = None
+                merged = []
+            else:
+                merged = [ _make_gaussian(cov, flux, cen, self.gsparams) ]
+            new_list = [ obj for obj, m in zip(new_list, mixtures)
+                         if m is None or len(m) > 1 ] + merged
+
+        if offset == PositionD(0.,0.) and flux_ratio == 1. and len(new_list) == len(self.obj_list):
+            if all(new is old for new, old in zip(new_list, self.obj_list)):
+                return self
+
+        if len(new_list) == 1:
+            ret = new_list[0]
+        else:
+            ret = Convolution(new_list, real_space=False, gsparams=self.gsparams,
+                              propagate_gsparams=self._propagate_gsparams)
+        if offset != PositionD(0.,0.) or flux_ratio != 1.:
+            ret = Transformation(ret, offset=offset, flux_ratio=flux_ratio, gsparams=self.gsparams)
+        return ret
+
     def __eq__(self, other):
         return (isinstance(other, Convolution) and
                 self.obj_list == other.obj_list and
@@ -284,6 +408,10 @@ class Convolution(GSObject):
         for obj in self.obj_list:
             obj._prepareDraw()
 
+    def _prepareShoot(self, rng):
+        for obj in self.obj_list:
+            obj._prepareShoot(rng)
+
     @lazy_property
     def _maxk(self):
         maxk_list = [obj.maxk for obj in self.obj_list]
@@ -310,6 +438,8 @@ class Convolution(GSObject):
     def _is_analytic_x(self):
         if len(self.obj_list) == 1:
             return self.obj_list[0].is_analytic_x
+        elif self._gaussian_sum is not None:
+            return True
         elif self.real_space and len(self.obj_list) == 2:
             ax_list = [obj.is_analytic_x for obj in self.obj_list]
             return bool(np.all(ax_list))
@@ -365,6 +495,8 @@ class Convolution(GSObject):
         # For non-Gaussians, this procedure will tend to produce an over-estimate of the
         # true maximum SB.  Non-Gaussian profiles tend to have peakier parts which get smoothed
         # more than the Gaussian does.  So this is likely to be too high, which is acceptable.
+        if self._gaussian_sum is not None:
+            return self._gaussian_sum.max_sb
         area_list = [obj.flux / obj.max_sb for obj in self.obj_list]
         return self.flux / np.sum(area_list)
 
@@ -372,6 +504,8 @@ class Convolution(GSObject):
     def _xValue(self, pos):
         if len(self.obj_list) == 1:
             return self.obj_list[0]._xValue(pos)
+        elif self._gaussian_sum is not None:
+            return self._gaussian_sum._xValue(pos)
         elif len(self.obj_list) == 2:
             try:
                 return self._sbp.xValue(pos._p)
@@ -390,6 +524,8 @@ class Convolution(GSObject):
     def _drawReal(self, image):
         if len(self.obj_list) == 1:
             self.obj_list[0]._drawReal(image)
+        elif self._gaussian_sum is not None:
+            self._gaussian_sum._drawReal(image)
         elif len(self.obj_list) == 2:
             try:
                 self._sbp.draw(image._image, image.scale)
@@ -401,35 +537,88 @@ class Convolution(GSObject):
 
     @doc_inherit
     def _shoot(self, photons, rng):
-        from .photon_array import PhotonArray
-
         self.obj_list[0]._shoot(photons, rng)
         # It may be necessary to shuffle when convolving because we do not have a
         # gaurantee that the convolvee's photons are uncorrelated, e.g., they might
         # both have their negative ones at the end.
         # However, this decision is now made by the convolve method.
         for obj in self.obj_list[1:]:
-            p1 = PhotonArray(len(photons))
+            p1 = self._get_scratch_photons(len(photons))
             obj._shoot(p1, rng)
             photons.convolve(p1, rng)
 
+    def _get_scratch_photons(self, n_photons):
+        # A PhotonArray of size n_photons to shoot the other components into.  It is kept
+        # between calls, so drawPhot doesn't need to make a new one for each component in each
+        # batch.  drawPhot may shoot the same object in several threads at once, so each thread
+        # gets its own.
+        import threading
+        from .photon_array import PhotonArray
+        scratch = self.__dict__.get('_scratch')
+        if scratch is None:
+            scratch = self._scratch = threading.local()
+        photons = getattr(scratch, 'photons', None)
+        if photons is None or len(photons) != n_photons:
+            photons = scratch.photons = PhotonArray(n_photons)
+        else:
+            # Reset the correlated flag, which the previous call may have set.
+            photons.setCorrelated(False)
+        return photons
+
     @doc_inherit
     def _drawKImage(self, image):
-        self.obj_list[0]._drawKImage(image)
-        if len(self.obj_list) > 1:
-            im1 = image.copy()
-            for obj in self.obj_list[1:]:
+        if self._cache_kimage[0]:
+            image.copyFrom(self._get_kimage(self.obj_list[0], image))
+        else:
+            self.obj_list[0]._drawKImage(image)
+        im1 = None
+        for obj, cached in zip(self.obj_list[1:], self._cache_kimage[1:]):
+            if cached:
+                image *= self._get_kimage(obj, image)
+            else:
+                if im1 is None:
+                    im1 = image.copy()
                 obj._drawKImage(im1)
                 image *= im1
 
+    def _get_kimage(self, obj, image):
+        # Get the cached k-space image of obj matching the bounds, scale and dtype of image.
+        # Note: the returned image is shared, so it must not be modified.
+        return Convolution._kimage_cache(obj, image.bounds, image.scale, image.dtype)
+
+    @staticmethod
+    def _draw_cached_kimage(obj, bounds, scale, dtype):
+        from .image import Image
+        kimage = Image(bounds=bounds, dtype=dtype, scale=scale)
+        obj._drawKImage(kimage)
+        return kimage
+
+    def _componentsToImage(self, local_wcs, flux_ratio, offset):
+        # Equivalent to local_wcs.profileToImage(self, flux_ratio=flux_ratio, offset=offset),
+        # but applying the transformation to each component separately.  Since the conversion
+        # to image coordinates preserves flux, it distributes over the convolution, with the
+        # flux_ratio and offset going with the first component that is not cached.  Doing it this
+        # way means that the components with cached k-space images are the same from one
+        # drawImage call to the next.
+        i0 = self._cache_kimage.index(False) if False in self._cache_kimage else 0
+        obj_list = [ local_wcs.profileToImage(obj, flux_ratio=flux_ratio, offset=offset)
+                     if i == i0 else local_wcs.profileToImage(obj)
+                     for i, obj in enumerate(self.obj_list) ]
+        cache_kimage = [ obj for obj, c in zip(obj_list, self._cache_kimage) if c ]
+        return Convolution(obj_list, real_space=self.real_space, gsparams=self.gsparams,
+                           propagate_gsparams=self._propagate_gsparams, cache_kimage=cache_kimage)
+
     def __getstate__(self):
         d = self.__dict__.copy()
         d.pop('_sbp',None)
+        d.pop('_gaussian_sum',None)
+        d.pop('_scratch',None)
         return d
 
     def __setstate__(self, d):
         self.__dict__ = d
 
+Convolution._kimage_cache = LRU_Cache(Convolution._draw_cached_kimage, maxsize=10)
 
 
 def Deconvolve(obj, gsparams=None, propagate_gsparams=True):
@@ -530,6 +719,15 @@ class Deconvolution(GSObject):
             ret._orig_obj = self._orig_obj.withGSParams(gsparams)
         return ret
 
+    @doc_inherit
+    def compile(self):
+        orig_obj = self.orig_obj.compile()
+        if orig_obj is self.orig_obj:
+            return self
+        else:
+            return Deconvolution(orig_obj, gsparams=self.gsparams,
+                                 propagate_gsparams=self._propagate_gsparams)
+
     def __eq__(self, other):
         return (isinstance(other, Deconvolution) and
                 self.orig_obj == other.orig_obj and
@@ -711,6 +909,7 @@ class AutoConvolution(Convolution):
         # Save the construction parameters (as they are at this point) as attributes so they
         # can be inspected later if necessary.
         self._real_space = bool(real_space)
+        self._cache_kimage = (False, False)
         self._gsparams = GSParams.check(gsparams, obj.gsparams)
         self._propagate_gsparams = propagate_gsparams
         if self._propagate_gsparams:
@@ -723,6 +922,8 @@ class AutoConvolution(Convolution):
 
     @lazy_property
     def _sbp(self):
+        if self._gaussian_sum is not None:
+            return self._gaussian_sum._sbp
         with convert_cpp_errors():
             return _galsim.SBAutoConvolve(self.orig_obj._sbp, self._real_space, self.gsparams._gsp)
 
@@ -742,12 +943,22 @@ class AutoConvolution(Convolution):
         if gsparams is self.gsparams: return self
         from copy import copy
         ret = copy(self)
+        ret.__dict__.pop('_scratch', None)
         ret._gsparams = GSParams.check(gsparams)
         if self._propagate_gsparams:
             ret._orig_obj = self._orig_obj.withGSParams(gsparams)
         ret._obj_list = [ret._orig_obj, ret._orig_obj]
         return ret
 
+    @doc_inherit
+    def compile(self):
+        orig_obj = self.orig_obj.compile()
+        if orig_obj is self.orig_obj:
+            return self
+        else:
+            return AutoConvolution(orig_obj, real_space=self.real_space, gsparams=self.gsparams,
+                                   propagate_gsparams=self._propagate_gsparams)
+
     def __eq__(self, other):
         return (isinstance(other, AutoConvolution) and
                 self.orig_obj == other.orig_obj and
@@ -775,9 +986,8 @@ class AutoConvolution(Convolution):
 
     @doc_inherit
     def _shoot(self, photons, rng):
-        from .photon_array import PhotonArray
         self.orig_obj._shoot(photons, rng)
-        photons2 = PhotonArray(len(photons))
+        photons2 = self._get_scratch_photons(len(photons))
         self.orig_obj._shoot(photons2, rng)
         photons.convolve(photons2, rng)
 
@@ -872,6 +1082,7 @@ class AutoCorrelation(Convolution):
         # Save the construction parameters (as they are at this point) as attributes so they
         # can be inspected later if necessary.
         self._real_space = bool(real_space)
+        self._cache_kimage = (False, False)
         self._gsparams = GSParams.check(gsparams, obj.gsparams)
         self._propagate_gsparams = propagate_gsparams
         if self._propagate_gsparams:
@@ -884,6 +1095,8 @@ class AutoCorrelation(Convolution):
 
     @lazy_property
     def _sbp(self):
+        if self._gaussian_sum is not None:
+            return self._gaussian_sum._sbp
         with convert_cpp_errors():
             return _galsim.SBAutoCorrelate(self.orig_obj._sbp, self._real_space, self.gsparams._gsp)
 
@@ -903,12 +1116,22 @@ class AutoCorrelation(Convolution):
         if gsparams is self.gsparams: return self
         from copy import copy
         ret = copy(self)
+        ret.__dict__.pop('_scratch', None)
         ret._gsparams = GSParams.check(gsparams)
         if self._propagate_gsparams:
             ret._orig_obj = self._orig_obj.withGSParams(gsparams)
         ret._obj_list = [ret._orig_obj, ret._orig_obj.transform(-1,0,0,-1)]
         return ret
 
+    @doc_inherit
+    def compile(self):
+        orig_obj = self.orig_obj.compile()
+        if orig_obj is self.orig_obj:
+            return self
+        else:
+            return AutoCorrelation(orig_obj, real_space=self.real_space, gsparams=self.gsparams,
+                                   propagate_gsparams=self._propagate_gsparams)
+
     def __eq__(self, other):
         return (isinstance(other, AutoCorrelation) and
                 self.orig_obj == other.orig_obj and
@@ -936,9 +1159,8 @@ class AutoCorrelation(Convolution):
 
     @doc_inherit
     def _shoot(self, photons, rng):
-        from .photon_array import PhotonArray
         self.orig_obj._shoot(photons, rng)
-        photons2 = PhotonArray(len(photons))
+        photons2 = self._get_scratch_photons(len(photons))
         self.orig_obj._shoot(photons2, rng)
 
         # Flip sign of (x, y) in one of the results
@@ -131,6 +131,15 @@ class FourierSqrtProfile(GSObject):
             ret._orig_obj = self._orig_obj.withGSParams(gsparams)
         return ret
 
+    @doc_inherit
+    def compile(self):
+        orig_obj = self.orig_obj.compile()
+        if orig_obj is self.orig_obj:
+            return self
+        else:
+            return FourierSqrtProfile(orig_obj, gsparams=self.gsparams,
+                                      propagate_gsparams=self._propagate_gsparams)
+
     def __eq__(self, other):
         return (isinstance(other, FourierSqrtProfile) and
                 self.orig_obj == other.orig_obj and
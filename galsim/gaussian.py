@@ -22,7 +22,7 @@ import math
 from . import _galsim
 from .gsobject import GSObject
 from .gsparams import GSParams
-from .utilities import lazy_property, doc_inherit
+from .utilities import lazy_property, doc_inherit, LRU_Cache
 from .position import PositionD
 from .errors import GalSimIncompatibleValuesError, convert_cpp_errors
 
@@ -185,3 +185,190 @@ class Gaussian(GSObject):
     @doc_inherit
     def _drawKImage(self, image):
         self._sbp.drawK(image._image, image.scale)
+
+
+def _gaussian_mixture(obj):
+    """If `obj` is a Gaussian (or DeltaFunction), or a Sum, Convolution or Transformation of them
+    (in any combination), return a list of tuples (cov, flux, offset), giving the covariance
+    matrix, flux and centroid (as a numpy array) of each Gaussian component.  Otherwise return
+    None.
+    """
+    from .sum import Sum
+    from .convolve import Convolution
+    from .transform import Transformation
+    from .deltafunction import DeltaFunction
+    if isinstance(obj, Gaussian):
+        return [ (np.identity(2) * obj.sigma**2, obj.flux, np.zeros(2)) ]
+    elif isinstance(obj, DeltaFunction):
+        # The limit of a Gaussian with zero size.
+        return [ (np.zeros((2,2)), obj.flux, np.zeros(2)) ]
+    elif isinstance(obj, Transformation):
+        mixture = _gaussian_mixture(obj.original)
+        if mixture is None: return None
+        jac = obj._jac
+        flux_scaling = obj._flux_ratio * abs(jac[0,0]*jac[1,1] - jac[0,1]*jac[1,0])
+        shift = np.array([obj._offset.x, obj._offset.y])
+        return [ (jac.dot(cov).dot(jac.T), flux * flux_scaling, jac.dot(offset) + shift)
+                 for cov, flux, offset in mixture ]
+    elif isinstance(obj, Sum):
+        mixture = []
+        for o in obj.obj_list:
+            m = _gaussian_mixture(o)
+            if m is None: return None
+            mixture.extend(m)
+        return mixture
+    elif isinstance(obj, Convolution):
+        # Check for components that are obviously not Gaussian before doing any real work.
+        # Most commonly, this is the pixel when drawing.
+        if not all(isinstance(o, (Gaussian, DeltaFunction, Sum, Convolution, Transformation))
+                   for o in obj.obj_list):
+            return None
+        # The convolution of two Gaussians is a Gaussian with the sum of their covariances,
+        # fluxes multiplied and centroids added.  Convolutions distribute over the sums.
+        mixture = [ (np.zeros((2,2)), 1., np.zeros(2)) ]
+        for o in obj.obj_list:
+            m = _gaussian_mixture(o)
+            if m is None: return None
+            mixture = [ (cov1 + cov2, flux1 * flux2, offset1 + offset2)
+                        for cov1, flux1, offset1 in mixture
+                        for cov2, flux2, offset2 in m ]
+        return mixture
+    else:
+        return None
+
+def _make_gaussian(cov, flux, offset=(0.,0.), gsparams=None):
+    """Make the simplest profile with the given covariance matrix, flux and centroid, which is a
+    Gaussian, possibly transformed by a unit-determinant jacobian and/or shifted.
+    """
+    from .transform import Transformation
+    offset = PositionD(offset[0], offset[1])
+    det = cov[0,0] * cov[1,1] - cov[0,1] * cov[1,0]
+    sigma = det**0.25
+    trace = cov[0,0] + cov[1,1]
+    ret = Gaussian(sigma=sigma, flux=flux, gsparams=gsparams)
+    if abs(cov[0,1]) <= 1.e-14 * trace and abs(cov[0,0] - cov[1,1]) <= 1.e-14 * trace:
+        jac = np.identity(2)
+    else:
+        # The symmetric square root of cov is (cov + sqrt(det) I) / sqrt(trace + 2 sqrt(det)).
+        # Divide this by sigma to get a unit determinant, so the Transformation preserves flux.
+        s = math.sqrt(det)
+        jac = (cov + s * np.identity(2)) / (math.sqrt(trace + 2.*s) * sigma)
+    if np.array_equal(jac, np.identity(2)) and offset == PositionD(0.,0.):
+        return ret
+    else:
+        return Transformation(ret, jac, offset, gsparams=gsparams)
+
+def _make_gaussian_sum(mixture, gsparams=None):
+    """Make the profile given by a list of (cov, flux, offset) tuples, as returned by
+    _gaussian_mixture.
+    """
+    from .sum import Sum
+    obj_list = [ _make_gaussian(cov, flux, offset, gsparams=gsparams)
+                 for cov, flux, offset in mixture ]
+    if len(obj_list) == 1:
+        return obj_list[0]
+    else:
+        return Sum(obj_list, gsparams=gsparams)
+
+# numpy doesn't have an erf function, but the 1d calculations below only need O(N) of them.
+_erf = np.vectorize(math.erf, otypes=[float])
+
+def _pixel_quadrature(sigma, abserr):
+    """Return the Gauss-Legendre nodes and weights, relative to the center of a unit pixel, that
+    integrate a Gaussian with the given sigma (in pixels) over each pixel with an absolute error
+    less than abserr times the flux.  Returns None if more than 8 nodes would be needed, which
+    happens when the Gaussian is significantly undersampled.
+    """
+    x0 = np.linspace(0., 3.*sigma + 1., 61)
+    a = 1. / (math.sqrt(2.) * sigma)
+    exact = 0.5 * (_erf((x0+0.5)*a) - _erf((x0-0.5)*a))
+    for n in range(2, 9):
+        nodes, weights = np.polynomial.legendre.leggauss(n)
+        nodes /= 2.
+        weights /= 2.
+        approx = np.exp(-((x0[:,np.newaxis] + nodes)*a)**2).dot(weights) * a / math.sqrt(math.pi)
+        if np.max(np.abs(approx - exact)) < abserr:
+            return nodes, weights
+    return None
+
+_pixel_quadrature_cache = LRU_Cache(_pixel_quadrature, maxsize=100)
+
+def _get_pixel_quadrature(cov_list, gsparams):
+    """Return the quadrature nodes and weights to use for integrating Gaussians with the given
+    covariance matrices (in image coordinates) over the pixels, or None if they are too
+    undersampled.
+    """
+    # The profile in any direction is at least as wide as the smallest principal axis of any
+    # component, so that determines the accuracy of the quadrature.
+    sigma = min(0.5*(cov[0,0]+cov[1,1]) - math.hypot(0.5*(cov[0,0]-cov[1,1]), cov[0,1])
+                for cov in cov_list)
+    sigma = math.sqrt(max(sigma, 0.))
+    # Round sigma down to make the cache useful.  Above about 10 pixels, 2 nodes is plenty.
+    sigma = min(math.floor(sigma * 20.) / 20., 10.)
+    if sigma <= 0.:
+        return None
+    return _pixel_quadrature_cache(sigma, gsparams.realspace_abserr)
+
+def _get_pixel_gaussian_draw(mixture, gsparams):
+    """Check whether a mixture of Gaussians (in image coordinates) convolved by the unit pixel
+    can be drawn using _draw_pixel_gaussians.  If so, return (n, draw), where n is the number of
+    evaluations needed for each pixel and draw(image, add_to_image) draws it.  Otherwise return
+    None.
+    """
+    if any(cov[0,0] <= 0. or cov[1,1] <= 0. for cov, flux, offset in mixture):
+        return None
+    # Components with no shear are separable, so they only need one multiplication per pixel.
+    # The others need a 2d quadrature.
+    sheared = [ cov for cov, flux, offset in mixture if cov[0,1] != 0. ]
+    if len(sheared) > 0:
+        quad = _get_pixel_quadrature(sheared, gsparams)
+        if quad is None:
+            return None
+        nodes, weights = quad
+    else:
+        nodes = weights = ()
+    n = len(mixture) - len(sheared) + len(sheared) * len(nodes)**2
+    draw = lambda image, add_to_image: _draw_pixel_gaussians(mixture, image, nodes, weights,
+                                                             add_to_image)
+    return n, draw
+
+def _draw_pixel_gaussians(mixture, image, nodes, weights, add_to_image=False):
+    """Draw a mixture of Gaussians (in image coordinates), convolved by the unit pixel, onto image,
+    which should have a pixel scale of 1.
+
+    Gaussians with no shear are separable, so their pixel integrals are the outer product of the
+    exact 1d integrals over each row and column.  For the others, the pixel integrals use the
+    given quadrature (from _get_pixel_quadrature) in both directions, so each one needs a
+    vectorized exp for each quadrature point.
+
+    @returns the total flux drawn.
+    """
+    xedges = np.arange(image.xmin, image.xmax+2, dtype=float) - 0.5
+    yedges = np.arange(image.ymin, image.ymax+2, dtype=float) - 0.5
+    values = np.zeros(image.array.shape)
+    fine = None
+    for cov, flux, offset in mixture:
+        if cov[0,1] == 0.:
+            fx = np.diff(_erf((xedges - offset[0]) / math.sqrt(2.*cov[0,0])))
+            fy = np.diff(_erf((yedges - offset[1]) / math.sqrt(2.*cov[1,1])))
+            values += np.outer(0.25 * flux * fy, fx)
+            continue
+        if fine is None:
+            n = len(nodes)
+            x = (xedges[:-1,np.newaxis] + 0.5 + nodes).ravel()
+            y = (yedges[:-1,np.newaxis] + 0.5 + nodes).ravel()
+            fine = np.zeros((len(y), len(x)))
+        det = cov[0,0] * cov[1,1] - cov[0,1] * cov[1,0]
+        dx = x - offset[0]
+        dy = y - offset[1]
+        arg = (cov[1,1]/det * dx**2)[np.newaxis,:] + (cov[0,0]/det * dy**2)[:,np.newaxis]
+        arg -= np.outer(2.*cov[0,1]/det * dy, dx)
+        fine += flux / (2.*np.pi*math.sqrt(det)) * np.exp(-0.5 * arg)
+    if fine is not None:
+        fine = fine.reshape(values.shape[0], n, values.shape[1], n)
+        values += np.tensordot(np.tensordot(fine, weights, axes=(3,0)), weights, axes=(1,0))
+    if add_to_image:
+        image.array[:,:] = image.array + values
+    else:
+        image.array[:,:] = values
+    return values.sum(dtype=float)
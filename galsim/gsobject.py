@@ -58,7 +58,7 @@ import math
 from . import _galsim
 from .gsparams import GSParams
 from .position import PositionD, PositionI
-from .utilities import lazy_property, parse_pos_args
+from .utilities import lazy_property, parse_pos_args, LRU_Cache
 from .errors import GalSimError, GalSimRangeError, GalSimValueError, GalSimIncompatibleValuesError
 from .errors import GalSimFFTSizeError, GalSimNotImplementedError, convert_cpp_errors, galsim_warn
 
@@ -752,6 +752,35 @@ class GSObject(object):
         ret._gsparams = GSParams.check(gsparams)
         return ret
 
+    def compile(self):
+        """Create a version of the current object that is mathematically equivalent, but whose
+        internal structure is faster to evaluate.
+
+        Compound objects built up from many Sum, Convolution and Transformation steps (e.g. a
+        bulge + disk + knots galaxy with each component sheared and shifted, convolved with a
+        multi-component PSF) can often be rearranged into a simpler form.  This function:
+
+            - removes Transformations that do nothing,
+            - transforms the components of a Sum that share the same Transformation together,
+              rather than each one separately,
+            - applies the shifts and flux ratios of the components of a Convolution once to the
+              whole Convolution, rather than to each component,
+            - combines all the (possibly transformed) Gaussian components of a Convolution into a
+              single Gaussian.
+
+        The returned object has the same profile as the original (up to floating point rounding),
+        but it is generally not == to the original.  Objects with a `noise` attribute, real-space
+        convolutions, and convolutions that use `cache_kimage` are not rearranged.
+
+        Compiling a typical galaxy model takes about as long as drawing it onto a small image, so
+        this is most useful for objects that will be drawn many times or onto large images.
+
+        @returns the compiled object, which may be the current object if there is nothing to do.
+        """
+        # Note to developers: objects that wrap other objects should override this in order
+        # to compile their components.
+        return self
+
     def withFlux(self, flux):
         """Create a version of the current object with a different flux.
 
@@ -1179,7 +1208,7 @@ class GSObject(object):
                   method='auto', area=1., exptime=1., gain=1., add_to_image=False,
                   use_true_center=True, offset=None, n_photons=0., rng=None, max_extra_noise=0.,
                   poisson_flux=None, sensor=None, surface_ops=(), n_subsample=3, maxN=None,
-                  save_photons=False, setup_only=False):
+                  save_photons=False, setup_only=False, flux_frac=None, nthreads=1):
         """Draws an Image of the object.
 
         The drawImage() method is used to draw an Image of the current object using one of several
@@ -1238,7 +1267,22 @@ class GSObject(object):
                         if the object being rendered is simple (no convolution) and has hard edges
                         (e.g. a Box or a truncated Moffat or Sersic), then it will switch to
                         'real_space', since that is often both faster and more accurate in these
-                        cases (due to ringing in Fourier space).
+                        cases (due to ringing in Fourier space).  Also, for other simple objects,
+                        it will estimate the relative cost of the two methods, and use
+                        'real_space' if that is expected to be faster.  This is typically the case
+                        for small stamps of profiles with a large maxk/stepk ratio (e.g. a
+                        high-index Sersic), for which the FFT would need a large k-space image
+                        compared to the number of pixels in the stamp.  Gaussians, and sums,
+                        convolutions and transformations of them, and Boxes that are not sheared
+                        or rotated, can also be integrated over the pixels directly, which is used
+                        if it is expected to be cheaper than the FFT.  This is reported as
+                        'analytic'.  Profiles that are separable in x and y are integrated exactly
+                        as the outer product of 1d integrals over the rows and columns, and
+                        sheared Gaussians using Gauss-Legendre quadrature.  The method that was
+                        used is given in the returned image's `draw_method` attribute, and the
+                        estimated costs (in arbitrary units) in its `draw_cost` attribute.  (For
+                        the other methods, `draw_method` is the given method, and `draw_cost` is
+                        None.)
 
             'fft'       The integration of the light within each pixel is mathematically equivalent
                         to convolving by the pixel profile (a Pixel object) and sampling the result
@@ -1306,6 +1350,21 @@ class GSObject(object):
         use to reduce the level of these artifacts, in particular `folding_threshold` may be
         helpful if you see such artifacts in your images.
 
+        Using a smaller image and FFT size
+        ----------------------------------
+
+        The automatic image size and the size of the FFT used for drawing are normally based on
+        the object's stepk value, which is often quite conservative, especially for faint or
+        compact objects.  If you set the `flux_frac` parameter, then both of these are instead
+        based on the radius that encloses this fraction of the object's flux, which is often
+        substantially smaller.  This radius is calculated by drawing the object once (in a
+        manner similar to calculateHLR) and is then cached, so it is most useful when drawing the
+        same profile many times (e.g. with different offsets or into different images).
+
+        When using this option, the returned image will have an attribute `truncation_error`,
+        which gives the fraction of the object's flux that was not included in the image, i.e.
+        `1 - image.added_flux / obj.flux`.
+
         Setting the offset
         ------------------
 
@@ -1511,6 +1570,11 @@ class GSObject(object):
                             is set up correctly.  This is used internally by GalSim, but there
                             may be cases where the user will want the same functionality.
                             [default: False]
+        @param flux_frac    If given, choose the automatic image size and the FFT size to enclose
+                            this fraction of the flux, rather than using the stepk-based sizes.
+                            See above for details. [default: None]
+        @param nthreads     The number of threads to use for photon shooting.  See drawPhot for
+                            details.  Only valid if method is 'phot'.  [default: 1]
 
         @returns the drawn Image.
         """
@@ -1519,6 +1583,7 @@ class GSObject(object):
         from .box import Pixel
         from .wcs import PixelScale
         from .photon_array import PhotonArray
+        from .bounds import _BoundsI
 
         # Check that image is sane
         if image is not None and not isinstance(image, Image):
@@ -1574,11 +1639,18 @@ class GSObject(object):
                 raise GalSimIncompatibleValuesError(
                     "save_photons is only valid for method='phot'",
                     method=method, sensor=sensor, save_photons=save_photons)
+            if nthreads != 1:
+                raise GalSimIncompatibleValuesError(
+                    "nthreads is only relevant for method='phot'",
+                    method=method, sensor=sensor, nthreads=nthreads)
         else:
             # If we want to save photons, it doesn't make sense to limit the number per shoot call.
             if save_photons and maxN is not None:
                 raise GalSimIncompatibleValuesError(
                     "Setting maxN is incompatible with save_photons=True")
+            if save_photons and nthreads != 1:
+                raise GalSimIncompatibleValuesError(
+                    "Setting nthreads is incompatible with save_photons=True")
 
         # Do any delayed computation needed by fft or real_space drawing.
         if method != 'phot':
@@ -1606,11 +1678,30 @@ class GSObject(object):
         if gain != 1 and method != 'phot' and sensor is None:
             flux_scale /= gain
 
+        # If requested, figure out the size needed to enclose flux_frac of the flux (in pixels),
+        # allowing for the offset and the pixel response.
+        if flux_frac is not None:
+            wrap_size = self.getGoodImageSize(local_wcs.minLinearScale(), flux_frac)
+            wrap_size += 2 * int(math.ceil(max(abs(offset.x), abs(offset.y)))) + 2
+            if image is None and nx is None and ny is None and bounds is None:
+                nx = ny = wrap_size
+                new_bounds = self._get_new_bounds(image, nx, ny, bounds)
+            elif image is not None and not image.bounds.isDefined() and not add_to_image:
+                image.resize(_BoundsI(1, wrap_size, 1, wrap_size))
+                new_bounds = image.bounds
+        else:
+            wrap_size = None
+
         # Determine the offset, and possibly fix the centering for even-sized images
         offset = self._adjust_offset(new_bounds, offset, use_true_center)
 
         # Convert the profile in world coordinates to the profile in image coordinates:
-        prof = local_wcs.profileToImage(self, flux_ratio=flux_scale, offset=offset)
+        if isinstance(self, Convolution) and any(self._cache_kimage):
+            # Convert the components separately, so the ones with cached k-space images stay
+            # the same from one call to the next.
+            prof = self._componentsToImage(local_wcs, flux_scale, offset)
+        else:
+            prof = local_wcs.profileToImage(self, flux_ratio=flux_scale, offset=offset)
         if offset != PositionD(0,0):
             local_wcs = local_wcs.withOrigin(offset)
 
@@ -1639,11 +1730,35 @@ class GSObject(object):
         imview._shift(-image.center)  # equiv. to setCenter(0,0), but faster
         imview.wcs = PixelScale(1.0)
         orig_center = image.center  # Save the original center to pass to sensor.accumulate
+
+        # For method='auto', switch to real-space integration if that is expected to be cheaper.
+        # Some simple profiles can also be integrated over the pixels analytically.
+        # (If the fft is too large, keep it, so the usual GalSimFFTSizeError is raised.)
+        # Other methods are used as given, with no cost estimate.
+        analytic_draw = None
+        image.draw_method = method
+        image.draw_cost = None
+        if method == 'auto':
+            if sensor is None:
+                analytic_draw = _get_analytic_pixel_draw(prof_no_pixel, self.gsparams)
+            draw_cost = prof._estimateDrawCost(prof_no_pixel, imview, wrap_size, analytic_draw)
+            if ('analytic' in draw_cost and (prof.real_space or draw_cost['fft'] < np.inf)
+                    and draw_cost['analytic'] <= min(draw_cost.values())):
+                image.draw_method = 'analytic'
+            else:
+                analytic_draw = None
+                if (sensor is None and 'real_space' in draw_cost and not prof.real_space
+                        and draw_cost['real_space'] < draw_cost['fft'] < np.inf):
+                    prof = Convolve(prof_no_pixel, Pixel(scale=1.0, gsparams=self.gsparams),
+                                    real_space=True, gsparams=self.gsparams)
+                image.draw_method = 'real_space' if prof.real_space else 'fft'
+            image.draw_cost = draw_cost
+
         if method == 'phot':
             added_photons, photons = prof.drawPhot(imview, gain, add_to_image,
                                                    n_photons, rng, max_extra_noise, poisson_flux,
                                                    sensor, surface_ops, maxN,
-                                                   orig_center, local_wcs)
+                                                   orig_center, local_wcs, nthreads)
         else:
             # If not using phot, but doing sensor, then make a copy.
             if sensor is not None:
@@ -1669,14 +1784,18 @@ class GSObject(object):
                             gsparams=self.gsparams)
                 add = False
                 if not add_to_image: imview.setZero()
+                if wrap_size is not None:
+                    wrap_size *= n_subsample
             else:
                 draw_image = imview
                 add = add_to_image
 
-            if prof.is_analytic_x:
+            if analytic_draw is not None:
+                added_photons = analytic_draw[1](draw_image, add)
+            elif prof.is_analytic_x:
                 added_photons = prof.drawReal(draw_image, add)
             else:
-                added_photons = prof.drawFFT(draw_image, add)
+                added_photons = prof.drawFFT(draw_image, add, wrap_size)
 
             if sensor is not None:
                 photons = PhotonArray.makeFromImage(draw_image, rng=rng)
@@ -1691,6 +1810,8 @@ class GSObject(object):
                     imview.array[:,:] += im1.array.astype(imview.dtype, copy=False)
 
         image.added_flux = added_photons / flux_scale
+        if flux_frac is not None and self.flux != 0.:
+            image.truncation_error = 1. - image.added_flux / self.flux
         if save_photons:
             image.photons = photons
 
@@ -1747,22 +1868,42 @@ class GSObject(object):
         """
         raise NotImplementedError("%s does not implement drawReal"%self.__class__.__name__)
 
-    def getGoodImageSize(self, pixel_scale):
+    def getGoodImageSize(self, pixel_scale, flux_frac=None):
         """Return a good size to use for drawing this profile.
 
         The size will be large enough to cover most of the flux of the object.  Specifically,
         at least (1-gsparams.folding_threshold) (i.e. 99.5% by default) of the flux should fall
         in the image.
 
+        The default calculation is based on the profile's stepk value, which is often rather
+        conservative, especially for compact objects.  If you provide a `flux_frac` value, then
+        the size is instead based on the radius that actually encloses this fraction of the
+        object's flux.  This radius is estimated by drawing the profile once (much like
+        calculateHLR does), and the resulting enclosed flux curve is cached, so subsequent calls
+        for the same profile are fast.
+
         Also, the returned size is always an even number, which is usually desired in practice.
         Of course, if you prefer an odd-sized image, you can add 1 to the result.
 
         @param pixel_scale      The desired pixel scale of the image to be built.
+        @param flux_frac        If given, the fraction of the flux that should be enclosed within
+                                the image. [default: None, which means to use the size implied by
+                                stepk]
 
         @returns N, a good (linear) size of an image on which to draw this object.
         """
-        # Start with a good size from stepk and the pixel scale
-        Nd = 2. * math.pi / (pixel_scale * self.stepk)
+        if flux_frac is not None:
+            if not (0. < flux_frac < 1.):
+                raise GalSimRangeError("Invalid flux_frac", flux_frac, 0., 1.)
+            r = self._getFluxRadius(flux_frac)
+        else:
+            r = None
+
+        if r is not None:
+            Nd = 2. * r / pixel_scale
+        else:
+            # Start with a good size from stepk and the pixel scale
+            Nd = 2. * math.pi / (pixel_scale * self.stepk)
 
         # Make it an integer
         # (Some slop to keep from getting extra pixels due to roundoff errors in calculations.)
@@ -1772,23 +1913,73 @@ class GSObject(object):
         N = 2 * ((N+1) // 2)
         return N
 
-    def drawFFT_makeKImage(self, image):
-        """
-        This is a helper routine for drawFFT that just makes the (blank) k-space image
-        onto which the profile will be drawn.  This can be useful if you want to break
-        up the calculation into parts for extra efficiency.  E.g. save the k-space image of
-        the PSF so drawing many models of the galaxy with the given PSF profile can avoid
-        drawing the PSF each time.
-
-        @param image        The Image onto which to place the flux.
-
-        @returns (kimage, wrap_size), where wrap_size is either the size of kimage or smaller if
-                                      the result should be wrapped before doing the inverse fft.
-        """
-        from .bounds import _BoundsI
-        from .image import ImageCD, ImageCF
+    def _getFluxRadius(self, flux_frac):
+        # Return the radius (from the origin, not the centroid) beyond which there is less than
+        # 1-flux_frac of the flux, or None if it is not possible to tell from the cached image.
+        r, frac = GSObject._enclosed_flux_cache(self)
+        # frac isn't necessarily monotonic if the profile has negative regions, so use the
+        # radius just outside of the last point that is still below flux_frac.
+        below = np.nonzero(frac < flux_frac)[0]
+        if len(below) == 0:
+            return r[0]
+        elif below[-1] == len(r)-1:
+            return None
+        else:
+            return r[below[-1]+1]
+
+    @staticmethod
+    def _calculate_enclosed_flux(obj):
+        # Tabulate the fraction of the flux enclosed as a function of radius from the origin.
+        # This uses the conservative stepk-based size for the image, but this is only done once
+        # per profile.
+        scale = obj.nyquist_scale
+        im = obj.drawImage(scale=scale, method='no_pixel', dtype=float)
+        x, y = np.meshgrid(np.arange(im.xmin, im.xmax+1) - im.true_center.x,
+                           np.arange(im.ymin, im.ymax+1) - im.true_center.y)
+        rsq = (x*x + y*y).ravel()
+        index = np.argsort(rsq)
+        # Use the outer edge of each pixel for the radius.
+        r = (np.sqrt(rsq[index]) + 0.5*math.sqrt(2.)) * scale
+        frac = np.cumsum(im.array.ravel()[index]) / obj.flux
+        return r, frac
+
+    # Rough relative costs used by drawImage(method='auto') to decide whether to use real-space
+    # integration over the pixels or an FFT.  The units are approximately the time taken for one
+    # kValue evaluation of a typical profile.
+    _fft_cost_overhead = 1.e4           # Fixed cost of doing an FFT at all.
+    _fft_cost_per_nlogn = 0.2           # Cost per N^2 log2(N) for the FFT itself.
+    _real_space_cost_per_pixel = 1.e3   # Cost of the real-space integral for each pixel.
+    _analytic_cost_overhead = 5.e3      # Fixed cost of analytic integrals over the pixels.
+    _analytic_cost_per_eval = 1.        # Cost of each profile evaluation in a pixel integral.
+
+    def _estimateDrawCost(self, prof_no_pixel, image, wrap_size=None, analytic_draw=None):
+        # Estimate the costs of drawing prof_no_pixel convolved by the pixel (i.e. self) onto
+        # image with either an FFT or real-space integration.  If prof_no_pixel can be integrated
+        # over the pixels analytically, analytic_draw is the return value of
+        # _get_analytic_pixel_draw.  Returns a dict with the cost of each method that is possible.
+        cost = {}
+        N, Nk = self._getFFTSizes(image, wrap_size)
+        if Nk > self.gsparams.maximum_fft_size:
+            cost['fft'] = np.inf
+        else:
+            cost['fft'] = (Nk * (Nk//2+1) + self._fft_cost_per_nlogn * N * N * math.log(N, 2)
+                           + self._fft_cost_overhead)
+        # Real-space integration is only practical for simple analytic profiles.
+        if _is_simple_analytic_x(prof_no_pixel):
+            cost['real_space'] = self._real_space_cost_per_pixel * image.array.size
+        if analytic_draw is not None:
+            cost['analytic'] = (self._analytic_cost_overhead + self._analytic_cost_per_eval
+                                * analytic_draw[0] * image.array.size)
+        return cost
+
+    def _getFFTSizes(self, image, wrap_size=None):
+        # Return the size N of the real-space image to use for the FFT and the size Nk of the
+        # k-space image to draw (which may be larger if it needs to be wrapped).
         # Start with what this profile thinks a good size would be given the image's pixel scale.
-        N = self.getGoodImageSize(image.scale)
+        if wrap_size is None:
+            N = self.getGoodImageSize(image.scale)
+        else:
+            N = wrap_size
 
         # We must make something big enough to cover the target image size:
         image_N = max(np.max(np.abs((image.bounds._getinitargs()))) * 2,
@@ -1809,10 +2000,32 @@ class GSObject(object):
         else:
             # There will be aliasing.  Make a larger image and then wrap it.
             Nk = int(np.ceil(maxk/dk)) * 2
+        return N, Nk
+
+    def drawFFT_makeKImage(self, image, wrap_size=None):
+        """
+        This is a helper routine for drawFFT that just makes the (blank) k-space image
+        onto which the profile will be drawn.  This can be useful if you want to break
+        up the calculation into parts for extra efficiency.  E.g. save the k-space image of
+        the PSF so drawing many models of the galaxy with the given PSF profile can avoid
+        drawing the PSF each time.
 
+        @param image        The Image onto which to place the flux.
+        @param wrap_size    If given, the minimum size of the region (in pixels) to use for the
+                            periodic real-space image, rather than the size implied by stepk.
+                            [default: None]
+
+        @returns (kimage, wrap_size), where wrap_size is either the size of kimage or smaller if
+                                      the result should be wrapped before doing the inverse fft.
+        """
+        from .bounds import _BoundsI
+        from .image import ImageCD, ImageCF
+        N, Nk = self._getFFTSizes(image, wrap_size)
         if Nk > self.gsparams.maximum_fft_size:
             raise GalSimFFTSizeError("drawFFT requires an FFT that is too large.", Nk)
 
+        dk = 2.*np.pi / (N * image.scale)
+
         bounds = _BoundsI(0,Nk//2,-Nk//2,Nk//2)
         if image.dtype in (np.complex128, np.float64, np.int32, np.uint32):
             kimage = ImageCD(bounds=bounds, scale=dk)
@@ -1859,7 +2072,7 @@ class GSObject(object):
         added_photons = temp.array.sum(dtype=float)
         return added_photons
 
-    def drawFFT(self, image, add_to_image=False):
+    def drawFFT(self, image, add_to_image=False, wrap_size=None):
         """
         Draw this profile into an Image by computing the k-space image and performing an FFT.
 
@@ -1880,13 +2093,16 @@ class GSObject(object):
         @param image        The Image onto which to place the flux. [required]
         @param add_to_image Whether to add flux to the existing image rather than clear out
                             anything in the image before drawing. [default: False]
+        @param wrap_size    If given, the minimum size of the region (in pixels) to use for the
+                            periodic real-space image, rather than the size implied by stepk.
+                            [default: None]
 
         @returns The total flux drawn inside the image bounds.
         """
         if image.wcs is None or not image.wcs.isPixelScale():
             raise GalSimValueError("drawPhot requires an image with a PixelScale wcs", image)
 
-        kimage, wrap_size = self.drawFFT_makeKImage(image)
+        kimage, wrap_size = self.drawFFT_makeKImage(image, wrap_size)
         self._drawKImage(kimage)
         return self.drawFFT_finish(image, kimage, wrap_size, add_to_image)
 
@@ -2011,7 +2227,7 @@ class GSObject(object):
     def drawPhot(self, image, gain=1., add_to_image=False,
                  n_photons=0, rng=None, max_extra_noise=0., poisson_flux=None,
                  sensor=None, surface_ops=(), maxN=None, orig_center=PositionI(0,0),
-                 local_wcs=None):
+                 local_wcs=None, nthreads=1):
         """
         Draw this profile into an Image by shooting photons.
 
@@ -2072,6 +2288,17 @@ class GSObject(object):
         @param orig_center  The position of the image center in the original image coordinates.
                             [default: (0,0)]
         @param local_wcs    The local wcs in the original image. [default: None]
+        @param nthreads     The number of threads to use for shooting the photons.  The photons
+                            are split evenly among the threads, each of which uses its own
+                            random number generator seeded from `rng`, so the result is
+                            reproducible for a given `rng` and `nthreads`, although it is different
+                            from the result with a different number of threads.  Each thread
+                            accumulates its photons on its own image, and these are added to the
+                            final image at the end.  The `maxN` limit applies to each thread
+                            separately.  Using `nthreads <= 0` means to use the number of cpus.
+                            Multiple threads are only used with the base Sensor class and no
+                            `surface_ops`; otherwise, the photons are shot in a single thread.
+                            [default: 1]
 
         @returns (nphotons, photons) where
             nphotons is the total flux of photons that landed inside the image bounds, and
@@ -2115,21 +2342,25 @@ class GSObject(object):
 
         if not add_to_image: image.setZero()
 
+        if nthreads <= 0:
+            from multiprocessing import cpu_count
+            nthreads = cpu_count()
+        nthreads = min(nthreads, Ntot)
+        if nthreads > 1 and type(sensor) is Sensor and len(surface_ops) == 0:
+            return self._drawPhotThreads(image, Ntot, g, rng, orig_center, maxN, nthreads)
+
         # Nleft is the number of photons remaining to shoot.
         Nleft = Ntot
         photons = None  # Just in case Nleft is already 0.
+        im1 = None
         resume = False
         while Nleft > 0:
             # Shoot at most maxN at a time
             thisN = min(maxN, Nleft)
 
-            try:
-                photons = self.shoot(thisN, rng)
-            except (GalSimError, NotImplementedError) as e:
-                raise GalSimNotImplementedError(
-                        "Unable to draw this GSObject with photon shooting.  Perhaps it "
-                        "is a Deconvolve or is a compound including one or more "
-                        "Deconvolve objects.\nOriginal error: %r"%(e))
+            # Reuse the same PhotonArray for each iteration, so the memory used doesn't grow
+            # with the total number of photons.  Only the last one might need to be smaller.
+            photons = self._shootInto(photons, thisN, rng)
 
             if g != 1. or thisN != Ntot:
                 photons.scaleFlux(g * thisN / Ntot)
@@ -2145,7 +2376,10 @@ class GSObject(object):
                 resume = True  # Resume from this point if there are any further iterations.
             else:
                 # Need a temporary
-                im1 = ImageD(bounds=image.bounds)
+                if im1 is None:
+                    im1 = ImageD(bounds=image.bounds)
+                else:
+                    im1.setZero()
                 added_flux += sensor.accumulate(photons, im1, orig_center)
                 image.array[:,:] += im1.array.astype(image.dtype, copy=False)
 
@@ -2153,6 +2387,84 @@ class GSObject(object):
 
         return added_flux, photons
 
+    def _shootInto(self, photons, n_photons, rng):
+        # Shoot n_photons photons into the given PhotonArray if it has the right size, else into
+        # a new one, and return it.  This lets drawPhot reuse the same arrays for each batch.
+        from .random import BaseDeviate
+        from .photon_array import PhotonArray
+        if photons is None or len(photons) != n_photons:
+            photons = PhotonArray(n_photons)
+        else:
+            # Reset the correlated flag, which the previous batch may have set.
+            photons.setCorrelated(False)
+        if rng is None:
+            rng = BaseDeviate()
+        try:
+            self._shoot(photons, rng)
+        except (GalSimError, NotImplementedError) as e:
+            raise GalSimNotImplementedError(
+                    "Unable to draw this GSObject with photon shooting.  Perhaps it "
+                    "is a Deconvolve or is a compound including one or more "
+                    "Deconvolve objects.\nOriginal error: %r"%(e))
+        return photons
+
+    def _drawPhotThreads(self, image, Ntot, g, rng, orig_center, maxN, nthreads):
+        # The multi-threaded version of the main loop in drawPhot.
+        import threading
+        from .random import BaseDeviate
+        from .image import ImageD
+        from .sensor import Sensor
+
+        if rng is None:
+            rng = BaseDeviate()
+        # Each thread gets its own rng, seeded from the original one, so the result doesn't
+        # depend on the order in which the threads run.
+        seeds = [rng.raw() + 1 for i in range(nthreads+1)]
+
+        # Do any lazy setup of the profile now, so the threads don't all try to do it at once.
+        try:
+            self._prepareShoot(BaseDeviate(seeds[-1]))
+        except (GalSimError, NotImplementedError) as e:
+            raise GalSimNotImplementedError(
+                    "Unable to draw this GSObject with photon shooting.  Perhaps it "
+                    "is a Deconvolve or is a compound including one or more "
+                    "Deconvolve objects.\nOriginal error: %r"%(e))
+
+        sensor = Sensor()
+        images = [ImageD(bounds=image.bounds) for i in range(nthreads)]
+        added_flux = [0.] * nthreads
+        photons = [None] * nthreads
+        errors = []
+
+        def shoot_thread(i, N):
+            try:
+                thread_rng = BaseDeviate(seeds[i])
+                Nleft = N
+                while Nleft > 0:
+                    thisN = min(maxN, Nleft)
+                    photons[i] = self._shootInto(photons[i], thisN, thread_rng)
+                    photons[i].scaleFlux(g * thisN / Ntot)
+                    if image.scale != 1.:
+                        photons[i].scaleXY(1./image.scale)
+                    added_flux[i] += sensor.accumulate(photons[i], images[i], orig_center)
+                    Nleft -= thisN
+            except Exception as e:
+                errors.append(e)
+
+        N_list = [Ntot // nthreads + (1 if i < Ntot % nthreads else 0) for i in range(nthreads)]
+        threads = [threading.Thread(target=shoot_thread, args=(i, N_list[i]))
+                   for i in range(nthreads)]
+        for t in threads: t.start()
+        for t in threads: t.join()
+        if errors:
+            raise errors[0]
+
+        # Add up the results in a fixed order, so the result is reproducible.
+        total = images[0].array
+        for im in images[1:]:
+            total += im.array
+        image.array[:,:] += total.astype(image.dtype, copy=False)
+        return sum(added_flux), photons[-1]
 
     def shoot(self, n_photons, rng=None):
         """Shoot photons into a PhotonArray.
@@ -2186,6 +2498,12 @@ class GSObject(object):
         """
         raise NotImplementedError("%s does not implement shoot"%self.__class__.__name__)
 
+    def _prepareShoot(self, rng):
+        # Do any work that is done lazily the first time photons are shot, so subsequent calls
+        # to shoot may be run in parallel threads.  Shooting a single photon is enough for
+        # most profiles.
+        self.shoot(1, rng)
+
     def drawKImage(self, image=None, nx=None, ny=None, bounds=None, scale=None,
                    add_to_image=False, recenter=True, setup_only=False):
         """Draws the k-space (complex) Image of the object, with bounds optionally set by input
@@ -2313,3 +2631,42 @@ class GSObject(object):
 
     # Derived classes should define the __eq__ function
     def __ne__(self, other): return not self.__eq__(other)
+
+def _is_simple_analytic_x(obj):
+    # Check whether obj has an xValue that is cheap enough to integrate over each pixel.
+    # Convolutions would need nested integrals, which are far too slow, and interpolated images
+    # (including the PSFs that are built from them) need many evaluations of the interpolant for
+    # each xValue.
+    from .convolve import Convolution
+    from .transform import Transformation
+    from .sum import Sum
+    from .interpolatedimage import InterpolatedImage
+    from .phase_psf import PhaseScreenPSF, OpticalPSF
+    if isinstance(obj, Transformation):
+        return _is_simple_analytic_x(obj.original)
+    elif isinstance(obj, Sum):
+        return all(_is_simple_analytic_x(o) for o in obj.obj_list)
+    elif isinstance(obj, Convolution):
+        return len(obj.obj_list) == 1 and _is_simple_analytic_x(obj.obj_list[0])
+    elif isinstance(obj, (InterpolatedImage, PhaseScreenPSF, OpticalPSF)):
+        return False
+    else:
+        return obj.is_analytic_x
+
+def _get_analytic_pixel_draw(obj, gsparams):
+    # Check whether obj (in image coordinates) convolved by the unit pixel can be drawn with
+    # analytic integrals over the pixels.  Currently this is possible for mixtures of Gaussians
+    # and for Boxes that are not sheared or rotated.  If so, return (n, draw), where n is the
+    # number of evaluations needed for each pixel, and draw(image, add_to_image) draws it,
+    # returning the flux drawn.  Otherwise return None.
+    from .gaussian import _gaussian_mixture, _get_pixel_gaussian_draw
+    from .box import _box_list, _draw_pixel_boxes
+    mixture = _gaussian_mixture(obj)
+    if mixture is not None:
+        return _get_pixel_gaussian_draw(mixture, gsparams)
+    boxes = _box_list(obj)
+    if boxes is not None:
+        return len(boxes), lambda image, add_to_image: _draw_pixel_boxes(boxes, image, add_to_image)
+    return None
+
+GSObject._enclosed_flux_cache = LRU_Cache(GSObject._calculate_enclosed_flux, maxsize=100)
@@ -444,14 +444,24 @@ class Image(object):
 
     # Pickling almost works out of the box, but numpy arrays lose their non-writeable flag
     # when pickled, so make sure to set it to preserve const Images.
+    # Also, make sure the array is contiguous, so that with pickle protocol 5, numpy can pass it
+    # as an out-of-band buffer rather than copying it into the pickle data.  Views into a larger
+    # image (e.g. InterpolatedImage._pad_image) are not contiguous, so these need a (compact) copy.
     def __getstate__(self):
-        return self.__dict__, self.isconst
+        d = self.__dict__
+        if not (self._array.flags.c_contiguous or self._array.flags.f_contiguous):
+            d = d.copy()
+            d['_array'] = np.ascontiguousarray(self._array)
+        return d, self.isconst
 
     def __setstate__(self, args):
         d, isconst = args
         self.__dict__ = d
         if isconst:
             self._array.flags.writeable = False
+        elif not self._array.flags.writeable:
+            # An out-of-band buffer may be read-only, in which case we need our own copy.
+            self._array = self._array.copy()
 
     # Read-only attributes:
     @property
@@ -141,6 +141,46 @@ def trapzRule(f, xs):
     return result
 
 
+def midptWeights(xs):
+    """Weights for each sample used by midptRule.
+
+    @param xs  Locations at which to evaluate the integrand.
+
+    @returns  A numpy array w such that midptRule(f, xs) = sum(w[i] * f(xs[i])).
+    """
+    if len(xs) < 2:
+        raise GalSimValueError("Not enough points for midptRule integration", xs)
+    xs = np.asarray(xs, dtype=float)
+    w = np.empty(len(xs))
+    w[0] = xs[1]-xs[0]
+    w[1:-1] = 0.5*(xs[2:]-xs[:-2])
+    w[-1] = xs[-1]-xs[-2]
+    return w
+
+
+def trapzWeights(xs):
+    """Weights for each sample used by trapzRule.
+
+    @param xs  Locations at which to evaluate the integrand.
+
+    @returns  A numpy array w such that trapzRule(f, xs) = sum(w[i] * f(xs[i])).
+    """
+    if len(xs) < 2:
+        raise GalSimValueError("Not enough points for trapzRule integration", xs)
+    xs = np.asarray(xs, dtype=float)
+    w = np.empty(len(xs))
+    w[0] = 0.5*(xs[1]-xs[0])
+    w[1:-1] = 0.5*(xs[2:]-xs[:-2])
+    w[-1] = 0.5*(xs[-1]-xs[-2])
+    return w
+
+
+# The rules that are linear combinations of the samples with known weights.  ImageIntegrators
+# using these rules accumulate the weighted draws into a single image rather than drawing each
+# wavelength onto its own image.
+_rule_weights = { midptRule : midptWeights, trapzRule : trapzWeights }
+
+
 class ImageIntegrator(object):
     def __init__(self):
         raise NotImplementedError("Must instantiate subclass of ImageIntegrator")
@@ -150,6 +190,15 @@ class ImageIntegrator(object):
     # 2) an function attribute `.rule` which takes an integrand function as its first
     #    argument, and a list of evaluation wavelengths as its second argument, and returns
     #    an approximation to the integral.  (E.g., the function midptRule above)
+    #
+    # If the rule is midptRule or trapzRule, the integral is a weighted sum of the samples, so
+    # __call__ draws each one directly into the result with add_to_image=True, which keeps the
+    # memory use independent of the number of wavelengths.  Other rules get a new image for each
+    # wavelength.
+    #
+    # With these rules, subclasses may also set `.single_fft = True` to draw the weighted sum of
+    # the profiles at all the wavelengths as a single Sum.
+    single_fft = False
 
     def __call__(self, evaluateAtWavelength, bandpass, image, drawImageKwargs, doK=False):
         """
@@ -167,6 +216,14 @@ class ImageIntegrator(object):
         self.last_n_eval = len(waves)
         drawImageKwargs.pop('add_to_image', None) # Make sure add_to_image isn't in kwargs
 
+        if self.rule in _rule_weights:
+            weights = _rule_weights[self.rule](waves)
+            if self.single_fft:
+                return self._drawSum(evaluateAtWavelength, bandpass, image, drawImageKwargs, doK,
+                                     waves, weights)
+            return self._accumulate(evaluateAtWavelength, bandpass, image, drawImageKwargs, doK,
+                                    waves, weights)
+
         def integrand(w):
             prof = evaluateAtWavelength(w) * bandpass(w)
             if not doK:
@@ -175,6 +232,52 @@ class ImageIntegrator(object):
                 return prof.drawKImage(image=image.copy(), **drawImageKwargs)
         return self.rule(integrand, waves)
 
+    def _drawSum(self, evaluateAtWavelength, bandpass, image, drawImageKwargs, doK,
+                 waves, weights):
+        # The integral is linear in the profile, so draw sum_i weights[i] * bandpass(waves[i]) *
+        # prof(waves[i]) as one profile.  When drawn with an FFT, the Sum accumulates the
+        # k-space values of all the components on a single grid, which is sized according to the
+        # smallest stepk and the largest maxk of any of them, and then does one inverse FFT.
+        from .sum import Sum
+        profs = [ evaluateAtWavelength(w) * (bandpass(w) * weight)
+                  for w, weight in zip(waves, weights) if bandpass(w) * weight != 0. ]
+        if len(profs) == 0:
+            profs = [ evaluateAtWavelength(waves[0]) * 0. ]
+        prof = Sum(profs)
+        result = image.copy()
+        if not doK:
+            return prof.drawImage(image=result, **drawImageKwargs)
+        else:
+            return prof.drawKImage(image=result, **drawImageKwargs)
+
+    def _accumulate(self, evaluateAtWavelength, bandpass, image, drawImageKwargs, doK,
+                    waves, weights):
+        # Draw sum_i weights[i] * bandpass(waves[i]) * prof(waves[i]) into a single image.
+        result = image.copy()
+        result.setZero()
+        if doK:
+            # drawKImage can only add to an image centered at (0,0), so do the recentering here.
+            if drawImageKwargs.pop('recenter', True):
+                result.setCenter(0,0)
+            for w, weight in zip(waves, weights):
+                prof = evaluateAtWavelength(w) * (bandpass(w) * weight)
+                prof.drawKImage(image=result, add_to_image=True, recenter=False,
+                                **drawImageKwargs)
+        elif drawImageKwargs.get('method', None) == 'phot':
+            # The photon shooting noise depends on the flux, so scale the image rather than the
+            # profile.  This needs one more image to draw each wavelength into, which is reused.
+            temp = image.copy()
+            for w, weight in zip(waves, weights):
+                prof = evaluateAtWavelength(w) * bandpass(w)
+                prof.drawImage(image=temp, **drawImageKwargs)
+                temp *= weight
+                result += temp
+        else:
+            for w, weight in zip(waves, weights):
+                prof = evaluateAtWavelength(w) * (bandpass(w) * weight)
+                prof.drawImage(image=result, add_to_image=True, **drawImageKwargs)
+        return result
+
 
 class SampleIntegrator(ImageIntegrator):
     """Create a chromatic surface brightness profile integrator, which will integrate over
@@ -188,9 +291,20 @@ class SampleIntegrator(ImageIntegrator):
                         brightness samples.  Options include:
                             galsim.integ.midptRule  --  Use the midpoint integration rule
                             galsim.integ.trapzRule  --  Use the trapezoidal integration rule
+    @param single_fft   Whether to draw the weighted sum of the monochromatic profiles at all the
+                        wavelengths as a single profile.  When drawn with an FFT, this accumulates
+                        the Fourier transforms of all of them onto a common k-space grid and then
+                        does only one inverse FFT, rather than one for each wavelength.  This is
+                        usually much faster for profiles like ChromaticAtmosphere or
+                        ChromaticOpticalPSF, but the FFT size is then set by the largest of all the
+                        wavelengths.  Requires `rule` to be midptRule or trapzRule.
+                        [default: False]
     """
-    def __init__(self, rule):
+    def __init__(self, rule, single_fft=False):
+        if single_fft and rule not in _rule_weights:
+            raise GalSimValueError("single_fft requires either midptRule or trapzRule", rule)
         self.rule = rule
+        self.single_fft = single_fft
 
     def calculateWaves(self, bandpass):
         return bandpass.wave_list
@@ -218,11 +332,22 @@ class ContinuousIntegrator(ImageIntegrator):
                         generally sampled, (only the midpoint between each integration limit and
                         its nearest interior point is sampled), thus `use_endpoints` should be
                         set to False in this case.  [default: True]
+    @param single_fft   Whether to draw the weighted sum of the monochromatic profiles at all the
+                        wavelengths as a single profile.  When drawn with an FFT, this accumulates
+                        the Fourier transforms of all of them onto a common k-space grid and then
+                        does only one inverse FFT, rather than one for each wavelength.  This is
+                        usually much faster for profiles like ChromaticAtmosphere or
+                        ChromaticOpticalPSF, but the FFT size is then set by the largest of all the
+                        wavelengths.  Requires `rule` to be midptRule or trapzRule.
+                        [default: False]
     """
-    def __init__(self, rule, N=250, use_endpoints=True):
+    def __init__(self, rule, N=250, use_endpoints=True, single_fft=False):
+        if single_fft and rule not in _rule_weights:
+            raise GalSimValueError("single_fft requires either midptRule or trapzRule", rule)
         self.rule = rule
         self.N = N
         self.use_endpoints = use_endpoints
+        self.single_fft = single_fft
 
     def calculateWaves(self, bandpass):
         h = (bandpass.red_limit*1.0 - bandpass.blue_limit)/self.N
@@ -230,3 +355,110 @@ class ContinuousIntegrator(ImageIntegrator):
             return [bandpass.blue_limit + h * i for i in range(self.N+1)]
         else:
             return [bandpass.blue_limit + h * (i+0.5) for i in range(self.N)]
+
+
+class AdaptiveIntegrator(ImageIntegrator):
+    """Create a chromatic surface brightness profile integrator, which will integrate over
+    wavelength using a Bandpass as a weight function.
+
+    This integrator uses adaptive Simpson's rule quadrature.  It starts from `N` equal intervals
+    between bandpass.blue_limit and bandpass.red_limit, and then recursively bisects any interval
+    where Simpson's rule on the whole interval differs significantly from the sum over its two
+    halves.  So it only refines the wavelength sampling where the integrand (the monochromatic
+    image times the bandpass throughput) is changing non-linearly.  This typically needs far
+    fewer evaluations than ContinuousIntegrator or SampleIntegrator.
+
+    The error of each image is measured by the sum of the absolute values of its pixels.  Each
+    interval is accepted once its estimated error is less than `rel_err` times that of the
+    integral in proportion to the interval's share of the full wavelength range.  The accepted
+    estimates include the Richardson extrapolation from the two Simpson's rule values.
+
+    @param rel_err      The target relative error of the integral.  [default: 1.e-4]
+    @param N            The number of equal intervals to start with.  This should be large
+                        enough that none of the features in the bandpass or SED are missed
+                        entirely.  [default: 8]
+    @param max_n_eval   The maximum number of evaluations to use.  If this is reached, any
+                        remaining intervals are accepted without further refinement.
+                        [default: 1000]
+    """
+    def __init__(self, rel_err=1.e-4, N=8, max_n_eval=1000):
+        if rel_err <= 0.:
+            raise GalSimRangeError("rel_err must be positive", rel_err, 0.)
+        if N < 1:
+            raise GalSimRangeError("N must be at least 1", N, 1)
+        if max_n_eval < 2*N+1:
+            raise GalSimRangeError("max_n_eval must be at least 2*N+1", max_n_eval, 2*N+1)
+        self.rel_err = rel_err
+        self.N = N
+        self.max_n_eval = max_n_eval
+
+    def calculateWaves(self, bandpass):
+        # The starting wavelengths.  The final ones depend on the profile.
+        return np.linspace(bandpass.blue_limit, bandpass.red_limit, 2*self.N+1)
+
+    def __call__(self, evaluateAtWavelength, bandpass, image, drawImageKwargs, doK=False):
+        """
+        @param evaluateAtWavelength Function that returns a monochromatic surface brightness
+                                    profile as a function of wavelength.
+        @param bandpass             Bandpass object representing the filter being imaged through.
+        @param image                Image used to set size and scale of output
+        @param drawImageKwargs      dict with other kwargs to send to drawImage function.
+        @param doK                  Integrate up results of drawKImage instead of results of
+                                    drawImage.  [default: False]
+
+        @returns the result of integral as an Image
+        """
+        drawImageKwargs.pop('add_to_image', None) # Make sure add_to_image isn't in kwargs
+
+        def integrand(w):
+            prof = evaluateAtWavelength(w) * bandpass(w)
+            if not doK:
+                return prof.drawImage(image=image.copy(), **drawImageKwargs)
+            else:
+                return prof.drawKImage(image=image.copy(), **drawImageKwargs)
+
+        def norm(im):
+            return np.sum(np.abs(im.array))
+
+        waves = self.calculateWaves(bandpass)
+        fvals = [integrand(w) for w in waves]
+        n_eval = len(waves)
+        width = waves[-1] - waves[0]
+
+        # Each interval is (a, b, f(a), f(midpoint), f(b), Simpson's rule estimate).
+        intervals = []
+        for i in range(self.N):
+            a, b = waves[2*i], waves[2*i+2]
+            fa, fm, fb = fvals[2*i:2*i+3]
+            intervals.append((a, b, fa, fm, fb, (fa + 4*fm + fb) * ((b-a)/6.)))
+        result = intervals[0][5].copy()
+        for interval in intervals[1:]:
+            result += interval[5]
+        abs_err = self.rel_err * norm(result)
+        del fvals
+
+        # Refine depth first, so only a few intervals' images are in memory at a time.
+        result.setZero()
+        intervals.reverse()
+        while intervals:
+            a, b, fa, fm, fb, whole = intervals.pop()
+            if n_eval + 2 > self.max_n_eval:
+                result += whole
+                continue
+            m = 0.5*(a+b)
+            fl = integrand(0.5*(a+m))
+            fr = integrand(0.5*(m+b))
+            n_eval += 2
+            left = (fa + 4*fl + fm) * ((m-a)/6.)
+            right = (fm + 4*fr + fb) * ((b-m)/6.)
+            halves = left + right
+            diff = halves - whole
+            if norm(diff) <= 15. * abs_err * (b-a) / width or m == a or m == b:
+                result += halves
+                diff /= 15.
+                result += diff
+            else:
+                intervals.append((m, b, fm, fr, fb, right))
+                intervals.append((a, m, fa, fl, fm, left))
+        self.last_n_eval = n_eval
+        return result
@@ -23,6 +23,7 @@ InterpolatedImage is a class that allows one to treat an image as a profile.
 from past.builtins import basestring
 import numpy as np
 import math
+import hashlib
 
 from .gsobject import GSObject
 from .gsparams import GSParams
@@ -30,7 +31,7 @@ from .image import Image
 from .bounds import _BoundsI
 from .position import PositionD
 from .interpolant import Quintic, Interpolant, SincInterpolant
-from .utilities import convert_interpolant, lazy_property, doc_inherit
+from .utilities import convert_interpolant, lazy_property, doc_inherit, LRU_BytesCache
 from .random import BaseDeviate
 from . import _galsim
 from . import fits
@@ -184,6 +185,12 @@ class InterpolatedImage(GSObject):
                             [default: 0, i.e., pad with zeros]
     @param use_cache        Specify whether to cache `noise_pad` read in from a file to save having
                             to build a CorrelatedNoise object repeatedly from the same image.
+                            Also, when not using `noise_pad`, whether to cache the stepk and maxk
+                            calculations, so they are not repeated for an identical image, and
+                            to share the k-space lookup table with identical InterpolatedImages
+                            (see buildKTable).
+                            The size of the latter cache may be changed with
+                            `galsim.utilities.set_cache_size('interpolated_image', maxbytes)`.
                             [default: True]
     @param rng              If padding by noise, the user can optionally supply the random noise
                             generator to use for drawing random numbers as `rng` (may be any kind of
@@ -261,6 +268,8 @@ class InterpolatedImage(GSObject):
     _single_params = []
     _takes_rng = True
     _cache_noise_pad = {}
+    _analysis_cache = LRU_BytesCache(maxbytes=10**8)
+    _pinned_tables = {}
 
     _has_hard_edges = False
     _is_axisymmetric = False
@@ -349,8 +358,35 @@ class InterpolatedImage(GSObject):
 
         # Process the different options for flux, stepk, maxk
         self._flux = self._getFlux(flux, normalization)
-        self._stepk = self._getStepK(calculate_stepk, _force_stepk)
-        self._maxk = self._getMaxK(calculate_maxk, _force_maxk)
+
+        # The stepk and maxk calculations are the slow part of making an InterpolatedImage, so
+        # check whether they have already been done for an identical padded image.  Noise-padded
+        # images are essentially never repeated, so don't bother caching those.
+        # The digest of the padded image is kept (and pickled), since it is also used to share
+        # the SBInterpolatedImage, and its k table, among all identical InterpolatedImages.
+        if use_cache and not noise_pad_size:
+            self._digest = hashlib.sha1(np.ascontiguousarray(self._xim.array)).hexdigest()
+            key = self._getAnalysisKey(calculate_stepk, calculate_maxk, _force_stepk, _force_maxk)
+            entry = InterpolatedImage._analysis_cache.get(key)
+        else:
+            self._digest = None
+            key = entry = None
+
+        if entry is None:
+            self._stepk = self._getStepK(calculate_stepk, _force_stepk)
+            self._maxk = self._getMaxK(calculate_maxk, _force_maxk)
+            if key is not None:
+                # Store stepk, maxk along with the scales they are for, so they may be rescaled
+                # for a different wcs.
+                entry = ((self._stepk, self._wcs._minScale()), (self._maxk, self._wcs._maxScale()))
+                InterpolatedImage._analysis_cache.add(key, entry, 1000)
+                # If the maxk calculation made an SBInterpolatedImage, it has already built the
+                # k table, so share that one.
+                if '_sbii' in self.__dict__:
+                    self._addTable(self._sbii)
+        else:
+            self._stepk = self._rescaleK(entry[0], self._wcs._minScale(), _force_stepk)
+            self._maxk = self._rescaleK(entry[1], self._wcs._maxScale(), _force_maxk)
 
     @doc_inherit
     def withGSParams(self, gsparams):
@@ -366,13 +402,19 @@ class InterpolatedImage(GSObject):
     def _sbp(self):
         min_scale = self._wcs._minScale()
         max_scale = self._wcs._maxScale()
-        with convert_cpp_errors():
-            self._sbii = _galsim.SBInterpolatedImage(
-                    self._xim._image, self._image.bounds._b, self._pad_image.bounds._b,
-                    self._x_interpolant._i, self._k_interpolant._i,
-                    self._stepk*min_scale,
-                    self._maxk*max_scale,
-                    self.gsparams._gsp)
+        # Don't share the temporary one made to calculate maxk, which has _maxk = 0.
+        sbii = self._getTable() if self._maxk != 0. else None
+        if sbii is None:
+            with convert_cpp_errors():
+                sbii = _galsim.SBInterpolatedImage(
+                        self._xim._image, self._image.bounds._b, self._pad_image.bounds._b,
+                        self._x_interpolant._i, self._k_interpolant._i,
+                        self._stepk*min_scale,
+                        self._maxk*max_scale,
+                        self.gsparams._gsp)
+            if self._maxk != 0.:
+                self._addTable(sbii)
+        self._sbii = sbii
 
         self._sbp = self._sbii  # Temporary.  Will overwrite this with the return value.
 
@@ -540,6 +582,91 @@ class InterpolatedImage(GSObject):
                 flux *= self._wcs.pixelArea()
         return flux
 
+    def _getAnalysisKey(self, calculate_stepk, calculate_maxk, _force_stepk, _force_maxk):
+        # Everything that the stepk and maxk calculations depend on, other than the wcs.
+        # Forced values are converted to pixel units to match.
+        return ('analysis', self._digest, self._xim.dtype, self._xim.bounds, self._image.bounds,
+                self._pad_image.bounds, self._x_interpolant, self._k_interpolant, self.gsparams,
+                calculate_stepk, calculate_maxk,
+                _force_stepk * self._wcs._minScale(), _force_maxk * self._wcs._maxScale())
+
+    def _getTableKey(self):
+        # Everything that the SBInterpolatedImage depends on.  It is in pixel units, so it may
+        # be shared by profiles with different wcs.  The conversion of stepk, maxk to pixel units
+        # may differ in the last bit for different wcs, so round them to avoid spurious misses.
+        if self.__dict__.get('_digest', None) is None:
+            return None
+        stepk = float('%.12g'%(self._stepk * self._wcs._minScale()))
+        maxk = float('%.12g'%(self._maxk * self._wcs._maxScale()))
+        return ('table', self._digest, self._xim.dtype, self._xim.bounds, self._image.bounds,
+                self._pad_image.bounds, self._x_interpolant, self._k_interpolant, self.gsparams,
+                stepk, maxk)
+
+    def _getTable(self):
+        # Return a shared SBInterpolatedImage for this profile if there is one, else None.
+        key = self._getTableKey()
+        if key is None:
+            return None
+        item = InterpolatedImage._pinned_tables.get(key, None)
+        if item is None:
+            item = InterpolatedImage._analysis_cache.get(key)
+        return None if item is None else item[0]
+
+    def _addTable(self, sbii):
+        # Share the given SBInterpolatedImage with any other identical profiles.
+        # The SBInterpolatedImage only holds references to the C++ interpolants, so we need to
+        # keep the python interpolants along with it.  It holds both an x table and a k table,
+        # each of which uses ~8 N^2 bytes.
+        key = self._getTableKey()
+        if key is not None:
+            item = (sbii, self._x_interpolant, self._k_interpolant)
+            InterpolatedImage._analysis_cache.add(key, item, 16 * self._xim.array.size)
+
+    def buildKTable(self, pin=False):
+        """Build the k-space lookup table for this profile now, rather than when it is first
+        needed.
+
+        The k table is the Fourier transform of the padded image, which is needed to draw the
+        profile with FFTs or to evaluate it in k space.  It is shared with all other identical
+        InterpolatedImages made in this process, including transformed and unpickled copies, so
+        it only needs to be built once.  Thus, it can be useful to call this once, e.g. when
+        initializing each worker process, for a PSF image that will be used for many objects.
+
+        Shared tables are normally kept in the 'interpolated_image' cache, which removes the least
+        recently used ones as needed (see galsim.utilities.set_cache_size).  With `pin=True`, the
+        table is also kept until unpinKTable is called.  Neither sharing nor pinning is done if
+        the InterpolatedImage was made with `use_cache=False` or with `noise_pad`.
+
+        @param pin      Whether to keep the table regardless of the cache size. [default: False]
+        """
+        self._sbp
+        self._sbii.kValue(PositionD(0,0)._p)
+        key = self._getTableKey()
+        if pin and key is not None:
+            InterpolatedImage._pinned_tables[key] = (
+                    self._sbii, self._x_interpolant, self._k_interpolant)
+
+    def unpinKTable(self):
+        """Stop keeping the k table that was pinned by buildKTable(pin=True).
+
+        It remains in the 'interpolated_image' cache, so it may still be shared until it is
+        removed from there.
+        """
+        key = self._getTableKey()
+        if key is not None:
+            InterpolatedImage._pinned_tables.pop(key, None)
+
+    def _rescaleK(self, cached, scale, force_k):
+        # Convert a cached (k, k_scale) value, calculated for a pixel scale of k_scale, to the
+        # given scale.  If the value was forced, just use that, which avoids any rounding errors.
+        k, k_scale = cached
+        if force_k > 0.:
+            return force_k
+        elif scale == k_scale:
+            return k
+        else:
+            return k * k_scale / scale
+
     def _getStepK(self, calculate_stepk, _force_stepk):
         # GalSim cannot automatically know what stepK and maxK are appropriate for the
         # input image.  So it is usually worth it to do a manual calculation (below).
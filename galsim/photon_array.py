@@ -406,6 +406,10 @@ class WavelengthSampler(object):
     """This class is a sensor operation that uses sed.sampleWavelength to set the wavelengths
     array of a PhotonArray.
 
+    The tables used to draw the wavelengths are cached for each SED and bandpass, and shared
+    by SEDs that differ only in their normalization (e.g. `template.atRedshift(z).withFlux(...)`
+    for many objects with the same template and redshift).  See galsim.utilities.set_cache_size().
+
     @param sed          The SED to use for the objects spectral energy distribution.
     @param bandpass     A Bandpass object representing a filter, or None to sample over the full
                         SED wavelength range.
@@ -423,8 +427,21 @@ class WavelengthSampler(object):
 
     def applyTo(self, photon_array, local_wcs=None):
         """Assign wavelengths to the photons sampled from the SED * Bandpass."""
-        photon_array.wavelength = self.sed.sampleWavelength(
-                photon_array.size(), self.bandpass, rng=self.rng, npoints=self.npoints)
+        # Fill the wavelength array in place, rather than making a new one.
+        self.sed._sampleWavelength(photon_array.wavelength, self.bandpass, rng=self.rng,
+                                   npoints=self.npoints)
+
+    def applyToMany(self, photon_arrays, local_wcs=None):
+        """Assign wavelengths to the photons in each of a list of PhotonArrays.
+
+        This is equivalent to calling applyTo for each PhotonArray, but all the wavelengths are
+        drawn at once, which is faster when there are many small PhotonArrays.
+        """
+        n = [len(pa) for pa in photon_arrays]
+        waves = np.empty(sum(n))
+        self.sed._sampleWavelength(waves, self.bandpass, rng=self.rng, npoints=self.npoints)
+        for pa, w in zip(photon_arrays, np.split(waves, np.cumsum(n)[:-1])):
+            pa.wavelength = w
 
 class FRatioAngles(object):
     """A surface-layer operator that assigns photon directions based on the f/ratio and
@@ -459,7 +476,6 @@ class FRatioAngles(object):
 
         dxdz = photon_array.dxdz
         dydz = photon_array.dydz
-        n_photons = len(dxdz)
 
         # The f/ratio is the ratio of the focal length to the diameter of the aperture of
         # the telescope.  The angular radius of the field of view is defined by the
@@ -467,24 +483,28 @@ class FRatioAngles(object):
         pupil_angle = np.arctan(0.5 / self.fratio)  # radians
         obscuration_angle = np.arctan(0.5 * self.obscuration / self.fratio)
 
+        # The dxdz and dydz arrays are used as work space for the random angles, so we don't
+        # need to allocate new arrays for them.
         # Generate azimuthal angles for the photons
-        phi = np.empty(n_photons)
+        phi = dxdz
         self.ud.generate(phi)
         phi *= (2 * np.pi)
 
         # Generate inclination angles for the photons, which are uniform in sin(theta) between
         # the sine of the obscuration angle and the sine of the pupil radius
-        sintheta = np.empty(n_photons)
+        sintheta = dydz
         self.ud.generate(sintheta)
-        sintheta = np.sin(obscuration_angle) + (np.sin(pupil_angle) - np.sin(obscuration_angle)) \
-            * sintheta
+        sintheta *= (np.sin(pupil_angle) - np.sin(obscuration_angle))
+        sintheta += np.sin(obscuration_angle)
 
         # Assign the directions to the arrays. In this class the convention for the
         # zero of phi does not matter but it would if the obscuration is dependent on
         # phi
         tantheta = np.sqrt(np.square(sintheta) / (1. - np.square(sintheta)))
-        dxdz[:] = tantheta * np.sin(phi)
-        dydz[:] = tantheta * np.cos(phi)
+        np.cos(phi, out=dydz)
+        dydz *= tantheta
+        np.sin(phi, out=dxdz)
+        dxdz *= tantheta
 
 class PhotonDCR(object):
     """A surface-layer operator that applies the effect of differential chromatic refraction (DCR)
@@ -577,15 +597,18 @@ class PhotonDCR(object):
         ceny = local_wcs.origin.y
 
         # Apply the wavelength-dependent scaling
+        # (Operations are done in place where possible to avoid allocating new arrays.)
         if self.alpha != 0.:
             scale = (w/self.base_wavelength)**self.alpha
-            photon_array.x = scale * (photon_array.x - cenx) + cenx
-            photon_array.y = scale * (photon_array.y - ceny) + ceny
+            for a, cen in ((photon_array.x, cenx), (photon_array.y, ceny)):
+                a -= cen
+                a *= scale
+                a += cen
 
         # Apply DCR
         shift_magnitude = dcr.get_refraction(w, self.zenith_angle, **self.kw)
         shift_magnitude -= self.base_refraction
-        shift_magnitude = shift_magnitude * (radians / self.scale_unit)
+        shift_magnitude *= (radians / self.scale_unit)
         sinp, cosp = self.parallactic_angle.sincos()
 
         du = -shift_magnitude * sinp
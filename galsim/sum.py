@@ -20,6 +20,7 @@ import numpy as np
 
 from .gsparams import GSParams
 from .gsobject import GSObject
+from .position import PositionD
 from .chromatic import ChromaticObject, ChromaticSum
 from .utilities import lazy_property, doc_inherit
 from . import _galsim
@@ -212,6 +213,60 @@ class Sum(GSObject):
             ret._obj_list = [ obj.withGSParams(gsparams) for obj in self.obj_list ]
         return ret
 
+    @doc_inherit
+    def compile(self):
+        from .transform import Transformation
+        if any(obj.noise is not None for obj in self.obj_list): return self
+        obj_list = [ obj.compile() for obj in self.obj_list ]
+
+        # Group the components that have the same jacobian and offset, so each group only needs
+        # to be transformed once.  The group for key=None is the untransformed components.
+        keys = []
+        groups = {}
+        for obj in obj_list:
+            if isinstance(obj, Transformation):
+                key = (tuple(obj.jac.ravel()), obj.offset.x, obj.offset.y)
+            else:
+                key = None
+            if key not in groups:
+                keys.append(key)
+                groups[key] = []
+            groups[key].append(obj)
+
+        new_list = []
+        for key in keys:
+            group = groups[key]
+            if key is None or len(group) == 1:
+                new_list.extend(group)
+            else:
+                sum_list = [ Transformation(obj.original, flux_ratio=obj.flux_ratio,
+                                            gsparams=obj.gsparams).compile()
+                             for obj in group ]
+                new_list.append(Transformation(Sum(sum_list, gsparams=self.gsparams),
+                                               group[0].jac, group[0].offset,
+                                               gsparams=self.gsparams))
+
+        if len(new_list) == 1:
+            return new_list[0]
+        elif (len(new_list) == len(self.obj_list) and
+              all(new is old for new, old in zip(new_list, self.obj_list))):
+            ret = self
+        else:
+            ret = Sum(new_list, gsparams=self.gsparams,
+                      propagate_gsparams=self._propagate_gsparams)
+
+        # If all the components have the same nonzero offset (e.g. the bulge and disk of a
+        # galaxy), then it can be applied once to the whole sum.
+        if (all(isinstance(obj, Transformation) for obj in new_list) and
+                new_list[0].offset != PositionD(0,0) and
+                all(obj.offset == new_list[0].offset for obj in new_list)):
+            sum_list = [ Transformation(obj.original, obj.jac, flux_ratio=obj.flux_ratio,
+                                        gsparams=obj.gsparams).compile()
+                         for obj in new_list ]
+            ret = Transformation(Sum(sum_list, gsparams=self.gsparams), offset=new_list[0].offset,
+                                 gsparams=self.gsparams)
+        return ret
+
     def __eq__(self, other):
         return (isinstance(other, Sum) and
                 self.obj_list == other.obj_list and
@@ -233,6 +288,10 @@ class Sum(GSObject):
         for obj in self.obj_list:
             obj._prepareDraw()
 
+    def _prepareShoot(self, rng):
+        for obj in self.obj_list:
+            obj._prepareShoot(rng)
+
     @lazy_property
     def _maxk(self):
         maxk_list = [obj.maxk for obj in self.obj_list]
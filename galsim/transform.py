@@ -205,6 +205,29 @@ class Transformation(GSObject):
             ret._original = self.original.withGSParams(gsparams)
         return ret
 
+    @doc_inherit
+    def compile(self):
+        from .gaussian import Gaussian, _gaussian_mixture, _make_gaussian
+        if self.original.noise is not None: return self
+        original = self.original.compile()
+        if (np.array_equal(self._jac, np.identity(2)) and self._offset == PositionD(0.,0.) and
+                self._flux_ratio == 1.):
+            return original
+
+        if isinstance(original, Gaussian):
+            # A rotated or dilated Gaussian is just another Gaussian.
+            (cov, flux, offset), = _gaussian_mixture(
+                    Transformation(original, self._jac, self._offset, self._flux_ratio))
+            gauss = _make_gaussian(cov, flux, offset, self.gsparams)
+            if not isinstance(gauss, Transformation) or np.array_equal(gauss.jac, np.identity(2)):
+                return gauss
+
+        if original is self.original:
+            return self
+        else:
+            return Transformation(original, self._jac, self._offset, self._flux_ratio,
+                                  self.gsparams, self._propagate_gsparams)
+
     def __eq__(self, other):
         return (isinstance(other, Transformation) and
                 self.original == other.original and
@@ -273,6 +296,9 @@ class Transformation(GSObject):
     def _prepareDraw(self):
         self._original._prepareDraw()
 
+    def _prepareShoot(self, rng):
+        self._original._prepareShoot(rng)
+
     # Some lazy properties to calculate things as needed.
     @lazy_property
     def _det(self):
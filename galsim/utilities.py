@@ -992,12 +992,21 @@ class LRU_Cache:
     >>> cache.resize(maxsize) # Resize the cache, either upwards or downwards.  Upwards resizing
                               # is non-destructive.  Downwards resizing will remove the least
                               # recently used items first.
+    >>> cache.stats()         # Return a dict with the number of hits and misses so far, and the
+                              # current size, maximum size and approximate memory use.
+
+    Attributes
+    ----------
+    >>> cache.hits            # The number of calls that returned a cached value.
+    >>> cache.misses          # The number of calls that had to call user_function.
     """
     def __init__(self, user_function, maxsize=1024):
         # Link layout:     [PREV, NEXT, KEY, RESULT]
         self.root = root = [None, None, None, None]
         self.user_function = user_function
         self.cache = cache = {}
+        self.hits = 0
+        self.misses = 0
 
         last = root
         for i in range(maxsize):
@@ -1011,6 +1020,7 @@ class LRU_Cache:
         link = cache.get(key)
         if link is not None:
             # Cache hit: move link to last position
+            self.hits += 1
             link_prev, link_next, _, result = link
             link_prev[1] = link_next
             link_next[0] = link_prev
@@ -1021,6 +1031,7 @@ class LRU_Cache:
             return result
         # Cache miss: evaluate and insert new key/value at root, then increment root
         #             so that just-evaluated value is in last position.
+        self.misses += 1
         result = self.user_function(*key)
         root = self.root  # re-establish root in case user_function modified it due to recursion
         root[2] = key
@@ -1064,6 +1075,229 @@ class LRU_Cache:
                     root[1][0] = link
                     root[1] = link
 
+    def stats(self):
+        """ Return a dict with statistics about the cache: the number of `hits` and `misses` so
+        far, the number of items currently in the cache (`size`), the maximum number of items
+        (`maxsize`), and the approximate number of bytes used by the cached values (`nbytes`).
+        """
+        # Unused links have keys that are plain objects rather than argument tuples.
+        values = [ link[3] for key, link in self.cache.items() if isinstance(key, tuple) ]
+        return dict(hits=self.hits, misses=self.misses, size=len(values), maxsize=len(self.cache),
+                    nbytes=sum(_nbytes(v) for v in values))
+
+class LRU_BytesCache(object):
+    """ A Least Recently Used cache whose size is limited by the total number of bytes used by
+    the cached values, rather than by the number of values.
+
+    Unlike LRU_Cache, this does not wrap a function.  The caller looks up a key with `get`, and
+    if that returns None, calculates the value and adds it with `add`, giving its size in bytes.
+
+    @param maxbytes     The maximum total number of bytes for the cached values.
+
+    Usage
+    -----
+    >>> cache = galsim.utilities.LRU_BytesCache(maxbytes=10**8)
+    >>> value = cache.get(key)
+    >>> if value is None:
+    >>>     value = slow_function(key)
+    >>>     cache.add(key, value, nbytes)
+
+    Methods
+    -------
+    >>> cache.resize(maxbytes) # Change the maximum number of bytes, removing the least
+                               # recently used values as needed.
+    >>> cache.stats()          # Return a dict with the number of hits and misses so far, and the
+                               # current number of values, bytes used, and maximum bytes.
+    """
+    def __init__(self, maxbytes):
+        from collections import OrderedDict
+        self.maxbytes = maxbytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.cache = OrderedDict()
+
+    def get(self, key):
+        """Return the value cached for the given key, or None if there is none."""
+        item = self.cache.pop(key, None)
+        if item is None:
+            self.misses += 1
+            return None
+        else:
+            # Put it back at the end, since it is now the most recently used.
+            self.hits += 1
+            self.cache[key] = item
+            return item[0]
+
+    def add(self, key, value, nbytes):
+        """Add a value to the cache, removing the least recently used values as needed.
+
+        @param key      The key to use for the value.
+        @param value    The value to cache.
+        @param nbytes   The (approximate) number of bytes used by the value.
+        """
+        if key in self.cache:
+            self.nbytes -= self.cache.pop(key)[1]
+        if nbytes > self.maxbytes:
+            return
+        self.cache[key] = (value, nbytes)
+        self.nbytes += nbytes
+        self._trim()
+
+    def resize(self, maxbytes):
+        """Change the maximum number of bytes for the cached values.
+
+        @param maxbytes     The new maximum number of bytes.
+        """
+        if maxbytes < 0:
+            raise GalSimValueError("Invalid maxbytes", maxbytes)
+        self.maxbytes = maxbytes
+        self._trim()
+
+    def _trim(self):
+        while self.nbytes > self.maxbytes:
+            self.nbytes -= self.cache.popitem(last=False)[1][1]
+
+    def stats(self):
+        """ Return a dict with statistics about the cache: the number of `hits` and `misses` so
+        far, the number of values currently in the cache (`size`), the approximate number of bytes
+        they use (`nbytes`), and the maximum number of bytes (`maxbytes`).
+        """
+        return dict(hits=self.hits, misses=self.misses, size=len(self.cache), nbytes=self.nbytes,
+                    maxbytes=self.maxbytes)
+
+def _nbytes(obj):
+    """Return the approximate number of bytes used by an object, including numpy arrays or
+    images that it holds.
+    """
+    import sys
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    elif isinstance(getattr(obj, 'array', None), np.ndarray):
+        return sys.getsizeof(obj) + obj.array.nbytes
+    elif isinstance(obj, (tuple, list)):
+        return sys.getsizeof(obj) + sum(_nbytes(o) for o in obj)
+    else:
+        return sys.getsizeof(obj)
+
+def _python_caches():
+    """Return a dict of the LRU_Cache instances that cache_stats and set_cache_size know about.
+    """
+    from .gsobject import GSObject
+    from .convolve import Convolution
+    from .chromatic import ChromaticObject, ChromaticConvolution
+    from .interpolatedimage import InterpolatedImage
+    from .sed import SED
+    from . import gaussian, phase_screens, zernike
+    return { 'enclosed_flux' : GSObject._enclosed_flux_cache,
+             'convolution_kimage' : Convolution._kimage_cache,
+             'chromatic_multiplier' : ChromaticObject._multiplier_cache,
+             'chromatic_effective_profile' : ChromaticConvolution._effective_prof_cache,
+             'psf_basis' : ChromaticConvolution._psf_basis_cache,
+             'sed_deviate' : SED._deviate_cache,
+             'pixel_quadrature' : gaussian._pixel_quadrature_cache,
+             'atm_stepk' : phase_screens._calcAtmStepK,
+             'opt_stepk' : phase_screens._calcOptStepK,
+             'zernike_noll_coef' : zernike._noll_coef_array,
+             'zernike_noll_coef_xy' : zernike._noll_coef_array_xy,
+             'zernike_noll_coef_xy_gradx' : zernike._noll_coef_array_xy_gradx,
+             'zernike_noll_coef_xy_grady' : zernike._noll_coef_array_xy_grady,
+             'zernike_noll_coef_gradx' : zernike._noll_coef_array_gradx,
+             'zernike_noll_coef_grady' : zernike._noll_coef_array_grady,
+             'zernike_h' : zernike._h,
+             'zernike_Q' : zernike._Q,
+             'zernike_annular_rho_coefs' : zernike._annular_zern_rho_coefs,
+             'interpolated_image' : InterpolatedImage._analysis_cache }
+
+def cache_stats():
+    """Return statistics about the caches that GalSim uses to avoid repeating expensive
+    calculations.
+
+    These include the C++ caches of the lookup tables used by the Sersic, Spergel, Airy,
+    Exponential, Kolmogorov, VonKarman, and SecondKick profiles, which are keyed by the parameters
+    of the profile that affect the tables (e.g. n for Sersic) and the GSParams.  They also include
+    the python caches of the enclosed flux calculations for `flux_frac`, the k-space images for
+    Convolution `cache_kimage`, the SED/Bandpass integrals, effective profiles and `psf_basis`
+    images for chromatic objects, the wavelength deviates used for photon shooting, the
+    quadrature rules for drawing sums of Gaussians, the analysis of the images used for
+    InterpolatedImage, and the smaller caches used by phase screens and Zernike polynomials.
+
+    The returned dict is keyed by the name of the cache (e.g. 'sersic').  Each value is itself a
+    dict with the following items:
+
+        hits        The number of times a cached value was used.
+        misses      The number of times a value had to be calculated.
+        size        The number of values currently in the cache.
+        maxsize     The maximum number of values to keep in the cache.
+        nbytes      The approximate number of bytes used by the cached values.
+
+    The 'interpolated_image' cache is limited by the number of bytes rather than the number of
+    values, so it has `maxbytes` rather than `maxsize`.
+
+    If there are many more misses than hits, and `size` is equal to `maxsize`, then it may be
+    worth increasing the size of the cache using set_cache_size.
+
+    @returns a dict with the statistics of each cache.
+    """
+    stats = {}
+    for name, size, maxsize, hits, misses, nbytes in _galsim.GetLRUCacheStats():
+        stats[name] = dict(hits=hits, misses=misses, size=size, maxsize=maxsize, nbytes=nbytes)
+    for name, cache in _python_caches().items():
+        stats[name] = cache.stats()
+    return stats
+
+def set_cache_size(name, maxsize):
+    """Set the maximum number of values to keep in one of GalSim's caches.
+
+    See cache_stats for the available caches.  Increasing the size keeps all the current values.
+    Decreasing the size removes the least recently used values first.
+
+    The 'interpolated_image' cache is limited by the number of bytes used rather than the number
+    of values, so for that cache, `maxsize` is the maximum number of bytes.
+
+    @param name     The name of the cache, e.g. 'sersic'.
+    @param maxsize  The new maximum number of values to keep in the cache.  Must be > 0.
+    """
+    python_caches = _python_caches()
+    cpp_names = [ stats[0] for stats in _galsim.GetLRUCacheStats() ]
+    if name not in python_caches and name not in cpp_names:
+        raise GalSimValueError("Unknown cache name", name, sorted(cpp_names + list(python_caches)))
+    if maxsize <= 0:
+        raise GalSimRangeError("Invalid maxsize", maxsize, 1)
+    if name in python_caches:
+        python_caches[name].resize(int(maxsize))
+    else:
+        _galsim.SetLRUCacheSize(name, int(maxsize))
+
+
+def set_profile_cache_dir(dir):
+    """Set a directory to use for an on-disk cache of the lookup tables that some profiles
+    need to build.
+
+    The Sersic, Kolmogorov, VonKarman, and SecondKick profiles need to build lookup tables
+    that can take a significant amount of time to calculate.  These are kept in memory for
+    the duration of the process, but if a cache directory is set, they are also saved in that
+    directory, so they can be reused by other processes and in later runs.  The files are only
+    used by the same version of GalSim that wrote them, and only for identical profile
+    parameters and GSParams.
+
+    If this function is not called, the environment variable GALSIM_CACHE_DIR is used for the
+    cache directory if it is set.
+
+    @param dir      The directory to use, which is created if it does not exist.  If None,
+                    the on-disk cache is turned off.
+    """
+    if dir is None:
+        dir = ''
+    elif not os.path.isdir(dir):
+        os.makedirs(dir)
+    _galsim.SetDiskCacheDir(dir)
+
+def get_profile_cache_dir():
+    """Get the directory being used for the on-disk cache of the profile lookup tables,
+    or None if there is none.  See set_profile_cache_dir for details.
+    """
+    return _galsim.GetDiskCacheDir() or None
 
 # http://stackoverflow.com/questions/2891790/pretty-printing-of-numpy-array
 @contextmanager
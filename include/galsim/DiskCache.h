@@ -0,0 +1,96 @@
+/* -*- c++ -*-
+ * Copyright (c) 2012-2018 by the GalSim developers team on GitHub
+ * https://github.com/GalSim-developers
+ *
+ * This file is part of GalSim: The modular galaxy image simulation toolkit.
+ * https://github.com/GalSim-developers/GalSim
+ *
+ * GalSim is free software: redistribution and use in source and binary forms,
+ * with or without modification, are permitted provided that the following
+ * conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice, this
+ *    list of conditions, and the disclaimer given in the accompanying LICENSE
+ *    file.
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions, and the disclaimer given in the documentation
+ *    and/or other materials provided with the distribution.
+ */
+
+#ifndef GalSim_DiskCache_H
+#define GalSim_DiskCache_H
+
+#include <string>
+#include <vector>
+#include "GSParams.h"
+#include "Table.h"
+
+namespace galsim {
+
+    /**
+     * @brief Set the directory to use for the on-disk cache of profile precomputations.
+     *
+     * Some profiles (e.g. Sersic, VonKarman) need to build lookup tables that can take a
+     * significant amount of time.  These are kept in memory in an LRUCache, but if a cache
+     * directory is set, they are also saved on disk, so they can be shared between processes and
+     * between runs.  An empty string turns off the disk cache.
+     *
+     * If this is never called, the value of the environment variable GALSIM_CACHE_DIR is used
+     * if it is set.
+     */
+    void SetDiskCacheDir(const std::string& dir);
+
+    /// @brief Get the directory being used for the on-disk cache, or "" if there is none.
+    std::string GetDiskCacheDir();
+
+    /**
+     * @brief A record in the on-disk cache.
+     *
+     * Each record is identified by a kind (e.g. "sersic") and a key made from the parameters
+     * and the GSParams.  The data are stored as a sequence of doubles.  The file also records
+     * the GalSim version and a format version, and the full key, so records from other versions
+     * or with the same file name but different parameters are not used.
+     *
+     * Typical usage is:
+     *
+     *     DiskCacheRecord record("sersic", params, *gsparams);
+     *     if (record.read()) {
+     *         x = record.next();
+     *         record.next(table);
+     *     } else {
+     *         // compute x and table.
+     *         record.add(x);
+     *         record.add(table);
+     *         record.write();
+     *     }
+     */
+    class DiskCacheRecord
+    {
+    public:
+        DiskCacheRecord(const std::string& kind, const std::vector<double>& params,
+                        const GSParams& gsparams);
+
+        /// @brief Read the record from disk.  Returns whether it was found.
+        bool read();
+
+        /// @brief Write the record to disk, if there is a cache directory.
+        void write() const;
+
+        /// @brief Add a value or a finalized table to the data to be written.
+        void add(double x) { _data.push_back(x); }
+        void add(const TableBuilder& table);
+
+        /// @brief Get the next value or table from the data that were read.
+        double next();
+        void next(TableBuilder& table);
+
+    private:
+        std::string _file_name;
+        std::string _key;
+        std::vector<double> _data;
+        size_t _index;
+    };
+
+}
+
+#endif
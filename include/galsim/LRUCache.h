@@ -22,6 +22,8 @@
 
 #include <list>
 #include <map>
+#include <string>
+#include "Std.h"
 
 namespace galsim {
 
@@ -123,6 +125,47 @@ namespace galsim {
         }
     };
 
+    /**
+     * @brief The non-templated part of the LRUCache interface
+     *
+     * This lets the caches of different types be inspected and resized by name.  See
+     * GetLRUCacheRegistry().
+     */
+    class LRUCacheBase
+    {
+    public:
+        virtual ~LRUCacheBase() {}
+
+        /// @brief The number of items currently in the cache.
+        virtual size_t size() const = 0;
+
+        /// @brief The maximum number of items to save in the cache.
+        virtual size_t getMaxSize() const = 0;
+
+        /// @brief Change the maximum number of items, removing the least recently used if needed.
+        virtual void resize(size_t nmax) = 0;
+
+        /// @brief The number of calls to get() that found the item already in the cache.
+        virtual long getHits() const = 0;
+
+        /// @brief The number of calls to get() that had to build a new item.
+        virtual long getMisses() const = 0;
+
+        /// @brief The approximate number of bytes used by the items in the cache.
+        virtual size_t memoryUsage() const = 0;
+    };
+
+    /**
+     * @brief The registry of named LRUCaches, keyed by their names.
+     *
+     * LRUCaches that are given a name when they are constructed add themselves to this map.
+     */
+    inline std::map<std::string, LRUCacheBase*>& GetLRUCacheRegistry()
+    {
+        static std::map<std::string, LRUCacheBase*> registry;
+        return registry;
+    }
+
     /**
      * @brief Least Recently Used Cache
      *
@@ -146,24 +189,38 @@ namespace galsim {
      *
      * At most nmax items will be saved in the cache.
      *
+     * The Value type should also have a memoryUsage() method returning the approximate number
+     * of bytes it uses.
+     *
+     * If a name is given, the cache is added to the registry returned by GetLRUCacheRegistry(),
+     * so it can be inspected and resized from python.
+     *
      */
     template <typename Key, typename Value>
-    class LRUCache
+    class LRUCache : public LRUCacheBase
     {
     public:
         /**
          * @brief Constructor
          *
          * @param[in] nmax  How many values to save in the cache.
+         * @param[in] name  An optional name to use for registering the cache.
          */
-        LRUCache(size_t nmax) : _nmax(nmax) {}
+        LRUCache(size_t nmax, const std::string& name="") :
+            _nmax(nmax), _nhits(0), _nmisses(0), _name(name)
+        {
+            if (_name != "") GetLRUCacheRegistry()[_name] = this;
+        }
 
         /**
          * @brief Destructor
          *
          * Delete all items stored in the cache.
          */
-        ~LRUCache() {}
+        ~LRUCache()
+        {
+            if (_name != "") GetLRUCacheRegistry().erase(_name);
+        }
 
         shared_ptr<Value> get(const Key& key)
         {
@@ -171,6 +228,7 @@ namespace galsim {
             MapIter iter = _cache.find(key);
             if (iter != _cache.end()) {
                 // Item is cached.
+                ++_nhits;
                 // Move it to the front of the list.
                 if (iter != _cache.begin())
                     _entries.splice(_entries.begin(), _entries, iter->second);
@@ -179,6 +237,7 @@ namespace galsim {
                 return iter->second->second;
             } else {
                 // Item is not cached.
+                ++_nmisses;
                 // Make a new one.
                 shared_ptr<Value> value(LRUCacheHelper<Value,Key>::NewValue(key));
                 // Remove items from the cache as necessary.
@@ -196,14 +255,41 @@ namespace galsim {
             }
         }
 
+        size_t size() const { return _entries.size(); }
+        size_t getMaxSize() const { return _nmax; }
+        long getHits() const { return _nhits; }
+        long getMisses() const { return _nmisses; }
+
+        void resize(size_t nmax)
+        {
+            assert(nmax > 0);
+            _nmax = nmax;
+            while (_entries.size() > _nmax) {
+                _cache.erase(_entries.back().first);
+                _entries.pop_back();
+            }
+        }
+
+        size_t memoryUsage() const
+        {
+            size_t nbytes = 0;
+            for (ConstListIter it=_entries.begin(); it!=_entries.end(); ++it)
+                nbytes += it->second->memoryUsage();
+            return nbytes;
+        }
+
     private:
 
         size_t _nmax;
+        long _nhits;
+        long _nmisses;
+        std::string _name;
 
         typedef std::pair<Key, shared_ptr<Value> > Entry;
         std::list<Entry> _entries;
 
         typedef typename std::list<Entry>::iterator ListIter;
+        typedef typename std::list<Entry>::const_iterator ConstListIter;
         std::map<Key, ListIter> _cache;
 
         typedef typename std::map<Key, ListIter>::iterator MapIter;
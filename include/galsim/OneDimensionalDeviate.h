@@ -256,6 +256,9 @@ namespace galsim {
          */
         void shoot(PhotonArray& photons, UniformDeviate ud, bool xandy=false) const;
 
+        /// @brief The approximate number of bytes used by this object.
+        size_t memoryUsage() const { return sizeof(*this) + _pt.memoryUsage(); }
+
     private:
 
         const FluxDensity& _fluxDensity; // Function being sampled
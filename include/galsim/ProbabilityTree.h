@@ -21,6 +21,7 @@
 #define GalSim_ProbabilityTree_H
 
 #include <vector>
+#include <cmath>
 #include "Std.h"
 
 namespace galsim {
@@ -45,6 +46,12 @@ namespace galsim {
      * methods.  Then call `buildTree()`, optionally specifying a minimum level of flux
      * for members to be retained in the tree (default is that any non-zero member is in).
      * The `find()` method will now return random draws with near-optimal speed.
+     *
+     * `buildTree()` also builds an alias table (Walker's method, with Vose's construction),
+     * which the `sample()` method uses to select a member in constant time: the random number
+     * picks one of N equal-probability bins, each of which holds at most two members.  This
+     * gives the same distribution of members as `find()`, but not the same member for a given
+     * random number.
      */
     template <class FluxData>
     class ProbabilityTree :
@@ -93,6 +100,34 @@ namespace galsim {
             return _shortcut[i]->find(unitRandom);
         }
 
+        /**
+         * @brief Choose a member of the tree based on a uniform deviate, using the alias table
+         *
+         * This is the same as `find()` except for which member is chosen for a given unitRandom,
+         * and it returns a bare pointer, which is valid as long as the tree is.  On output,
+         * unitRandom is again replaced by a new uniform deviate in [0,1).
+         *
+         * @param[in,out] unitRandom On input, a random number between 0 and 1.  On output,
+         *               holds a new uniform deviate.
+         * @returns Pointer to the selected tree member.
+         */
+        const FluxData* sample(double& unitRandom) const
+        {
+            const int n = _aliasProb.size();
+            double x = unitRandom * n;
+            int i = int(x);
+            if (i >= n) i = n-1;  // Just in case of rounding errors.
+            x -= i;
+            const double p = _aliasProb[i];
+            if (x < p) {
+                unitRandom = x / p;
+                return _aliasMembers[i];
+            } else {
+                unitRandom = (x - p) / (1. - p);
+                return _aliasMembers[_alias[i]];
+            }
+        }
+
         /**
          * @brief Construct the tree from current vector elements.
          * @param[in] threshold that have flux <= this value are not included in the tree.
@@ -135,6 +170,18 @@ namespace galsim {
             // Make sure all the shortcut entries were set.
             for(int i=0;i<nelem;++i) xassert(_shortcut[i]);
 #endif
+
+            buildAliasTable(start, last);
+        }
+
+        /// @brief The approximate number of bytes used by the tree, including its members.
+        size_t memoryUsage() const
+        {
+            // Each member has its shared_ptr and the FluxData it points to.  The tree has
+            // ~2 Elements per member.
+            return (size() * (sizeof(shared_ptr<FluxData>) + sizeof(FluxData) + 2*sizeof(Element))
+                    + _shortcut.size() * sizeof(const Element*)
+                    + _aliasProb.size() * (sizeof(double) + sizeof(int) + sizeof(FluxData*)));
         }
 
     private:
@@ -323,6 +370,46 @@ namespace galsim {
             }
         }
 
+        // Build the alias table from the members in [start, last).
+        void buildAliasTable(VecIter start, VecIter last)
+        {
+            const int n = last-start;
+            _aliasMembers.resize(n);
+            _aliasProb.resize(n);
+            _alias.resize(n);
+            // Each bin has probability 1/n.  Scale the member probabilities to match.
+            // Members with p < 1 are "small" and need another member to fill their bin.
+            std::vector<double> p(n);
+            std::vector<int> small, large;
+            for (int i=0; i<n; ++i) {
+                _aliasMembers[i] = (start+i)->get();
+                p[i] = std::abs(_aliasMembers[i]->getFlux()) * n / _totalAbsFlux;
+                if (p[i] < 1.) small.push_back(i);
+                else large.push_back(i);
+            }
+            // Fill each small bin with the remaining probability of a large member.
+            while (!small.empty() && !large.empty()) {
+                int is = small.back(); small.pop_back();
+                int il = large.back();
+                _aliasProb[is] = p[is];
+                _alias[is] = il;
+                p[il] -= 1. - p[is];
+                if (p[il] < 1.) {
+                    large.pop_back();
+                    small.push_back(il);
+                }
+            }
+            // Anything left should have p = 1 up to rounding errors.
+            for (size_t k=0; k<large.size(); ++k) {
+                _aliasProb[large[k]] = 1.;
+                _alias[large[k]] = large[k];
+            }
+            for (size_t k=0; k<small.size(); ++k) {
+                _aliasProb[small[k]] = 1.;
+                _alias[small[k]] = small[k];
+            }
+        }
+
         Element* _root;  ///< root of the tree;
         double _totalAbsFlux; ///< Stored total unnormalized probability
 
@@ -330,6 +417,12 @@ namespace galsim {
         /// starting with root.
         /// For a probability p, a good starting point is _shortcut[int(p*100)].
         std::vector<const Element*> _shortcut;
+
+        /// The alias table used by sample().  Bin i holds member i with probability
+        /// _aliasProb[i], and member _alias[i] otherwise.
+        std::vector<const FluxData*> _aliasMembers;
+        std::vector<double> _aliasProb;
+        std::vector<int> _alias;
     };
 
 } // end namespace galsim
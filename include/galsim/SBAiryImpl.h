@@ -77,6 +77,10 @@ namespace galsim {
          */
         void shoot(PhotonArray& photons, UniformDeviate ud) const;
 
+        /// @brief The approximate number of bytes used by this object.
+        size_t memoryUsage() const
+        { return sizeof(*this) + (_sampler ? _sampler->memoryUsage() : 0); }
+
     protected:
         double _stepk; ///< Sampling in k space necessary to avoid folding
 
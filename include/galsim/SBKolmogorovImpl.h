@@ -77,6 +77,10 @@ namespace galsim {
          */
         void shoot(PhotonArray& photons, UniformDeviate ud) const;
 
+        /// @brief The approximate number of bytes used by this object.
+        size_t memoryUsage() const
+        { return sizeof(*this) + _radial.memoryUsage() + (_sampler ? _sampler->memoryUsage() : 0); }
+
     private:
         KolmogorovInfo(const KolmogorovInfo& rhs); ///< Hides the copy constructor.
         void operator=(const KolmogorovInfo& rhs); ///<Hide assignment operator.
@@ -55,6 +55,13 @@ namespace galsim {
         double structureFunction(double rho) const;
         void shoot(PhotonArray& photons, UniformDeviate ud) const;
 
+        /// @brief The approximate number of bytes used by this object.
+        size_t memoryUsage() const
+        {
+            return (sizeof(*this) + _radial.memoryUsage() + _kvLUT.memoryUsage() +
+                    (_sampler ? _sampler->memoryUsage() : 0));
+        }
+
     private:
         SKInfo(const SKInfo& rhs); ///<Hide the copy constructor
         void operator=(const SKInfo& rhs); ///<Hide the assignment operator
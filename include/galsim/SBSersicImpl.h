@@ -85,6 +85,10 @@ namespace galsim {
          */
         void shoot(PhotonArray& photons, UniformDeviate ud) const;
 
+        /// @brief The approximate number of bytes used by this object.
+        size_t memoryUsage() const
+        { return sizeof(*this) + _ft.memoryUsage() + (_sampler ? _sampler->memoryUsage() : 0); }
+
     private:
 
         SersicInfo(const SersicInfo& rhs); ///< Hide the copy constructor.
@@ -124,6 +128,7 @@ namespace galsim {
 
         // Helper functions used internally:
         void buildFT() const;
+        void calculateFT() const;
         void calculateHLR() const;
         double calculateMissingFluxRadius(double missing_flux_frac) const;
     };
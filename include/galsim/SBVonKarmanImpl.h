@@ -53,6 +53,13 @@ namespace galsim {
         double structureFunction(double rho) const;
         void shoot(PhotonArray& photons, UniformDeviate ud) const;
 
+        /// @brief The approximate number of bytes used by this object.
+        size_t memoryUsage() const
+        {
+            return (sizeof(*this) + _radial.memoryUsage() +
+                    (_sampler ? _sampler->memoryUsage() : 0));
+        }
+
         double kValueNoTrunc(double) const;
         double rawXValue(double) const;
 
@@ -105,6 +105,18 @@ namespace galsim {
 
         void finalize();
 
+        /// The (x, f(x)) values that have been added to the table.
+        const std::vector<double>& getArgs() const { return _xvec; }
+        const std::vector<double>& getVals() const { return _fvec; }
+
+        /// @brief The approximate number of bytes used by the table.
+        size_t memoryUsage() const
+        {
+            // The args and vals, plus the second derivatives for splines.
+            int nvec = (_in == spline) ? 3 : 2;
+            return sizeof(*this) + nvec * _xvec.size() * sizeof(double);
+        }
+
     private:
 
         bool _final;
@@ -0,0 +1,54 @@
+/* -*- c++ -*-
+ * Copyright (c) 2012-2018 by the GalSim developers team on GitHub
+ * https://github.com/GalSim-developers
+ *
+ * This file is part of GalSim: The modular galaxy image simulation toolkit.
+ * https://github.com/GalSim-developers/GalSim
+ *
+ * GalSim is free software: redistribution and use in source and binary forms,
+ * with or without modification, are permitted provided that the following
+ * conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice, this
+ *    list of conditions, and the disclaimer given in the accompanying LICENSE
+ *    file.
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions, and the disclaimer given in the documentation
+ *    and/or other materials provided with the distribution.
+ */
+
+#include <stdexcept>
+#include "PyBind11Helper.h"
+#include "LRUCache.h"
+
+namespace galsim {
+
+    static py::list GetLRUCacheStats()
+    {
+        py::list stats;
+        const std::map<std::string, LRUCacheBase*>& registry = GetLRUCacheRegistry();
+        std::map<std::string, LRUCacheBase*>::const_iterator it;
+        for (it=registry.begin(); it!=registry.end(); ++it) {
+            const LRUCacheBase* cache = it->second;
+            stats.append(py::make_tuple(it->first, cache->size(), cache->getMaxSize(),
+                                        cache->getHits(), cache->getMisses(),
+                                        cache->memoryUsage()));
+        }
+        return stats;
+    }
+
+    static void SetLRUCacheSize(const std::string& name, size_t nmax)
+    {
+        std::map<std::string, LRUCacheBase*>& registry = GetLRUCacheRegistry();
+        if (registry.find(name) == registry.end())
+            throw std::runtime_error("Unknown cache name " + name);
+        registry[name]->resize(nmax);
+    }
+
+    void pyExportLRUCache(PY_MODULE& _galsim)
+    {
+        GALSIM_DOT def("GetLRUCacheStats", &GetLRUCacheStats);
+        GALSIM_DOT def("SetLRUCacheSize", &SetLRUCacheSize);
+    }
+
+} // namespace galsim
@@ -25,7 +25,8 @@ namespace galsim {
     template <typename T, typename W>
     static void WrapTemplates(W& wrapper) {
         wrapper
-            .def("addTo", (double (PhotonArray::*)(ImageView<T>) const) &PhotonArray::addTo)
+            .def("addTo", (double (PhotonArray::*)(ImageView<T>) const) &PhotonArray::addTo
+                 PY_RELEASE_GIL)
             .def("setFrom",
                  (int (PhotonArray::*)(const BaseImage<T>&, double, BaseDeviate))
                  &PhotonArray::setFrom);
@@ -48,7 +49,7 @@ namespace galsim {
         py::class_<PhotonArray> pyPhotonArray(GALSIM_COMMA "PhotonArray" BP_NOINIT);
         pyPhotonArray
             .def(PY_INIT(&construct))
-            .def("convolve", &PhotonArray::convolve);
+            .def("convolve", &PhotonArray::convolve PY_RELEASE_GIL);
         WrapTemplates<double>(pyPhotonArray);
         WrapTemplates<float>(pyPhotonArray);
     }
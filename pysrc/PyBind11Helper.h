@@ -55,6 +55,9 @@ namespace py = boost::python;
 #define BP_NONCOPYABLE , boost::noncopyable
 #define BP_BASES(T) py::bases<T>
 
+// Boost python doesn't have a simple way to release the GIL, so this is a no-op there.
+#define PY_RELEASE_GIL
+
 #else
 
 #include <pybind11/pybind11.h>
@@ -75,6 +78,10 @@ namespace py = pybind11;
 #define BP_NONCOPYABLE
 #define BP_BASES(T) T
 
+// Release the GIL while running a (long) C++ function that doesn't use any Python objects,
+// so other Python threads can run at the same time.
+#define PY_RELEASE_GIL , py::call_guard<py::gil_scoped_release>()
+
 #endif
 
 #endif
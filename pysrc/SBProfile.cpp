@@ -49,7 +49,7 @@ namespace galsim {
             .def("getPositiveFlux", &SBProfile::getPositiveFlux)
             .def("getNegativeFlux", &SBProfile::getNegativeFlux)
             .def("maxSB", &SBProfile::maxSB)
-            .def("shoot", &SBProfile::shoot);
+            .def("shoot", &SBProfile::shoot PY_RELEASE_GIL);
         WrapTemplates<float>(pySBProfile);
         WrapTemplates<double>(pySBProfile);
     }
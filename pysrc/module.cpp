@@ -52,6 +52,8 @@ namespace galsim {
     void pyExportSilicon(PY_MODULE&);
     void pyExportRealGalaxy(PY_MODULE&);
     void pyExportWCS(PY_MODULE&);
+    void pyExportDiskCache(PY_MODULE&);
+    void pyExportLRUCache(PY_MODULE&);
 
     namespace hsm {
         void pyExportHSM(PY_MODULE&);
@@ -103,6 +105,8 @@ PYBIND11_MODULE(_galsim, _galsim)
     galsim::pyExportSilicon(_galsim);
     galsim::pyExportRealGalaxy(_galsim);
     galsim::pyExportWCS(_galsim);
+    galsim::pyExportDiskCache(_galsim);
+    galsim::pyExportLRUCache(_galsim);
 
     galsim::hsm::pyExportHSM(_galsim);
     galsim::integ::pyExportInteg(_galsim);
@@ -0,0 +1,167 @@
+/* -*- c++ -*-
+ * Copyright (c) 2012-2018 by the GalSim developers team on GitHub
+ * https://github.com/GalSim-developers
+ *
+ * This file is part of GalSim: The modular galaxy image simulation toolkit.
+ * https://github.com/GalSim-developers/GalSim
+ *
+ * GalSim is free software: redistribution and use in source and binary forms,
+ * with or without modification, are permitted provided that the following
+ * conditions are met:
+ *
+ * 1. Redistributions of source code must retain the above copyright notice, this
+ *    list of conditions, and the disclaimer given in the accompanying LICENSE
+ *    file.
+ * 2. Redistributions in binary form must reproduce the above copyright notice,
+ *    this list of conditions, and the disclaimer given in the documentation
+ *    and/or other materials provided with the distribution.
+ */
+
+//#define DEBUGLOGGING
+
+#include <cstdio>
+#include <cstdlib>
+#include <sstream>
+#include <iomanip>
+#include <stdexcept>
+#include <unistd.h>
+#include "DiskCache.h"
+#include "Version.h"
+#include "Std.h"
+
+namespace galsim {
+
+    // Bump this if the format of the files changes.
+    static const int disk_cache_format_version = 1;
+
+    static std::string disk_cache_dir;
+    static bool disk_cache_dir_set = false;
+
+    void SetDiskCacheDir(const std::string& dir)
+    {
+        disk_cache_dir = dir;
+        disk_cache_dir_set = true;
+    }
+
+    std::string GetDiskCacheDir()
+    {
+        if (!disk_cache_dir_set) {
+            const char* env = std::getenv("GALSIM_CACHE_DIR");
+            if (env) disk_cache_dir = env;
+            disk_cache_dir_set = true;
+        }
+        return disk_cache_dir;
+    }
+
+    // A simple, stable hash (64 bit FNV-1a) for making the file names.
+    static unsigned long long Hash(const std::string& s)
+    {
+        unsigned long long h = 14695981039346656037ULL;
+        for (size_t i=0; i<s.size(); ++i) {
+            h ^= static_cast<unsigned char>(s[i]);
+            h *= 1099511628211ULL;
+        }
+        return h;
+    }
+
+    DiskCacheRecord::DiskCacheRecord(const std::string& kind, const std::vector<double>& params,
+                                     const GSParams& gsp) :
+        _index(0)
+    {
+        std::ostringstream oss;
+        oss << std::setprecision(17);
+        oss << "GalSim " << version() << " format " << disk_cache_format_version << " " << kind;
+        for (size_t i=0; i<params.size(); ++i) oss << " " << params[i];
+        oss << "  " << gsp.minimum_fft_size << " " << gsp.maximum_fft_size
+            << " " << gsp.folding_threshold << " " << gsp.stepk_minimum_hlr
+            << " " << gsp.maxk_threshold << " " << gsp.kvalue_accuracy
+            << " " << gsp.xvalue_accuracy << " " << gsp.table_spacing
+            << " " << gsp.realspace_relerr << " " << gsp.realspace_abserr
+            << " " << gsp.integration_relerr << " " << gsp.integration_abserr
+            << " " << gsp.shoot_accuracy;
+        _key = oss.str();
+
+        std::string dir = GetDiskCacheDir();
+        if (dir != "") {
+            std::ostringstream oss2;
+            oss2 << dir << "/" << kind << "_" << std::hex << std::setfill('0') << std::setw(16)
+                << Hash(_key) << ".dat";
+            _file_name = oss2.str();
+        }
+        dbg<<"DiskCacheRecord: key = "<<_key<<", file_name = "<<_file_name<<std::endl;
+    }
+
+    bool DiskCacheRecord::read()
+    {
+        if (_file_name == "") return false;
+        FILE* fp = std::fopen(_file_name.c_str(), "rb");
+        if (!fp) return false;
+
+        // The file has the key (with its length), then the number of values and the values.
+        // If anything doesn't match, treat it as not being in the cache.
+        bool ok = false;
+        size_t nkey, ndata;
+        if (std::fread(&nkey, sizeof(size_t), 1, fp) == 1 && nkey == _key.size()) {
+            std::string key(nkey, ' ');
+            if (std::fread(&key[0], 1, nkey, fp) == nkey && key == _key &&
+                std::fread(&ndata, sizeof(size_t), 1, fp) == 1) {
+                _data.resize(ndata);
+                ok = (ndata == 0 || std::fread(&_data[0], sizeof(double), ndata, fp) == ndata);
+            }
+        }
+        std::fclose(fp);
+        if (!ok) _data.clear();
+        _index = 0;
+        dbg<<"DiskCacheRecord::read "<<_file_name<<": "<<ok<<std::endl;
+        return ok;
+    }
+
+    void DiskCacheRecord::write() const
+    {
+        if (_file_name == "") return;
+        // Write to a temporary file first and then rename it, so other processes never see
+        // a partially written file.
+        std::ostringstream oss;
+        oss << _file_name << ".tmp" << getpid();
+        std::string tmp_name = oss.str();
+        FILE* fp = std::fopen(tmp_name.c_str(), "wb");
+        if (!fp) return;  // Not writable.  Just skip it.
+
+        size_t nkey = _key.size();
+        size_t ndata = _data.size();
+        bool ok = (std::fwrite(&nkey, sizeof(size_t), 1, fp) == 1 &&
+                   std::fwrite(_key.c_str(), 1, nkey, fp) == nkey &&
+                   std::fwrite(&ndata, sizeof(size_t), 1, fp) == 1 &&
+                   (ndata == 0 || std::fwrite(&_data[0], sizeof(double), ndata, fp) == ndata));
+        ok = (std::fclose(fp) == 0) && ok;
+        if (!ok || std::rename(tmp_name.c_str(), _file_name.c_str()) != 0)
+            std::remove(tmp_name.c_str());
+        dbg<<"DiskCacheRecord::write "<<_file_name<<": "<<ok<<std::endl;
+    }
+
+    void DiskCacheRecord::add(const TableBuilder& table)
+    {
+        const std::vector<double>& args = table.getArgs();
+        const std::vector<double>& vals = table.getVals();
+        _data.push_back(args.size());
+        _data.insert(_data.end(), args.begin(), args.end());
+        _data.insert(_data.end(), vals.begin(), vals.end());
+    }
+
+    double DiskCacheRecord::next()
+    {
+        if (_index >= _data.size()) throw std::runtime_error("Invalid disk cache record");
+        return _data[_index++];
+    }
+
+    void DiskCacheRecord::next(TableBuilder& table)
+    {
+        size_t n = size_t(next());
+        if (_index + 2*n > _data.size()) throw std::runtime_error("Invalid disk cache record");
+        for (size_t i=0; i<n; ++i)
+            table.addEntry(_data[_index+i], _data[_index+n+i]);
+        _index += 2*n;
+        table.finalize();
+    }
+
+}
@@ -424,7 +424,7 @@ namespace galsim {
             for (int i=0; i<N; i++) {
 #ifdef USE_COS_SIN
                 double unitRandom = ud();
-                const shared_ptr<Interval> chosen = _pt.find(unitRandom);
+                const Interval* chosen = _pt.sample(unitRandom);
                 // Now draw a radius from within selected interval
                 double radius, flux;
                 chosen->drawWithin(unitRandom, radius, flux);
@@ -444,7 +444,7 @@ namespace galsim {
                 } while (rsq>=1. || rsq==0.);
                 // Now rsq is unit deviate from 0 to 1
                 double unitRandom = rsq;
-                const shared_ptr<Interval> chosen = _pt.find(unitRandom);
+                const Interval* chosen = _pt.sample(unitRandom);
                 // Now draw a radius from within selected interval
                 double radius, flux;
                 chosen->drawWithin(unitRandom, radius, flux);
@@ -457,14 +457,14 @@ namespace galsim {
             for (int i=0; i<N; i++) {
                 // Simple 1d interpolation
                 double unitRandom = ud();
-                shared_ptr<Interval> chosen = _pt.find(unitRandom);
+                const Interval* chosen = _pt.sample(unitRandom);
                 // Now draw an x from within selected interval
                 double x, flux;
                 chosen->drawWithin(unitRandom, x, flux);
                 if (xandy) {
                     double y, flux2;
                     unitRandom = ud();
-                    chosen = _pt.find(unitRandom);
+                    chosen = _pt.sample(unitRandom);
                     chosen->drawWithin(unitRandom, y, flux2);
                     photons.setPhoton(i, x, y, flux*flux2*fluxPerPhoton);
                 } else {
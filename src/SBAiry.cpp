@@ -89,7 +89,8 @@ namespace galsim {
         xdbg<<"SBAiryImpl constructor: gsparams = "<<gsparams<<std::endl;
     }
 
-    LRUCache<Tuple<double, GSParamsPtr>, AiryInfo> SBAiry::SBAiryImpl::cache(sbp::max_airy_cache);
+    LRUCache<Tuple<double, GSParamsPtr>, AiryInfo> SBAiry::SBAiryImpl::cache(
+        sbp::max_airy_cache, "airy");
 
     // This is a scale-free version of the Airy radial function.
     // Input radius is in units of lambda/D.  Output normalized
@@ -68,7 +68,7 @@ namespace galsim {
     }
 
     LRUCache<GSParamsPtr, ExponentialInfo> SBExponential::SBExponentialImpl::cache(
-        sbp::max_exponential_cache);
+        sbp::max_exponential_cache, "exponential");
 
     SBExponential::SBExponentialImpl::SBExponentialImpl(
         double r0, double flux, const GSParams& gsparams) :
@@ -131,42 +131,42 @@ namespace galsim {
         dbg<<"SBGaussian fillXImage\n";
         dbg<<"x = "<<x0<<" + i * "<<dx<<", izero = "<<izero<<std::endl;
         dbg<<"y = "<<y0<<" + j * "<<dy<<", jzero = "<<jzero<<std::endl;
-        if (izero != 0 || jzero != 0) {
-            xdbg<<"Use Quadrant\n";
-            fillXImageQuadrant(im,x0,dx,izero,y0,dy,jzero);
-        } else {
-            xdbg<<"Non-Quadrant\n";
-            const int m = im.getNCol();
-            const int n = im.getNRow();
-            T* ptr = im.getData();
-            const int skip = im.getNSkip();
-            assert(im.getStep() == 1);
-
-            x0 *= _inv_sigma;
-            dx *= _inv_sigma;
-            y0 *= _inv_sigma;
-            dy *= _inv_sigma;
+        // Note: we don't use fillXImageQuadrant here even if izero or jzero are non-zero.
+        // The separable calculation below only needs m+n exponentials, which is much cheaper
+        // than the m*n/4 needed to fill a quadrant and reflect it.
+        const int m = im.getNCol();
+        const int n = im.getNRow();
+        T* ptr = im.getData();
+        const int skip = im.getNSkip();
+        assert(im.getStep() == 1);
 
-            // The Gaussian profile is separable:
-            //    im(x,y) = _norm * exp(-0.5 * (x*x + y*y)
-            //            = _norm * exp(-0.5 * x*x) * exp(-0.5 * y*y)
-            std::vector<double> gauss_x(m);
-            std::vector<double> gauss_y(n);
-            typedef std::vector<double>::iterator It;
-            It xit = gauss_x.begin();
-            for (int i=0; i<m; ++i,x0+=dx) *xit++ = fmath::expd(-0.5 * x0*x0);
+        x0 *= _inv_sigma;
+        dx *= _inv_sigma;
+        y0 *= _inv_sigma;
+        dy *= _inv_sigma;
 
-            if ((x0 == y0) && (dx == dy) && (m==n)) {
-                gauss_y = gauss_x;
-            } else {
-                It yit = gauss_y.begin();
-                for (int j=0; j<n; ++j,y0+=dy) *yit++ = fmath::expd(-0.5 * y0*y0);
-            }
+        // The Gaussian profile is separable:
+        //    im(x,y) = _norm * exp(-0.5 * (x*x + y*y)
+        //            = _norm * exp(-0.5 * x*x) * exp(-0.5 * y*y)
+        // So compute the row and column vectors and fill the image with their outer product.
+        std::vector<double> gauss_x(m);
+        std::vector<double> gauss_y(n);
+        typedef std::vector<double>::iterator It;
+        It xit = gauss_x.begin();
+        double x = x0;
+        for (int i=0; i<m; ++i,x+=dx) *xit++ = fmath::expd(-0.5 * x*x);
+
+        if ((x0 == y0) && (dx == dy) && (m==n)) {
+            gauss_y = gauss_x;
+        } else {
+            It yit = gauss_y.begin();
+            double y = y0;
+            for (int j=0; j<n; ++j,y+=dy) *yit++ = fmath::expd(-0.5 * y*y);
+        }
 
-            for (int j=0; j<n; ++j,ptr+=skip) {
-                for (int i=0; i<m; ++i)
-                    *ptr++ = _norm * gauss_x[i] * gauss_y[j];
-            }
+        for (int j=0; j<n; ++j,ptr+=skip) {
+            for (int i=0; i<m; ++i)
+                *ptr++ = _norm * gauss_x[i] * gauss_y[j];
         }
     }
 
@@ -659,11 +659,8 @@ namespace galsim {
         dbg<<"Target flux = "<<getFlux()<<std::endl;
         assert(N>=0);
         checkReadyToShoot();
-        /* The pixel coordinates are stored by cumulative absolute flux in
-         * a C++ standard-libary set, so the inversion is done with a binary
-         * search tree.  There are no doubt speed gains available from sorting the
-         * pixels by flux, and somehow weighting the tree search to the elements holding
-         * the most flux.  But I'm doing it the simplest way right now.
+        /* The pixels are stored in a ProbabilityTree, whose alias table lets us choose
+         * a pixel with probability proportional to its absolute flux in constant time.
          */
         assert(N>=0);
 
@@ -675,7 +672,7 @@ namespace galsim {
         dbg<<"fluxPerPhoton = "<<fluxPerPhoton<<std::endl;
         for (int i=0; i<N; ++i) {
             double unitRandom = ud();
-            const shared_ptr<Pixel> p = _pt.find(unitRandom);
+            const Pixel* p = _pt.sample(unitRandom);
             photons.setPhoton(i, p->x, p->y, p->isPositive ? fluxPerPhoton : -fluxPerPhoton);
         }
         dbg<<"photons.getTotalFlux = "<<photons.getTotalFlux()<<std::endl;
@@ -21,6 +21,7 @@
 
 #include "SBKolmogorov.h"
 #include "SBKolmogorovImpl.h"
+#include "DiskCache.h"
 #include "math/Bessel.h"
 #include "fmath/fmath.hpp"
 
@@ -65,7 +66,7 @@ namespace galsim {
     }
 
     LRUCache<GSParamsPtr, KolmogorovInfo> SBKolmogorov::SBKolmogorovImpl::cache(
-        sbp::max_kolmogorov_cache);
+        sbp::max_kolmogorov_cache, "kolmogorov");
 
     // The "magic" number 2.992934 below comes from the standard form of the Kolmogorov spectrum
     // from Racine, 1996 PASP, 108, 699 (who in turn is quoting Fried, 1966, JOSA, 56, 1372):
@@ -347,56 +348,68 @@ namespace galsim {
         _maxk = std::pow(-std::log(gsparams->kvalue_accuracy),3./5.);
         dbg<<"maxK = "<<_maxk<<std::endl;
 
-        // Build the table for the radial function.
-
-        // Start with f(0), which is analytic:
-        // According to Wolfram Alpha:
-        // Integrate[k*exp(-k^5/3),{k,0,infinity}] = 3/5 Gamma(6/5)
-        //    = 0.55090124543985636638457099311149824;
-        // The value we want is this / 2pi, which we define as XVAL_ZERO above.
-        double val = XVAL_ZERO;
-        _radial.addEntry(0.,val);
-        xdbg<<"f(0) = "<<val<<std::endl;
-
-        // We use a cubic spline for the interpolation, which has an error of O(h^4) max(f'''').
-        // I have no idea what range the fourth derivative can take for the f(r),
-        // so let's take the completely arbitrary value of 10.  (This value was found to be
-        // conservative for Sersic, but I haven't investigated here.)
-        // 10 h^4 <= xvalue_accuracy
-        // h = (xvalue_accuracy/10)^0.25
-        double dr = gsparams->table_spacing * sqrt(sqrt(gsparams->xvalue_accuracy / 10.));
-
-        // Along the way accumulate the flux integral to determine the radius
-        // that encloses (1-folding_threshold) of the flux.
-        double sum = 0.;
-        double thresh0 = 0.5 / (2.*M_PI*dr);
-        double thresh1 = (1.-gsparams->folding_threshold) / (2.*M_PI*dr);
-        double thresh2 = (1.-gsparams->folding_threshold/5.) / (2.*M_PI*dr);
-        double R = 0., hlr = 0.;
-        // Continue until accumulate 0.999 of the flux
-        KolmXValue xval_func(*gsparams);
-
-        for (double r = dr; sum < thresh2; r += dr) {
-            val = xval_func(r) / (2.*M_PI);
-            xdbg<<"f("<<r<<") = "<<val<<std::endl;
-            _radial.addEntry(r,val);
-
-            // Accumulate int(r*f(r)) / dr  (i.e. don't include 2*pi*dr factor as part of sum)
-            sum += r * val;
-            xdbg<<"sum = "<<sum<<"  thresh1 = "<<thresh1<<"  thesh2 = "<<thresh2<<std::endl;
-            xdbg<<"sum*2*pi*dr "<<sum*2.*M_PI*dr<<std::endl;
-            if (R == 0. && sum > thresh1) R = r;
-            if (hlr == 0. && sum > thresh0) hlr = r;
+        // Building the radial function is fairly slow, so check if it is in the on-disk
+        // cache first.
+        DiskCacheRecord record("kolmogorov", std::vector<double>(), *gsparams);
+        if (record.read()) {
+            _stepk = record.next();
+            record.next(_radial);
+        } else {
+            // Build the table for the radial function.
+
+            // Start with f(0), which is analytic:
+            // According to Wolfram Alpha:
+            // Integrate[k*exp(-k^5/3),{k,0,infinity}] = 3/5 Gamma(6/5)
+            //    = 0.55090124543985636638457099311149824;
+            // The value we want is this / 2pi, which we define as XVAL_ZERO above.
+            double val = XVAL_ZERO;
+            _radial.addEntry(0.,val);
+            xdbg<<"f(0) = "<<val<<std::endl;
+
+            // We use a cubic spline for the interpolation, which has an error of O(h^4) max(f'''').
+            // I have no idea what range the fourth derivative can take for the f(r),
+            // so let's take the completely arbitrary value of 10.  (This value was found to be
+            // conservative for Sersic, but I haven't investigated here.)
+            // 10 h^4 <= xvalue_accuracy
+            // h = (xvalue_accuracy/10)^0.25
+            double dr = gsparams->table_spacing * sqrt(sqrt(gsparams->xvalue_accuracy / 10.));
+
+            // Along the way accumulate the flux integral to determine the radius
+            // that encloses (1-folding_threshold) of the flux.
+            double sum = 0.;
+            double thresh0 = 0.5 / (2.*M_PI*dr);
+            double thresh1 = (1.-gsparams->folding_threshold) / (2.*M_PI*dr);
+            double thresh2 = (1.-gsparams->folding_threshold/5.) / (2.*M_PI*dr);
+            double R = 0., hlr = 0.;
+            // Continue until accumulate 0.999 of the flux
+            KolmXValue xval_func(*gsparams);
+
+            for (double r = dr; sum < thresh2; r += dr) {
+                val = xval_func(r) / (2.*M_PI);
+                xdbg<<"f("<<r<<") = "<<val<<std::endl;
+                _radial.addEntry(r,val);
+
+                // Accumulate int(r*f(r)) / dr  (i.e. don't include 2*pi*dr factor as part of sum)
+                sum += r * val;
+                xdbg<<"sum = "<<sum<<"  thresh1 = "<<thresh1<<"  thesh2 = "<<thresh2<<std::endl;
+                xdbg<<"sum*2*pi*dr "<<sum*2.*M_PI*dr<<std::endl;
+                if (R == 0. && sum > thresh1) R = r;
+                if (hlr == 0. && sum > thresh0) hlr = r;
+            }
+            _radial.finalize();
+            dbg<<"Done loop to build radial function.\n";
+            dbg<<"R = "<<R<<std::endl;
+            dbg<<"hlr = "<<hlr<<std::endl;
+            // Make sure it is at least 5 hlr
+            R = std::max(R,gsparams->stepk_minimum_hlr*hlr);
+            _stepk = M_PI / R;
+            dbg<<"stepk = "<<_stepk<<std::endl;
+            dbg<<"sum*2*pi*dr = "<<sum*2.*M_PI*dr<<"   (should ~= 0.999)\n";
+
+            record.add(_stepk);
+            record.add(_radial);
+            record.write();
         }
-        _radial.finalize();
-        dbg<<"Done loop to build radial function.\n";
-        dbg<<"R = "<<R<<std::endl;
-        dbg<<"hlr = "<<hlr<<std::endl;
-        // Make sure it is at least 5 hlr
-        R = std::max(R,gsparams->stepk_minimum_hlr*hlr);
-        _stepk = M_PI / R;
-        dbg<<"stepk = "<<_stepk<<std::endl;
-        dbg<<"sum*2*pi*dr = "<<sum*2.*M_PI*dr<<"   (should ~= 0.999)\n";
 
         // Next, set up the sampler for photon shooting
         std::vector<double> range(2,0.);
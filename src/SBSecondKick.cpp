@@ -21,6 +21,7 @@
 
 #include "SBSecondKick.h"
 #include "SBSecondKickImpl.h"
+#include "DiskCache.h"
 #include "SBVonKarmanImpl.h"
 #include "fmath/fmath.hpp"
 #include "Solve.h"
@@ -120,6 +121,21 @@ namespace galsim {
         _radial(Table::spline),
         _kvLUT(Table::spline)
     {
+        // Building the lookup tables is fairly slow, so check if they are in the on-disk
+        // cache first.
+        DiskCacheRecord record("secondkick", std::vector<double>(1, _kcrit), *_gsparams);
+        if (record.read()) {
+            _maxk = record.next();
+            _delta = record.next();
+            _stepk = record.next();
+            record.next(_kvLUT);
+            record.next(_radial);
+            std::vector<double> range(2,0.);
+            range[1] = _radial.argMax();
+            _sampler.reset(new OneDimensionalDeviate(_radial, range, true, *_gsparams));
+            return;
+        }
+
         // build the radial function
 #ifdef DEBUGLOGGING
         std::clock_t t0 = std::clock();
@@ -133,6 +149,13 @@ namespace galsim {
         _buildKVLUT();
         _buildRadial();
 #endif
+
+        record.add(_maxk);
+        record.add(_delta);
+        record.add(_stepk);
+        record.add(_kvLUT);
+        record.add(_radial);
+        record.write();
     }
 
     inline double pow4(double x) { double x2 = x*x; return x2*x2; }
@@ -417,7 +440,7 @@ namespace galsim {
     }
 
     LRUCache<Tuple<double,GSParamsPtr>,SKInfo>
-        SBSecondKick::SBSecondKickImpl::cache(sbp::max_SK_cache);
+        SBSecondKick::SBSecondKickImpl::cache(sbp::max_SK_cache, "secondkick");
 
     //
     //
@@ -21,6 +21,7 @@
 
 #include "SBSersic.h"
 #include "SBSersicImpl.h"
+#include "DiskCache.h"
 #include "integ/Int.h"
 #include "Solve.h"
 #include "math/Bessel.h"
@@ -88,7 +89,7 @@ namespace galsim {
     }
 
     LRUCache<Tuple<double, double, GSParamsPtr>, SersicInfo>
-        SBSersic::SBSersicImpl::cache(sbp::max_sersic_cache);
+        SBSersic::SBSersicImpl::cache(sbp::max_sersic_cache, "sersic");
 
     SBSersic::SBSersicImpl::SBSersicImpl(double n,  double scale_radius, double flux,
                                          double trunc, const GSParams& gsparams) :
@@ -412,6 +413,38 @@ namespace galsim {
     };
 
     void SersicInfo::buildFT() const
+    {
+        // The Hankel transform is fairly slow, so check if it is in the on-disk cache first.
+        std::vector<double> params(2);
+        params[0] = _n;
+        params[1] = _trunc;
+        DiskCacheRecord record("sersic", params, *_gsparams);
+        if (record.read()) {
+            _kderiv2 = record.next();
+            _kderiv4 = record.next();
+            _ksq_min = record.next();
+            _ksq_max = record.next();
+            _highk_a = record.next();
+            _highk_b = record.next();
+            _maxk = record.next();
+            record.next(_ft);
+            return;
+        }
+
+        calculateFT();
+
+        record.add(_kderiv2);
+        record.add(_kderiv4);
+        record.add(_ksq_min);
+        record.add(_ksq_max);
+        record.add(_highk_a);
+        record.add(_highk_b);
+        record.add(_maxk);
+        record.add(_ft);
+        record.write();
+    }
+
+    void SersicInfo::calculateFT() const
     {
         // The small-k expansion of the Hankel transform is (normalized to have flux=1):
         // 1 - Gamma(4n) / 4 Gamma(2n) + Gamma(6n) / 64 Gamma(2n) - Gamma(8n) / 2304 Gamma(2n)
@@ -77,7 +77,7 @@ namespace galsim {
     }
 
     LRUCache<Tuple<double,GSParamsPtr>,SpergelInfo> SBSpergel::SBSpergelImpl::cache(
-        sbp::max_spergel_cache);
+        sbp::max_spergel_cache, "spergel");
 
     SBSpergel::SBSpergelImpl::SBSpergelImpl(double nu, double scale_radius,
                                             double flux, const GSParams& gsparams) :
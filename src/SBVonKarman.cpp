@@ -21,6 +21,7 @@
 
 #include "SBVonKarman.h"
 #include "SBVonKarmanImpl.h"
+#include "DiskCache.h"
 #include "Solve.h"
 #include "math/Bessel.h"
 #include "math/Gamma.h"
@@ -134,33 +135,57 @@ namespace galsim {
         _doDelta(doDelta), _gsparams(gsparams),
         _radial(Table::spline)
     {
-        // determine maxK
-        // want kValue(maxK)/kValue(0.0) = _gsparams->maxk_threshold;
-        // note that kValue(0.0) = 1.
-        double mkt = _gsparams->maxk_threshold;
-        if (_doDelta) {
-            if (mkt < _delta) {
-                // If the delta function amplitude is too large, then no matter how far out in k we
-                // go, kValue never drops below that amplitude.
-                // _maxk = std::numeric_limits<double>::infinity();
-                _maxk = MOCK_INF;
-            } else {
-                mkt = mkt*(1.-_delta)+_delta;
+        // Building the radial function is fairly slow, so check if it is in the on-disk
+        // cache first.
+        std::vector<double> params(3);
+        params[0] = _lam;
+        params[1] = _L0;
+        params[2] = _doDelta;
+        DiskCacheRecord record("vonkarman", params, *_gsparams);
+        if (record.read()) {
+            _maxk = record.next();
+            _stepk = record.next();
+            _hlr = record.next();
+            record.next(_radial);
+        } else {
+            // determine maxK
+            // want kValue(maxK)/kValue(0.0) = _gsparams->maxk_threshold;
+            // note that kValue(0.0) = 1.
+            double mkt = _gsparams->maxk_threshold;
+            if (_doDelta) {
+                if (mkt < _delta) {
+                    // If the delta function amplitude is too large, then no matter how far out
+                    // in k we go, kValue never drops below that amplitude.
+                    // _maxk = std::numeric_limits<double>::infinity();
+                    _maxk = MOCK_INF;
+                } else {
+                    mkt = mkt*(1.-_delta)+_delta;
+                }
             }
+            if (_maxk != MOCK_INF) {
+                VKIkValueResid vkikvr(*this, mkt);
+                Solve<VKIkValueResid> solver(vkikvr, 0.1, 1);
+                solver.bracket();
+                solver.setMethod(Brent);
+                _maxk = solver.root();
+            }
+            dbg<<"_maxk = "<<_maxk<<" arcsec^-1\n";
+            dbg<<"SB(maxk) = "<<kValue(_maxk)<<'\n';
+            dbg<<"_delta = "<<_delta<<'\n';
+
+            // build the radial function, and along the way, set _stepk, _hlr.
+            _buildRadialFunc();
+
+            record.add(_maxk);
+            record.add(_stepk);
+            record.add(_hlr);
+            record.add(_radial);
+            record.write();
         }
-        if (_maxk != MOCK_INF) {
-            VKIkValueResid vkikvr(*this, mkt);
-            Solve<VKIkValueResid> solver(vkikvr, 0.1, 1);
-            solver.bracket();
-            solver.setMethod(Brent);
-            _maxk = solver.root();
-        }
-        dbg<<"_maxk = "<<_maxk<<" arcsec^-1\n";
-        dbg<<"SB(maxk) = "<<kValue(_maxk)<<'\n';
-        dbg<<"_delta = "<<_delta<<'\n';
 
-        // build the radial function, and along the way, set _stepk, _hlr.
-        _buildRadialFunc();
+        std::vector<double> range(2, 0.);
+        range[1] = _radial.argMax();
+        _sampler.reset(new OneDimensionalDeviate(_radial, range, true, *_gsparams));
     }
 
     double vkStructureFunction(double rho, double L0, double L0_invcuberoot, double L053) {
@@ -314,10 +339,6 @@ namespace galsim {
         dbg<<"sum = "<<sum<<"   (should be > 0.995)\n";
         if (sum < 1-_gsparams->folding_threshold)
             throw SBError("Could not determine appropriate stepk, given folding_threshold");
-
-        std::vector<double> range(2, 0.);
-        range[1] = _radial.argMax();
-        _sampler.reset(new OneDimensionalDeviate(_radial, range, true, *_gsparams));
     }
 
     void VonKarmanInfo::shoot(PhotonArray& photons, UniformDeviate ud) const
@@ -327,7 +348,7 @@ namespace galsim {
     }
 
     LRUCache<Tuple<double,double,bool,GSParamsPtr>,VonKarmanInfo>
-        SBVonKarman::SBVonKarmanImpl::cache(sbp::max_vonKarman_cache);
+        SBVonKarman::SBVonKarmanImpl::cache(sbp::max_vonKarman_cache, "vonkarman");
 
     //
     //
@@ -1260,6 +1260,313 @@ def test_analytic_integrator():
                          integrator=galsim.integ.SampleIntegrator(rule=galsim.integ.trapzRule))
 
 
+@timer
+def test_accumulating_integrator():
+    """Test that the integrators using midptRule or trapzRule, which accumulate the draws at each
+    wavelength into a single image, match the result of drawing each wavelength separately.
+    """
+    psf = galsim.ChromaticObject(galsim.Moffat(fwhm=1.0, beta=2.7)).dilate(lambda w:(w/500)**1.1)
+    sed = galsim.SED('wave**1.1', wave_type='nm', flux_type='fphotons').withFluxDensity(1.0, 500)
+    bandpass = galsim.Bandpass('1', 'nm', blue_limit=500, red_limit=750)
+    final = galsim.Convolve(galsim.Gaussian(fwhm=1.0) * sed, psf)
+
+    for rule in [galsim.integ.midptRule, galsim.integ.trapzRule]:
+        # Any other rule gets the original implementation, which draws onto a new image for each
+        # wavelength.
+        other_rule = lambda f, xs: rule(f, xs)
+        for cls in [galsim.integ.ContinuousIntegrator, galsim.integ.SampleIntegrator]:
+            if cls is galsim.integ.ContinuousIntegrator:
+                integrator = cls(rule, N=20)
+                other = cls(other_rule, N=20)
+                bp = bandpass
+            else:
+                integrator = cls(rule)
+                other = cls(other_rule)
+                bp = galsim.Bandpass(galsim.LookupTable([500, 520, 600, 690, 750],
+                                                        [0.1, 0.4, 0.6, 0.5, 0.]), 'nm')
+            im1 = final.drawImage(bp, nx=32, ny=32, scale=0.2, dtype=float,
+                                  integrator=integrator)
+            im2 = final.drawImage(bp, nx=32, ny=32, scale=0.2, dtype=float,
+                                  integrator=other)
+            assert integrator.last_n_eval == other.last_n_eval
+            np.testing.assert_allclose(im1.array, im2.array, rtol=1.e-6,
+                                       atol=1.e-8 * im2.array.max())
+
+            # add_to_image and other drawImage kwargs are respected.
+            im1 = final.drawImage(bp, image=im1, integrator=integrator, add_to_image=True,
+                                  method='no_pixel', offset=(0.3,-0.2))
+            im2 = final.drawImage(bp, image=im2, integrator=other, add_to_image=True,
+                                  method='no_pixel', offset=(0.3,-0.2))
+            np.testing.assert_allclose(im1.array, im2.array, rtol=1.e-6,
+                                       atol=1.e-8 * im2.array.max())
+
+            # Also drawKImage
+            kim1 = final.drawKImage(bp, nx=32, ny=32, scale=0.5, integrator=integrator)
+            kim2 = final.drawKImage(bp, nx=32, ny=32, scale=0.5, integrator=other)
+            assert kim1.bounds == kim2.bounds
+            np.testing.assert_allclose(kim1.array, kim2.array, rtol=1.e-6,
+                                       atol=1.e-8 * np.abs(kim2.array).max())
+
+            # Photon shooting scales the images rather than the profiles, so the noise is the same.
+            im1 = final.drawImage(bp, nx=32, ny=32, scale=0.2, dtype=float,
+                                  integrator=integrator, method='phot', rng=galsim.BaseDeviate(1234))
+            im2 = final.drawImage(bp, nx=32, ny=32, scale=0.2, dtype=float,
+                                  integrator=other, method='phot', rng=galsim.BaseDeviate(1234))
+            np.testing.assert_allclose(im1.array, im2.array, rtol=1.e-6,
+                                       atol=1.e-8 * im2.array.max())
+
+
+@timer
+def test_single_fft_integrator():
+    """Test the integrators with single_fft=True, which draw the integral as a single profile.
+    """
+    bandpass = galsim.Bandpass('LSST_r.dat', 'nm').thin(1.e-3)
+    psf = galsim.ChromaticAtmosphere(galsim.Kolmogorov(fwhm=0.7), 500.,
+                                     zenith_angle=30*galsim.degrees)
+    sed = galsim.SED('CWW_E_ext.sed', 'A', 'flambda').withFlux(1., bandpass)
+    final = galsim.Convolve(galsim.Exponential(half_light_radius=0.5) * sed, psf)
+
+    for rule in [galsim.integ.midptRule, galsim.integ.trapzRule]:
+        for integrator, single in [
+                (galsim.integ.ContinuousIntegrator(rule, N=50),
+                 galsim.integ.ContinuousIntegrator(rule, N=50, single_fft=True)),
+                (galsim.integ.SampleIntegrator(rule),
+                 galsim.integ.SampleIntegrator(rule, single_fft=True)) ]:
+            im1 = final.drawImage(bandpass, nx=48, ny=48, scale=0.2, dtype=float,
+                                  integrator=integrator)
+            im2 = final.drawImage(bandpass, nx=48, ny=48, scale=0.2, dtype=float,
+                                  integrator=single)
+            assert integrator.last_n_eval == single.last_n_eval
+            np.testing.assert_allclose(im2.array, im1.array, atol=1.e-5 * im1.array.max())
+
+            im1 = final.drawImage(bandpass, image=im1, integrator=integrator, add_to_image=True,
+                                  offset=(0.3,-0.2))
+            im2 = final.drawImage(bandpass, image=im2, integrator=single, add_to_image=True,
+                                  offset=(0.3,-0.2))
+            np.testing.assert_allclose(im2.array, im1.array, atol=1.e-5 * im1.array.max())
+
+            kim1 = final.drawKImage(bandpass, nx=32, ny=32, scale=0.5, integrator=integrator)
+            kim2 = final.drawKImage(bandpass, nx=32, ny=32, scale=0.5, integrator=single)
+            np.testing.assert_allclose(kim2.array, kim1.array,
+                                       atol=1.e-5 * np.abs(kim1.array).max())
+
+    # Only the linear rules are allowed.
+    assert_raises(ValueError, galsim.integ.SampleIntegrator, np.trapz, single_fft=True)
+    assert_raises(ValueError, galsim.integ.ContinuousIntegrator, np.trapz, single_fft=True)
+
+
+@timer
+def test_adaptive_integrator():
+    """Test the AdaptiveIntegrator, which refines the wavelength sampling only where needed.
+    """
+    psf = galsim.ChromaticObject(galsim.Moffat(fwhm=1.0, beta=2.7)).dilate(lambda w:(w/500)**1.1)
+    sed = galsim.SED('wave**1.1', wave_type='nm', flux_type='fphotons').withFluxDensity(1.0, 500)
+    bandpass = galsim.Bandpass('1', 'nm', blue_limit=500, red_limit=750)
+    final = galsim.Convolve(galsim.Gaussian(fwhm=1.0) * sed, psf)
+
+    ref_integrator = galsim.integ.ContinuousIntegrator(galsim.integ.trapzRule, N=250)
+    ref = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float,
+                          integrator=ref_integrator)
+    kref = final.drawKImage(bandpass, nx=32, ny=32, scale=0.5, integrator=ref_integrator)
+    for rel_err in [1.e-3, 1.e-5]:
+        integrator = galsim.integ.AdaptiveIntegrator(rel_err=rel_err)
+        im = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float,
+                             integrator=integrator)
+        # This profile is very smooth in wavelength, so it needs far fewer samples.
+        assert integrator.last_n_eval < 50
+        np.testing.assert_allclose(im.array, ref.array, atol=rel_err * ref.array.max())
+        kim = final.drawKImage(bandpass, nx=32, ny=32, scale=0.5, integrator=integrator)
+        np.testing.assert_allclose(kim.array, kref.array, atol=rel_err * np.abs(kref.array).max())
+
+    # With a tabulated bandpass and a more complicated SED, it needs more samples, but still
+    # fewer than the SampleIntegrator.
+    bandpass = galsim.Bandpass('LSST_r.dat', 'nm').thin(1.e-3)
+    sed = galsim.SED('CWW_E_ext.sed', 'A', 'flambda').withFlux(1., bandpass)
+    final = galsim.Convolve(galsim.Exponential(half_light_radius=0.5) * sed, psf)
+    sample_integrator = galsim.integ.SampleIntegrator(galsim.integ.trapzRule)
+    ref = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float,
+                          integrator=sample_integrator)
+    integrator = galsim.integ.AdaptiveIntegrator(rel_err=1.e-3)
+    im = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float, integrator=integrator)
+    print(integrator.last_n_eval, sample_integrator.last_n_eval)
+    assert integrator.last_n_eval < sample_integrator.last_n_eval
+    np.testing.assert_allclose(im.array, ref.array, atol=1.e-3 * ref.array.max())
+
+    # add_to_image works.
+    im = final.drawImage(bandpass, image=im, integrator=integrator, add_to_image=True)
+    np.testing.assert_allclose(im.array, 2*ref.array, atol=2.e-3 * ref.array.max())
+
+    # max_n_eval limits the number of evaluations.
+    integrator = galsim.integ.AdaptiveIntegrator(rel_err=1.e-8, N=4, max_n_eval=20)
+    im = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float, integrator=integrator)
+    assert integrator.last_n_eval <= 20
+    np.testing.assert_allclose(im.array, ref.array, atol=3.e-2 * ref.array.max())
+
+    assert_raises(ValueError, galsim.integ.AdaptiveIntegrator, rel_err=0.)
+    assert_raises(ValueError, galsim.integ.AdaptiveIntegrator, N=0)
+    assert_raises(ValueError, galsim.integ.AdaptiveIntegrator, N=8, max_n_eval=16)
+
+
+@timer
+def test_psf_basis():
+    """Test drawing ChromaticConvolutions with psf_basis=True, which forms the effective PSF for
+    each SED from PSF images at fixed wavelengths.
+    """
+    bandpass = galsim.Bandpass('LSST_r.dat', 'nm').thin(1.e-3)
+    psf = galsim.ChromaticAtmosphere(galsim.Kolmogorov(fwhm=0.7), 500.,
+                                     zenith_angle=30*galsim.degrees)
+    seds = [ galsim.SED(name, 'A', 'flambda').withFlux(1., bandpass).atRedshift(z)
+             for name in ['CWW_E_ext.sed', 'CWW_Im_ext.sed'] for z in [0.2, 0.8] ]
+    gal = galsim.Exponential(half_light_radius=0.5)
+
+    # The cache is initially filled with placeholders, which don't use tuples as keys.
+    def n_basis_cached():
+        return len([k for k in galsim.ChromaticConvolution._psf_basis_cache.cache
+                    if isinstance(k, tuple)])
+
+    # With the same integrator, it matches the usual calculation.
+    integrator = galsim.integ.ContinuousIntegrator(galsim.integ.midptRule, N=60)
+    galsim.ChromaticConvolution.resize_psf_basis_cache(3)
+    assert galsim.utilities.cache_stats()['psf_basis']['maxsize'] == 3
+    galsim.utilities.set_cache_size('psf_basis', 10)
+    assert galsim.ChromaticConvolution._psf_basis_cache.stats()['maxsize'] == 10
+    for sed in seds:
+        final = galsim.Convolve(gal * sed, psf)
+        im1 = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float,
+                              integrator=integrator)
+        im2 = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float,
+                              integrator=integrator, psf_basis=True)
+        np.testing.assert_allclose(im2.array, im1.array, atol=1.e-6 * im1.array.max())
+    # The PSF images were only made once.
+    assert n_basis_cached() == 1
+
+    # By default, it uses 250 wavelengths, which are needed to sample the SEDs.
+    for sed in seds:
+        final = galsim.Convolve(gal * sed, psf)
+        im1 = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float)
+        im2 = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float, psf_basis=True)
+        np.testing.assert_allclose(im2.array, im1.array, atol=2.e-3 * im1.array.max())
+    assert n_basis_cached() == 2
+
+    # Bulge + disk galaxies are split up into each component.
+    bdgal = gal * seds[0] + galsim.DeVaucouleurs(half_light_radius=0.2) * seds[2]
+    final = galsim.Convolve(bdgal, psf)
+    im1 = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float,
+                          integrator=integrator)
+    im2 = final.drawImage(bandpass, nx=32, ny=32, scale=0.2, dtype=float,
+                          integrator=integrator, psf_basis=True)
+    np.testing.assert_allclose(im2.array, im1.array, atol=1.e-6 * im1.array.max())
+    assert n_basis_cached() == 2
+
+    # The integrator needs to use fixed weights.
+    assert_raises(galsim.GalSimIncompatibleValuesError, final.drawImage, bandpass,
+                  integrator=galsim.integ.AdaptiveIntegrator(), psf_basis=True)
+    assert_raises(galsim.GalSimIncompatibleValuesError, final.drawImage, bandpass,
+                  integrator=galsim.integ.ContinuousIntegrator(np.trapz), psf_basis=True)
+
+
+@timer
+def test_chromatic_phot():
+    """Test drawing chromatic objects with photon shooting, drawing the wavelengths first.
+    """
+    bandpass = galsim.Bandpass(os.path.join(bppath, 'LSST_g.dat'), 'nm').thin(1.e-3)
+    sed = galsim.SED(os.path.join(sedpath, 'CWW_E_ext.sed'), 'A', 'flambda')
+    sed = sed.withFlux(2.e5, bandpass)
+    psf = galsim.ChromaticAtmosphere(galsim.Kolmogorov(fwhm=0.7), base_wavelength=500,
+                                     zenith_angle=50*galsim.degrees)
+    gal = galsim.Exponential(half_light_radius=0.3) * sed
+    obj = galsim.Convolve(gal, psf)
+
+    class Recorder(object):
+        def __init__(self):
+            self.waves = []
+        def applyTo(self, photon_array, local_wcs=None):
+            self.waves.append(photon_array.wavelength.copy())
+
+    im1 = obj.drawImage(bandpass, nx=64, ny=64, scale=0.2)
+    recorder = Recorder()
+    im2 = obj.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot', chromatic_phot=True,
+                        rng=galsim.BaseDeviate(1234), surface_ops=[recorder])
+    assert obj._last_n_eval == 100
+    np.testing.assert_allclose(im2.array.sum(), im1.array.sum(), rtol=1.e-2)
+    np.testing.assert_allclose(im2.added_flux, im2.array.sum(), rtol=1.e-4)
+
+    # The DCR shift and the size match the integrated image.
+    mom1 = im1.FindAdaptiveMom()
+    mom2 = im2.FindAdaptiveMom()
+    np.testing.assert_allclose(mom2.moments_centroid.x, mom1.moments_centroid.x, atol=0.03)
+    np.testing.assert_allclose(mom2.moments_centroid.y, mom1.moments_centroid.y, atol=0.03)
+    np.testing.assert_allclose(mom2.moments_sigma, mom1.moments_sigma, rtol=3.e-3)
+
+    # The photons have wavelengths drawn from the SED times the bandpass.
+    waves = np.concatenate(recorder.waves)
+    np.testing.assert_allclose(len(waves), sed.calculateFlux(bandpass), rtol=1.e-2)
+    assert np.min(waves) >= bandpass.blue_limit
+    assert np.max(waves) <= bandpass.red_limit
+    w = np.linspace(bandpass.blue_limit, bandpass.red_limit, 1001)
+    mean_wave = np.trapz(w * sed(w) * bandpass(w), w) / np.trapz(sed(w) * bandpass(w), w)
+    np.testing.assert_allclose(np.mean(waves), mean_wave, atol=0.2)
+
+    # Same rng gives the same image.  Fewer bins give nearly the same image.
+    im3 = obj.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot', chromatic_phot=True,
+                        rng=galsim.BaseDeviate(1234))
+    np.testing.assert_array_equal(im3.array, im2.array)
+    im3 = obj.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot', chromatic_phot=True,
+                        n_wave_bins=10, rng=galsim.BaseDeviate(1234), n_photons=1.e5)
+    assert obj._last_n_eval == 10
+    np.testing.assert_allclose(im3.array.sum(), im1.array.sum(), rtol=1.e-2)
+    mom3 = im3.FindAdaptiveMom()
+    np.testing.assert_allclose(mom3.moments_centroid.y, mom1.moments_centroid.y, atol=0.03)
+    np.testing.assert_allclose(mom3.moments_sigma, mom1.moments_sigma, rtol=5.e-3)
+
+    # Separable profiles only need one bin, and don't evaluate the profile at any wavelengths.
+    recorder = Recorder()
+    im4 = gal.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot', chromatic_phot=True,
+                        rng=galsim.BaseDeviate(1234), surface_ops=[recorder])
+    assert gal._last_n_eval == 0
+    np.testing.assert_allclose(im4.array.sum(), sed.calculateFlux(bandpass), rtol=1.e-2)
+    np.testing.assert_allclose(np.mean(np.concatenate(recorder.waves)), mean_wave, atol=0.2)
+
+    # add_to_image
+    im4b = gal.drawImage(bandpass, image=im4.copy(), method='phot', chromatic_phot=True,
+                         add_to_image=True, rng=galsim.BaseDeviate(1234))
+    np.testing.assert_allclose(im4b.array, 2*im4.array, rtol=2.e-4)
+
+    # Without chromatic_phot, method='phot' integrates images drawn with photon shooting at each
+    # wavelength, the same as with an explicit integrator.
+    integrator = galsim.integ.SampleIntegrator(galsim.integ.trapzRule)
+    im5 = obj.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot', integrator=integrator,
+                        rng=galsim.BaseDeviate(1234))
+    im6 = obj.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot',
+                        rng=galsim.BaseDeviate(1234))
+    np.testing.assert_array_equal(im6.array, im5.array)
+    np.testing.assert_allclose(im5.array.sum(), im1.array.sum(), rtol=1.e-2)
+    # The DCR in 100 bins matches it within the noise.
+    mom5 = im5.FindAdaptiveMom()
+    np.testing.assert_allclose(mom2.moments_centroid.x, mom5.moments_centroid.x, atol=0.03)
+    np.testing.assert_allclose(mom2.moments_centroid.y, mom5.moments_centroid.y, atol=0.03)
+    np.testing.assert_allclose(mom2.moments_sigma, mom5.moments_sigma, rtol=5.e-3)
+    im6 = gal.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot',
+                        rng=galsim.BaseDeviate(1234))
+    np.testing.assert_allclose(im6.array.sum(), sed.calculateFlux(bandpass), rtol=1.e-2)
+
+    # chromatic_phot also works for interpolated objects.
+    interp = obj.interpolate(np.linspace(bandpass.blue_limit, bandpass.red_limit, 10))
+    for interp_obj in [interp, interp.shift(0.2, 0.)]:
+        im7 = interp_obj.drawImage(bandpass, nx=64, ny=64, scale=0.2, method='phot',
+                                   chromatic_phot=True, n_wave_bins=10,
+                                   rng=galsim.BaseDeviate(1234), n_photons=1.e5)
+        assert interp_obj._last_n_eval == 10
+        np.testing.assert_allclose(im7.array.sum(), im1.array.sum(), rtol=1.e-2)
+
+    assert_raises(galsim.GalSimRangeError, obj.drawImage, bandpass, method='phot',
+                  chromatic_phot=True, n_wave_bins=0)
+    assert_raises(galsim.GalSimIncompatibleValuesError, obj.drawImage, bandpass,
+                  chromatic_phot=True)
+    assert_raises(galsim.GalSimIncompatibleValuesError, gal.drawImage, bandpass, method='fft',
+                  chromatic_phot=True)
+
+
 @timer
 def test_gsparams():
     """Check that gsparams actually gets processed by ChromaticObjects.
@@ -1716,6 +2023,119 @@ def test_interpolated_ChromaticObject():
     assert not hasattr(trans_interp_psf, 'waves')
 
 
+@timer
+def test_interpolated_nproc_cache():
+    """Test building an InterpolatedChromaticObject with multiple processes or from a cache file.
+    """
+    from galsim._pyfits import pyfits
+    psf = galsim.ChromaticAtmosphere(galsim.Kolmogorov(fwhm=0.7), 500.,
+                                     zenith_angle=30*galsim.degrees)
+    waves = np.linspace(500., 1000., 8)
+    interp1 = psf.interpolate(waves)
+    interp2 = psf.interpolate(waves, nproc=2)
+    assert interp2 == interp1
+    np.testing.assert_array_equal(interp2.stepk_vals, interp1.stepk_vals)
+    np.testing.assert_array_equal(interp2.maxk_vals, interp1.maxk_vals)
+    np.testing.assert_array_equal(interp2.fluxes, interp1.fluxes)
+    for im1, im2 in zip(interp1.ims, interp2.ims):
+        assert im2 == im1
+
+    # The first time, the cache file is written.
+    file_name = os.path.join('output', 'interpolated_cache.fits')
+    if os.path.isfile(file_name):
+        os.remove(file_name)
+    interp3 = psf.interpolate(waves, cache_file=file_name)
+    assert os.path.isfile(file_name)
+    for im1, im3 in zip(interp1.ims, interp3.ims):
+        assert im3 == im1
+
+    # Subsequently it is read from the file.  Check this by changing the images in the file.
+    with pyfits.open(file_name) as hdu_list:
+        hdu_list[0].data *= 2
+        hdu_list.writeto(file_name, overwrite=True)
+    interp4 = psf.interpolate(waves, cache_file=file_name, nproc=-1)
+    for im1, im4 in zip(interp1.ims, interp4.ims):
+        np.testing.assert_array_equal(im4.array, 2*im1.array)
+        assert im4.wcs == im1.wcs
+        assert im4.bounds == im1.bounds
+    np.testing.assert_array_equal(interp4.stepk_vals, interp1.stepk_vals)
+    np.testing.assert_array_equal(interp4.maxk_vals, interp1.maxk_vals)
+    np.testing.assert_array_equal(interp4.fluxes, interp1.fluxes)
+
+    # The file is not used for a different object, wavelengths or oversampling.  It is replaced.
+    interp5 = psf.interpolate(waves, cache_file=file_name, oversample_fac=1.5)
+    assert interp5 != interp1
+    interp6 = psf.interpolate(waves, cache_file=file_name)
+    for im1, im6 in zip(interp1.ims, interp6.ims):
+        assert im6 == im1
+
+    # The key identifying the file depends on all the array data and the GalSim version.
+    im1 = galsim.Image(np.ones((64,64)), scale=0.2)
+    im2 = im1.copy()
+    im2.array[30,31] = 2.
+    sed = galsim.SED('CWW_E_ext.sed', 'A', 'flambda')
+    key1 = (galsim.InterpolatedImage(im1) * sed).interpolate(waves)._cache_key()
+    key2 = (galsim.InterpolatedImage(im2) * sed).interpolate(waves)._cache_key()
+    assert key1 != key2
+    assert (galsim.InterpolatedImage(im1.copy()) * sed).interpolate(waves)._cache_key() == key1
+    key = interp1._cache_key()
+    version = galsim._version.__version__
+    try:
+        galsim._version.__version__ = '0.1'
+        assert interp1._cache_key() != key
+    finally:
+        galsim._version.__version__ = version
+    assert interp1._cache_key() == key
+
+    # Drawing works the same way.
+    bandpass = galsim.Bandpass('LSST_r.dat', 'nm').thin(1.e-3)
+    sed = galsim.SED('CWW_E_ext.sed', 'A', 'flambda').withFlux(1., bandpass)
+    gal = galsim.Exponential(half_light_radius=0.5) * sed
+    im1 = galsim.Convolve(gal, interp1).drawImage(bandpass, nx=32, ny=32, scale=0.2)
+    im6 = galsim.Convolve(gal, interp6).drawImage(bandpass, nx=32, ny=32, scale=0.2)
+    np.testing.assert_array_equal(im6.array, im1.array)
+
+
+class CountingKolmogorov(galsim.Kolmogorov):
+    # A Kolmogorov that counts how many times it is unpickled in this process.
+    n_unpickle = 0
+    def __setstate__(self, d):
+        CountingKolmogorov.n_unpickle += 1
+        super(CountingKolmogorov, self).__setstate__(d)
+
+
+class CountingChromaticAtmosphere(galsim.ChromaticAtmosphere):
+    # A ChromaticAtmosphere that counts how many times it is evaluated in this process.
+    n_eval = 0
+    def evaluateAtWavelength(self, wave):
+        CountingChromaticAtmosphere.n_eval += 1
+        return super(CountingChromaticAtmosphere, self).evaluateAtWavelength(wave)
+
+
+@timer
+def test_interpolated_nproc_parent():
+    """Test that building an InterpolatedChromaticObject with multiple processes does not
+    evaluate the profiles in the parent process.
+    """
+    psf = CountingChromaticAtmosphere(CountingKolmogorov(fwhm=0.7), 500.,
+                                      zenith_angle=30*galsim.degrees)
+    waves = np.linspace(500., 1000., 6)
+    CountingChromaticAtmosphere.n_eval = 0
+    interp1 = psf.interpolate(waves)
+    assert CountingChromaticAtmosphere.n_eval == len(waves)
+
+    # With nproc > 1, the profiles are neither evaluated in the parent process nor sent back to
+    # it from the workers.
+    CountingChromaticAtmosphere.n_eval = 0
+    CountingKolmogorov.n_unpickle = 0
+    interp2 = psf.interpolate(waves, nproc=2)
+    assert CountingChromaticAtmosphere.n_eval == 0
+    assert CountingKolmogorov.n_unpickle == 0
+    assert interp2 == interp1
+    for im1, im2 in zip(interp1.ims, interp2.ims):
+        assert im2 == im1
+
+
 @timer
 def test_ChromaticOpticalPSF():
     """Test the ChromaticOpticalPSF functionality."""
@@ -2503,10 +2923,17 @@ if __name__ == "__main__":
     test_ChromaticObject_shift()
     test_ChromaticObject_compound_affine_transformation()
     test_analytic_integrator()
+    test_accumulating_integrator()
+    test_single_fft_integrator()
+    test_adaptive_integrator()
+    test_psf_basis()
+    test_chromatic_phot()
     test_gsparams()
     test_separable_ChromaticSum()
     test_centroid()
     test_interpolated_ChromaticObject()
+    test_interpolated_nproc_cache()
+    test_interpolated_nproc_parent()
     test_ChromaticOpticalPSF()
     test_ChromaticAiry()
     test_chromatic_fiducial_wavelength()
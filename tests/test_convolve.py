@@ -652,7 +652,7 @@ def test_autoconvolve():
     np.testing.assert_almost_equal(autoconv.flux, add.flux**2)
     np.testing.assert_array_less(autoconv.xValue(cen), autoconv.max_sb)
 
-    check_basic(autoconv, "AutoConvolve(asym)")
+    check_basic(autoconv, "AutoConvolve(asym)", approx_maxsb=True)
 
     # Should raise an exception for invalid arguments
     assert_raises(TypeError, galsim.AutoConvolve)
@@ -695,7 +695,7 @@ def test_autocorrelate():
             err_msg="Asymmetric sum of Gaussians convolved with mirror of self disagrees with "+
             "AutoCorrelate result")
 
-    check_basic(conv, "AutoCorrelate")
+    check_basic(conv, "AutoCorrelate", approx_maxsb=True)
 
     # Test photon shooting.
     do_shoot(corr,myImg2,"AutoCorrelate")
@@ -997,6 +997,302 @@ def test_gsparams():
     assert conv6.obj_list[1].orig_obj.gsparams == galsim.GSParams()
 
 
+@timer
+def test_cache_kimage():
+    """Test the cache_kimage option of Convolution.
+    """
+    psf = galsim.Moffat(beta=2.5, fwhm=0.9).shear(g1=0.05, g2=-0.03)
+    gal1 = galsim.Sersic(n=1.7, half_light_radius=1.1, flux=100).shear(g1=0.2, g2=0.1)
+    gal2 = galsim.Exponential(half_light_radius=0.7, flux=30).shift(0.1, -0.2)
+
+    for gal in [gal1, gal2]:
+        conv = galsim.Convolve([gal, psf])
+        cconv = galsim.Convolve([gal, psf], cache_kimage=[psf])
+        assert cconv.cache_kimage == [psf]
+        assert conv.cache_kimage == []
+        # The cache is just an efficiency option, so it doesn't change the profile.
+        assert cconv == conv
+        assert hash(cconv) == hash(conv)
+        do_pickle(cconv)
+
+        for wcs in [galsim.PixelScale(0.2), galsim.JacobianWCS(0.21, 0.03, -0.02, 0.19)]:
+            im1 = conv.drawImage(nx=48, ny=48, wcs=wcs, offset=(0.3, -0.2))
+            # Draw twice, so the second one uses the cached psf.
+            im2 = cconv.drawImage(nx=48, ny=48, wcs=wcs, offset=(0.3, -0.2))
+            im3 = cconv.drawImage(nx=48, ny=48, wcs=wcs, offset=(0.3, -0.2))
+            np.testing.assert_allclose(im2.array, im1.array, rtol=1.e-5, atol=1.e-5 * gal.flux,
+                                       err_msg="cache_kimage changed the drawn image")
+            np.testing.assert_array_equal(im3.array, im2.array)
+            np.testing.assert_allclose(im2.added_flux, im1.added_flux, rtol=1.e-5)
+
+            # The cache should hold the psf, but not the galaxy.
+            keys = [k for k in galsim.Convolution._kimage_cache.cache if isinstance(k, tuple)]
+            assert wcs.toImage(psf) in [k[0] for k in keys]
+            assert not any(k[0].original == gal.original for k in keys)
+
+        # Also works if the cached object is first, or with method='no_pixel'.
+        cconv = galsim.Convolve([psf, gal], cache_kimage=[psf])
+        im1 = conv.drawImage(nx=48, ny=48, scale=0.2, method='no_pixel')
+        im2 = cconv.drawImage(nx=48, ny=48, scale=0.2, method='no_pixel')
+        np.testing.assert_allclose(im2.array, im1.array, rtol=1.e-5, atol=1.e-5 * gal.flux)
+
+        # With the psf first, the offsets go with the galaxy, so the psf is still cached.
+        hits = galsim.Convolution._kimage_cache.hits
+        misses = galsim.Convolution._kimage_cache.misses
+        for offset in [(0.1,0.2), (-0.3,0.4), (0.2,-0.1), (0.45,0.05), (0,-0.5)]:
+            im1 = conv.drawImage(nx=48, ny=48, scale=0.2, offset=offset)
+            im2 = cconv.drawImage(nx=48, ny=48, scale=0.2, offset=offset)
+            np.testing.assert_allclose(im2.array, im1.array, rtol=1.e-5, atol=1.e-5 * gal.flux)
+        assert galsim.Convolution._kimage_cache.misses - misses <= 1
+        assert galsim.Convolution._kimage_cache.hits - hits >= 4
+
+    # withGSParams keeps the cache settings.
+    gsp = galsim.GSParams(folding_threshold=1.e-3)
+    cconv = galsim.Convolve([gal1, psf], cache_kimage=[psf]).withGSParams(gsp)
+    assert cconv.cache_kimage == [psf.withGSParams(gsp)]
+
+    assert_raises(galsim.GalSimValueError, galsim.Convolve, gal1, psf, cache_kimage=[gal2])
+
+
+@timer
+def test_compile():
+    """Test that compile() gives equivalent, simpler profiles.
+    """
+    def check_equiv(obj1, obj2):
+        np.testing.assert_allclose(obj2.flux, obj1.flux, rtol=1.e-12)
+        np.testing.assert_allclose(obj2.centroid.x, obj1.centroid.x, rtol=1.e-10, atol=1.e-12)
+        np.testing.assert_allclose(obj2.centroid.y, obj1.centroid.y, rtol=1.e-10, atol=1.e-12)
+        for kx, ky in [(0.,0.), (0.3,0.2), (1.,-2.), (-3.,1.5), (2.,7.)]:
+            np.testing.assert_allclose(obj2.kValue(kx,ky), obj1.kValue(kx,ky),
+                                       rtol=1.e-10, atol=1.e-13)
+        im1 = obj1.drawImage(nx=32, ny=32, scale=0.2, method='no_pixel')
+        im2 = obj2.drawImage(nx=32, ny=32, scale=0.2, method='no_pixel')
+        np.testing.assert_allclose(im2.array, im1.array, rtol=1.e-4, atol=1.e-5*im1.array.max())
+
+    # Simple objects compile to themselves.
+    gauss = galsim.Gaussian(sigma=0.5, flux=3)
+    exp = galsim.Exponential(half_light_radius=0.7, flux=1.7)
+    assert gauss.compile() is gauss
+    assert exp.compile() is exp
+
+    # Trivial transformations are removed, and transformed Gaussians become Gaussians if possible.
+    assert galsim.Transformation(exp).compile() is exp
+    g2 = gauss.rotate(30 * galsim.degrees).dilate(1.7).compile()
+    assert isinstance(g2, galsim.Gaussian)
+    np.testing.assert_allclose(g2.sigma, 0.85, rtol=1.e-12)
+    check_equiv(gauss.rotate(30 * galsim.degrees).dilate(1.7), g2)
+    g3 = gauss.shear(g1=0.2).shift(0.1, 0.3) * 2
+    check_equiv(g3, g3.compile())
+    exp2 = exp.shear(g1=0.3, g2=0.1).shift(0.2,0.1)
+    assert exp2.compile() is exp2
+
+    # The convolution of Gaussians is a Gaussian.
+    conv = galsim.Convolve(gauss, galsim.Gaussian(sigma=1.2, flux=2))
+    conv2 = conv.compile()
+    assert isinstance(conv2, galsim.Gaussian)
+    np.testing.assert_allclose(conv2.sigma, 1.3, rtol=1.e-12)
+    np.testing.assert_allclose(conv2.flux, 6., rtol=1.e-12)
+    conv = galsim.Convolve(gauss.shear(g1=0.1), galsim.Gaussian(sigma=0.2).shift(0.1,0.2),
+                           exp.shear(g2=0.2).shift(-0.1,0.05) * 3)
+    conv2 = conv.compile()
+    check_equiv(conv, conv2)
+    # The shifts and flux ratios are applied once to the whole convolution.
+    assert isinstance(conv2, galsim.Transformation)
+    assert isinstance(conv2.original, galsim.Convolution)
+    assert len(conv2.original.obj_list) == 2
+    for obj in conv2.original.obj_list:
+        assert not isinstance(obj, galsim.Transformation) or obj.offset == galsim.PositionD(0,0)
+
+    # Gaussians convolved with a sum of Gaussians are distributed into the sum.
+    psf = galsim.Sum(galsim.Gaussian(fwhm=0.7, flux=0.8), galsim.Gaussian(fwhm=1.4, flux=0.2))
+    psf = galsim.Convolve(psf.shear(g1=0.03), galsim.Gaussian(sigma=0.1).shear(g2=0.05),
+                          galsim.Gaussian(sigma=0.05).shift(0.01, 0.))
+    psf2 = psf.compile()
+    check_equiv(psf, psf2)
+    assert psf2.is_analytic_x
+    assert isinstance(psf2.original, galsim.Sum)
+
+    # Components of a sum with the same transformation are transformed together.
+    sheared_sum = galsim.Sum(gauss.shear(g1=0.2, g2=0.1), exp.shear(g1=0.2, g2=0.1) * 2,
+                             galsim.Box(0.3, 0.5))
+    sheared_sum2 = sheared_sum.compile()
+    check_equiv(sheared_sum, sheared_sum2)
+    assert len(sheared_sum2.obj_list) == 2
+    # And if they all have the same offset, it is applied to the whole sum.
+    shifted_sum = galsim.Sum(gauss.shear(g1=0.1).shift(0.1,0.2), exp.shift(0.1,0.2))
+    shifted_sum2 = shifted_sum.compile()
+    check_equiv(shifted_sum, shifted_sum2)
+    assert isinstance(shifted_sum2, galsim.Transformation)
+    assert shifted_sum2.offset == galsim.PositionD(0.1,0.2)
+    # But a zero offset doesn't need a Transformation.
+    unshifted_sum = (galsim.Exponential(half_light_radius=0.7).shear(g1=0.2) +
+                     galsim.Sersic(n=2.5, half_light_radius=0.4).shear(g2=0.3))
+    unshifted_sum2 = unshifted_sum.compile()
+    check_equiv(unshifted_sum, unshifted_sum2)
+    assert isinstance(unshifted_sum2, galsim.Sum)
+
+    # A realistic galaxy model.
+    bulge = galsim.DeVaucouleurs(half_light_radius=0.3, flux=0.3).shear(e1=0.1, e2=0.05)
+    disk = galsim.Exponential(half_light_radius=0.8, flux=0.6).shear(e1=0.3, e2=-0.1)
+    knots = galsim.Sum([galsim.Gaussian(sigma=0.05, flux=0.02).shift(x,y)
+                        for x,y in [(0.3,0.1), (-0.2,0.4), (0.1,-0.5)]])
+    gal = galsim.Sum(bulge.shift(0.02,0.01), disk.shift(0.02,0.01), knots)
+    gal = gal.shear(g1=0.02, g2=-0.01).shift(0.1, -0.05)
+    final = galsim.Convolve(gal, psf, galsim.Pixel(0.2))
+    final2 = final.compile()
+    check_equiv(final, final2)
+    assert final2.compile() == final2
+    np.testing.assert_allclose(final2.drawImage(nx=32, ny=32, scale=0.2).array,
+                               final.drawImage(nx=32, ny=32, scale=0.2).array,
+                               rtol=1.e-4, atol=1.e-6)
+
+    # Other wrappers compile their components.
+    for cls in [galsim.AutoConvolution, galsim.AutoCorrelation, galsim.Deconvolution,
+                galsim.FourierSqrt]:
+        obj = cls(conv)
+        obj2 = obj.compile()
+        assert type(obj2) == type(obj)
+        assert obj2.orig_obj == conv2
+        assert cls(gauss).compile() == cls(gauss)
+
+    # Objects with noise, real-space convolutions and cached k images are left alone.
+    noisy = galsim.Gaussian(sigma=0.4)
+    noisy.noise = galsim.UncorrelatedNoise(variance=0.3, scale=0.2)
+    conv = galsim.Convolve(noisy, galsim.Gaussian(sigma=1.2))
+    assert conv.compile() is conv
+    assert galsim.Sum(noisy, gauss.shear(g1=0.2), exp.shear(g1=0.2)).compile().noise is not None
+    conv = galsim.Convolve(galsim.Box(0.2,0.3).shift(0.1,0.2), galsim.Pixel(0.2), real_space=True)
+    assert conv.compile() is conv
+    conv = galsim.Convolve(gal, psf, cache_kimage=[psf])
+    assert conv.compile() is conv
+
+
+@timer
+def test_gaussian_convolve():
+    """Test that convolutions of Gaussian mixtures are evaluated analytically.
+    """
+    gal = galsim.Gaussian(half_light_radius=0.6, flux=10).shear(g1=0.2, g2=-0.1).shift(0.1, 0.2)
+    psf = galsim.Sum(galsim.Gaussian(fwhm=0.7, flux=0.8), galsim.Gaussian(fwhm=1.5, flux=0.2))
+    conv = galsim.Convolve(gal, psf.shear(g2=0.05))
+    assert conv.is_analytic_x
+    assert not galsim.Convolve(gal, galsim.Moffat(beta=3, fwhm=0.7)).is_analytic_x
+    # DeltaFunctions are Gaussians with zero size.
+    delta_conv = galsim.Convolve(galsim.DeltaFunction(flux=3).shift(0.1,0.2), psf)
+    assert delta_conv.is_analytic_x
+    np.testing.assert_allclose(delta_conv.xValue(0.3,0.1), 3 * psf.xValue(0.2,-0.1), rtol=1.e-12)
+    assert not galsim.Convolve(galsim.DeltaFunction(), galsim.DeltaFunction()).is_analytic_x
+
+    # The real-space values match a real-space convolution done by numerical integration.
+    ref = galsim.Convolve(gal, psf.shear(g2=0.05), real_space=True)
+    sb_ref = galsim._galsim.SBConvolve([o._sbp for o in ref.obj_list], True, ref.gsparams._gsp)
+    for x,y in [ (0,0), (0.3,-0.2), (1.1,0.7) ]:
+        pos = galsim.PositionD(x,y)
+        np.testing.assert_allclose(conv.xValue(pos), sb_ref.xValue(pos._p), rtol=1.e-6)
+        np.testing.assert_allclose(conv.shear(g1=0.1).xValue(pos),
+                                   conv.shear(g1=0.1)._xValue(pos), rtol=1.e-12)
+    for kx,ky in [ (0,0), (0.5,-1.3), (3.1,2.7) ]:
+        kpos = galsim.PositionD(kx,ky)
+        np.testing.assert_allclose(conv.kValue(kpos), gal.kValue(kpos) * psf.shear(g2=0.05).kValue(kpos),
+                                   rtol=1.e-10, atol=1.e-14)
+    np.testing.assert_allclose(conv.flux, 10., rtol=1.e-12)
+    check_basic(conv, "Gaussian convolution", approx_maxsb=True)
+    do_pickle(conv)
+
+    # This also applies to auto-convolutions and auto-correlations.
+    for obj in [galsim.AutoConvolve(gal), galsim.AutoCorrelate(gal),
+                galsim.Convolve(gal, gal, psf)]:
+        assert obj.is_analytic_x
+        im1 = obj.drawImage(nx=32, ny=32, scale=0.3, method='no_pixel')
+        im2 = obj.drawImage(nx=32, ny=32, scale=0.3, method='fft')
+        im3 = galsim.Convolve(obj, galsim.Pixel(0.3)).drawImage(nx=32, ny=32, scale=0.3,
+                                                               method='no_pixel')
+        np.testing.assert_allclose(im3.array, im2.array, atol=1.e-5 * im2.array.max())
+        np.testing.assert_allclose(im1.array.sum(), im2.array.sum(), rtol=1.e-3)
+
+    # With method='auto', the pixel integrals are done directly when that is cheaper than an FFT.
+    im1 = conv.drawImage(nx=32, ny=32, scale=0.2)
+    print('gaussian convolution costs = ',im1.draw_cost)
+    assert im1.draw_method == 'analytic'
+    assert im1.draw_cost['analytic'] < im1.draw_cost['fft']
+    im2 = conv.drawImage(nx=32, ny=32, scale=0.2, method='fft')
+    np.testing.assert_allclose(im1.array, im2.array, atol=1.e-5 * im2.array.max())
+    np.testing.assert_allclose(im1.added_flux, im2.added_flux, rtol=1.e-5)
+    im3 = conv.drawImage(nx=32, ny=32, scale=0.2, method='real_space')
+    np.testing.assert_allclose(im1.array, im3.array, atol=1.e-5 * im3.array.max())
+
+    # Also with a non-trivial wcs and an offset, and adding to an existing image.
+    wcs = galsim.JacobianWCS(0.21, 0.03, -0.02, 0.19)
+    im1 = conv.drawImage(nx=32, ny=32, wcs=wcs, offset=(0.3,-0.2))
+    assert im1.draw_method == 'analytic'
+    im2 = conv.drawImage(nx=32, ny=32, wcs=wcs, offset=(0.3,-0.2), method='fft')
+    np.testing.assert_allclose(im1.array, im2.array, atol=1.e-5 * im2.array.max())
+    conv.drawImage(im1, offset=(0.3,-0.2), add_to_image=True)
+    np.testing.assert_allclose(im1.array, 2*im2.array, atol=2.e-5 * im2.array.max())
+
+    # Significantly undersampled Gaussians still use the fft.
+    im1 = conv.drawImage(nx=32, ny=32, scale=5.)
+    assert im1.draw_method == 'fft'
+    assert 'analytic' not in im1.draw_cost
+
+    # The quadrature rules are cached along with GalSim's other caches.
+    assert galsim.utilities.cache_stats()['pixel_quadrature']['size'] > 0
+    galsim.utilities.set_cache_size('pixel_quadrature', 5)
+    assert galsim.gaussian._pixel_quadrature_cache.stats()['maxsize'] == 5
+    galsim.utilities.set_cache_size('pixel_quadrature', 100)
+
+
+@timer
+def test_shoot_scratch():
+    """Test that Convolution reuses its scratch PhotonArray when photon shooting.
+    """
+    gal = galsim.Sersic(n=1.5, half_light_radius=1.3, flux=100).shear(g1=0.2, g2=-0.1)
+    psf = galsim.Kolmogorov(fwhm=0.7)
+    pix = galsim.Pixel(0.2)
+    objs = [galsim.Convolve(gal, psf, pix), galsim.AutoConvolve(gal), galsim.AutoCorrelate(gal)]
+
+    for obj in objs:
+        # What _shoot did when it made a new PhotonArray for each component.
+        if isinstance(obj, (galsim.AutoConvolution, galsim.AutoCorrelation)):
+            components = [obj.orig_obj, obj.orig_obj]
+        else:
+            components = obj.obj_list
+        ref = galsim.PhotonArray(1000)
+        rng = galsim.BaseDeviate(1234)
+        components[0]._shoot(ref, rng)
+        for comp in components[1:]:
+            p1 = galsim.PhotonArray(1000)
+            comp._shoot(p1, rng)
+            if isinstance(obj, galsim.AutoCorrelation):
+                p1.scaleXY(-1)
+            ref.convolve(p1, rng)
+
+        for i in range(3):
+            photons = galsim.PhotonArray(1000)
+            obj._shoot(photons, galsim.BaseDeviate(1234))
+            np.testing.assert_array_equal(photons.x, ref.x)
+            np.testing.assert_array_equal(photons.y, ref.y)
+            np.testing.assert_array_equal(photons.flux, ref.flux)
+            if i == 0:
+                scratch = obj._scratch.photons
+            else:
+                assert obj._scratch.photons is scratch
+
+        # A different number of photons needs a new array.
+        obj._shoot(galsim.PhotonArray(500), galsim.BaseDeviate(1234))
+        assert len(obj._scratch.photons) == 500
+
+        # Drawing in several batches gives the same image each time.
+        im1 = obj.drawImage(nx=32, ny=32, scale=0.2, method='phot', n_photons=5000, maxN=1000,
+                            rng=galsim.BaseDeviate(5678))
+        im2 = obj.drawImage(nx=32, ny=32, scale=0.2, method='phot', n_photons=5000, maxN=1000,
+                            rng=galsim.BaseDeviate(5678))
+        np.testing.assert_array_equal(im1.array, im2.array)
+
+        # The scratch array is neither pickled nor shared with copies.
+        do_pickle(obj)
+        assert '_scratch' not in obj.withGSParams(galsim.GSParams(folding_threshold=1.e-3)).__dict__
+
+
 if __name__ == "__main__":
     test_convolve()
     test_convolve_flux_scaling()
@@ -1010,3 +1306,7 @@ if __name__ == "__main__":
     test_ne()
     test_convolve_noise()
     test_gsparams()
+    test_cache_kimage()
+    test_compile()
+    test_gaussian_convolve()
+    test_shoot_scratch()
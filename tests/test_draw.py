@@ -18,6 +18,7 @@
 
 from __future__ import print_function
 import numpy as np
+import math
 import os
 import sys
 
@@ -1555,6 +1556,267 @@ def test_direct_scale():
     assert_raises(ValueError, obj.drawPhot, im2, n_photons=-20)
     assert_raises(TypeError, obj.drawPhot, im2, sensor=5)
 
+@timer
+def test_flux_frac():
+    """Test the flux_frac option of drawImage and getGoodImageSize.
+    """
+    gal = galsim.Convolve(galsim.Exponential(half_light_radius=0.4, flux=100),
+                          galsim.Moffat(beta=3.5, fwhm=0.6))
+    scale = 0.2
+
+    N_stepk = gal.getGoodImageSize(scale)
+    N_99 = gal.getGoodImageSize(scale, flux_frac=0.99)
+    N_90 = gal.getGoodImageSize(scale, flux_frac=0.9)
+    print('N = ',N_stepk, N_99, N_90)
+    assert N_90 < N_99 < N_stepk
+    assert N_90 % 2 == 0 and N_99 % 2 == 0
+
+    # The radius used should be close to what calculateHLR gives.
+    r90 = gal.calculateHLR(flux_frac=0.9)
+    r = gal._getFluxRadius(0.9)
+    print('r90 = ',r90, r)
+    np.testing.assert_allclose(r, r90, rtol=0.1)
+
+    # A flux fraction that can't be determined from the initial drawing uses stepk.
+    assert gal.getGoodImageSize(scale, flux_frac=0.99999999) == N_stepk
+
+    ref_im = gal.drawImage(scale=scale)
+    for flux_frac in [0.9, 0.99]:
+        im = gal.drawImage(scale=scale, flux_frac=flux_frac)
+        print('flux_frac = ',flux_frac, im.array.shape, im.truncation_error)
+        assert im.array.shape[0] < ref_im.array.shape[0]
+        assert 0 < im.truncation_error < 1-flux_frac
+        np.testing.assert_allclose(im.truncation_error, 1. - im.added_flux / gal.flux)
+
+        # The central part of the image should match the regular rendering, although the smaller
+        # fft has a bit of extra folding.
+        ref_sub = ref_im[im.bounds.withBorder(-2).shift(ref_im.center - im.center)]
+        np.testing.assert_allclose(im[im.bounds.withBorder(-2)].array, ref_sub.array,
+                                   atol=2*(1-flux_frac) * ref_im.array.max())
+
+        # Also the fft size when drawing on a given image.
+        im2 = galsim.ImageF(im.bounds, scale=scale)
+        gal.drawImage(im2, flux_frac=flux_frac)
+        np.testing.assert_array_equal(im2.array, im.array)
+
+        # And on an undefined image.
+        im3 = galsim.ImageF(scale=scale)
+        gal.drawImage(im3, flux_frac=flux_frac)
+        np.testing.assert_array_equal(im3.array, im.array)
+
+    # Without flux_frac, there is no truncation_error attribute.
+    assert not hasattr(ref_im, 'truncation_error')
+
+    assert_raises(galsim.GalSimRangeError, gal.getGoodImageSize, scale, flux_frac=0.)
+    assert_raises(galsim.GalSimRangeError, gal.getGoodImageSize, scale, flux_frac=1.)
+    assert_raises(galsim.GalSimRangeError, gal.drawImage, scale=scale, flux_frac=1.5)
+
+
+@timer
+def test_auto_method():
+    """Test that method='auto' chooses between fft and real_space sensibly.
+    """
+    scale = 0.2
+
+    # A high-index Sersic has a very large maxk/stepk, so the fft is much larger than a small
+    # stamp.  Real-space integration is cheaper in this case.
+    gal = galsim.Sersic(n=4, half_light_radius=1.0, flux=100)
+    im = gal.drawImage(nx=8, ny=8, scale=scale)
+    print('sersic costs = ',im.draw_cost)
+    assert im.draw_method == 'real_space'
+    assert im.draw_cost['real_space'] < im.draw_cost['fft']
+    im_rs = gal.drawImage(nx=8, ny=8, scale=scale, method='real_space')
+    np.testing.assert_array_equal(im.array, im_rs.array)
+    im_fft = gal.drawImage(nx=8, ny=8, scale=scale, method='fft')
+    np.testing.assert_allclose(im.array, im_fft.array, rtol=1.e-3)
+    assert im_fft.draw_method == 'fft'
+    assert im_fft.draw_cost is None
+
+    # Transformed objects and sums are also ok for real_space.
+    gal2 = (gal + galsim.Exponential(half_light_radius=0.5)).shear(g1=0.2, g2=0.1).shift(0.1, 0.2)
+    im = gal2.drawImage(nx=8, ny=8, scale=scale)
+    assert im.draw_method == 'real_space'
+
+    # A Gaussian is cheap to do with an fft, but even cheaper to integrate analytically.
+    gauss = galsim.Gaussian(sigma=1.0, flux=100)
+    im = gauss.drawImage(scale=scale)
+    print('gaussian costs = ',im.draw_cost)
+    assert im.draw_method == 'analytic'
+    assert im.draw_cost['analytic'] < im.draw_cost['fft'] < im.draw_cost['real_space']
+    im_fft = gauss.drawImage(scale=scale, method='fft')
+    np.testing.assert_allclose(im.array, im_fft.array, atol=1.e-5 * im_fft.array.max())
+
+    # Reusing the image with another method replaces the previous values.
+    gauss.drawImage(image=im, method='fft')
+    assert im.draw_method == 'fft'
+    assert im.draw_cost is None
+    gauss.drawImage(image=im, method='phot', rng=galsim.BaseDeviate(1234))
+    assert im.draw_method == 'phot'
+    assert im.draw_cost is None
+    gauss.drawImage(image=im)
+    assert im.draw_method == 'analytic'
+    assert 'analytic' in im.draw_cost
+
+    # Convolutions always use the fft.
+    conv = galsim.Convolve(gal, galsim.Moffat(beta=2.5, fwhm=0.7))
+    im = conv.drawImage(nx=8, ny=8, scale=scale)
+    print('convolution costs = ',im.draw_cost)
+    assert 'real_space' not in im.draw_cost
+    assert im.draw_method == 'fft'
+
+    # Hard-edged profiles still use real_space as before.
+    tophat = galsim.TopHat(radius=0.7)
+    im = tophat.drawImage(scale=scale)
+    assert im.draw_method == 'real_space'
+
+    # Except for boxes, which are integrated analytically.
+    box = galsim.Box(width=1.1, height=0.7)
+    im = box.drawImage(scale=scale)
+    assert im.draw_method == 'analytic'
+    assert im.draw_cost['analytic'] < im.draw_cost['real_space']
+
+    # With a sensor, the fft is always used.
+    im = gal.drawImage(nx=8, ny=8, scale=scale, sensor=galsim.Sensor())
+    assert im.draw_method == 'fft'
+
+
+@timer
+def test_shoot_threads():
+    """Test photon shooting with multiple threads.
+    """
+    gal = galsim.Sersic(n=2.5, half_light_radius=0.8, flux=1.e5)
+    gal = (gal + galsim.Exponential(half_light_radius=2., flux=1.e3)).shear(g1=0.1, g2=0.2)
+    obj = galsim.Convolve(gal, galsim.Kolmogorov(fwhm=0.7))
+    scale = 0.2
+
+    im1 = obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234))
+    im4 = obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234),
+                        nthreads=4)
+    print('flux = ',im1.added_flux, im4.added_flux)
+
+    # The result with a given rng and nthreads is reproducible.
+    im4b = obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234),
+                         nthreads=4)
+    np.testing.assert_array_equal(im4b.array, im4.array)
+    np.testing.assert_almost_equal(im4b.added_flux, im4.added_flux)
+
+    # Also when using maxN to limit the number of photons per thread at a time.
+    im4c = obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234),
+                         nthreads=4, maxN=3000)
+    im4d = obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234),
+                         nthreads=4, maxN=3000)
+    np.testing.assert_array_equal(im4d.array, im4c.array)
+    np.testing.assert_allclose(im4c.array.sum(), im4.array.sum(), rtol=0.01)
+
+    # It's different from the single-thread image, but statistically consistent.
+    assert im4 != im1
+    np.testing.assert_allclose(im4.array.sum(), im1.array.sum(), rtol=0.01)
+    mom1 = galsim.utilities.unweighted_moments(im1)
+    mom4 = galsim.utilities.unweighted_moments(im4)
+    print('mom1 = ',mom1)
+    print('mom4 = ',mom4)
+    np.testing.assert_allclose(mom4['Mxx'], mom1['Mxx'], rtol=0.02)
+    np.testing.assert_allclose(mom4['Myy'], mom1['Myy'], rtol=0.02)
+    np.testing.assert_allclose(mom4['Mxy'], mom1['Mxy'], rtol=0.05)
+
+    # Integer images and add_to_image work too.
+    im5 = galsim.ImageI(64, 64, scale=scale)
+    im5.fill(3)
+    obj.drawImage(im5, method='phot', rng=galsim.BaseDeviate(1234), nthreads=4, add_to_image=True)
+    np.testing.assert_array_equal(im5.array, im4.array.astype(int) + 3)
+
+    # nthreads <= 0 means to use all cpus.
+    obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234),
+                  nthreads=-1)
+
+    # Silicon sensors always use a single thread.
+    sensor = galsim.SiliconSensor(rng=galsim.BaseDeviate(5678))
+    im6 = obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234),
+                        sensor=sensor, maxN=30000)
+    sensor = galsim.SiliconSensor(rng=galsim.BaseDeviate(5678))
+    im7 = obj.drawImage(nx=64, ny=64, scale=scale, method='phot', rng=galsim.BaseDeviate(1234),
+                        sensor=sensor, maxN=30000, nthreads=4)
+    np.testing.assert_array_equal(im7.array, im6.array)
+
+    assert_raises(galsim.GalSimIncompatibleValuesError, obj.drawImage, scale=scale, nthreads=4)
+    assert_raises(galsim.GalSimIncompatibleValuesError, obj.drawImage, scale=scale,
+                  method='phot', nthreads=4, save_photons=True)
+    assert_raises(galsim.GalSimNotImplementedError, galsim.Deconvolve(obj).drawImage,
+                  scale=scale, method='phot', n_photons=1000, nthreads=4)
+
+
+@timer
+def test_separable_draw():
+    """Test drawing profiles that are separable in x and y using outer products.
+    """
+    scale = 0.2
+
+    # Gaussians are drawn in C++ as the outer product of the exponentials along each row and
+    # column.  Check that this is right whether or not the origin is at a pixel center.
+    gauss = galsim.Gaussian(sigma=0.7, flux=100)
+    for nx, ny in [ (31, 31), (32, 32), (31, 20), (20, 33) ]:
+        im = gauss.drawImage(nx=nx, ny=ny, scale=scale, method='no_pixel', dtype=float)
+        for i, j in [ (1,1), (nx//2+1, ny//2+1), (nx//2, ny//3), (nx, ny) ]:
+            pos = (galsim.PositionD(i,j) - im.true_center) * scale
+            np.testing.assert_allclose(im(i,j), gauss.xValue(pos) * scale**2, rtol=1.e-10,
+                                       atol=1.e-14)
+        im2 = gauss.dilate(1.2).shift(0.1, -0.3).drawImage(nx=nx, ny=ny, scale=scale,
+                                                              method='no_pixel', dtype=float)
+        im3 = galsim.Gaussian(sigma=0.84, flux=100).shift(0.1, -0.3).drawImage(
+                nx=nx, ny=ny, scale=scale, method='no_pixel', dtype=float)
+        np.testing.assert_allclose(im2.array, im3.array, rtol=1.e-10, atol=1.e-14)
+
+    # With method='auto', the pixel-convolved Gaussian is the outer product of the exact integrals
+    # over each column and row.
+    im = gauss.shift(0.05, 0.1).drawImage(nx=32, ny=32, scale=scale, dtype=float)
+    assert im.draw_method == 'analytic'
+    sigma = 0.7 / scale
+    x = np.arange(1, 33) - im.true_center.x - 0.05/scale
+    y = np.arange(1, 33) - im.true_center.y - 0.1/scale
+    fx = np.array([math.erf((xx+0.5)/(sigma*2**0.5)) - math.erf((xx-0.5)/(sigma*2**0.5))
+                   for xx in x]) / 2
+    fy = np.array([math.erf((yy+0.5)/(sigma*2**0.5)) - math.erf((yy-0.5)/(sigma*2**0.5))
+                   for yy in y]) / 2
+    np.testing.assert_allclose(im.array, 100 * np.outer(fy, fx), rtol=1.e-10, atol=1.e-12)
+    im_fft = gauss.shift(0.05, 0.1).drawImage(nx=32, ny=32, scale=scale, method='fft')
+    np.testing.assert_allclose(im.array, im_fft.array, atol=1.e-5 * im.array.max())
+
+    # This is exact, so it works even for very undersampled Gaussians, unlike the quadrature
+    # needed for sheared ones.
+    im = gauss.drawImage(nx=8, ny=8, scale=3.)
+    assert im.draw_method == 'analytic'
+    np.testing.assert_allclose(im.added_flux, 100 * math.erf(12./(0.7*2**0.5))**2, rtol=1.e-12)
+    im = gauss.shear(g1=0.2).drawImage(nx=8, ny=8, scale=3.)
+    assert im.draw_method == 'analytic'
+    im = gauss.shear(g2=0.2).drawImage(nx=8, ny=8, scale=3.)
+    assert im.draw_method != 'analytic'
+    im = gauss.shear(g2=0.2).drawImage(nx=32, ny=32, scale=scale)
+    assert im.draw_method == 'analytic'
+    im_fft = gauss.shear(g2=0.2).drawImage(nx=32, ny=32, scale=scale, method='fft')
+    np.testing.assert_allclose(im.array, im_fft.array, atol=1.e-5 * im.array.max())
+
+    # Boxes (and Pixels) are separable too, including sums of them and when they are dilated,
+    # stretched or shifted.
+    box = galsim.Box(width=1.1, height=0.7, flux=10)
+    box2 = galsim.Sum(box.shift(0.13, 0.27), galsim.Pixel(scale=0.5, flux=3).dilate(1.3),
+                      box.transform(1.2, 0., 0., -0.8).shift(-0.2, 0.03))
+    for obj in [box, box.shift(0.3, -0.2), box2]:
+        im = obj.drawImage(nx=16, ny=16, scale=scale)
+        assert im.draw_method == 'analytic'
+        im_rs = obj.drawImage(nx=16, ny=16, scale=scale, method='real_space')
+        np.testing.assert_allclose(im.array, im_rs.array, atol=1.e-5 * im.array.max())
+        np.testing.assert_allclose(im.added_flux, obj.flux, rtol=1.e-10)
+        # add_to_image and double precision images work too.
+        im2 = obj.drawImage(im.copy(), add_to_image=True)
+        np.testing.assert_allclose(im2.array, 2*im.array, rtol=1.e-6)
+        im3 = obj.drawImage(nx=16, ny=16, scale=scale, dtype=np.float64)
+        np.testing.assert_allclose(im3.array, im.array, rtol=1.e-6)
+
+    # But not if they are rotated.
+    im = box.rotate(30 * galsim.degrees).drawImage(nx=16, ny=16, scale=scale)
+    assert im.draw_method == 'real_space'
+
+
 if __name__ == "__main__":
     test_drawImage()
     test_draw_methods()
@@ -1568,3 +1830,7 @@ if __name__ == "__main__":
     test_shoot()
     test_types()
     test_direct_scale()
+    test_flux_frac()
+    test_auto_method()
+    test_separable_draw()
+    test_shoot_threads()
@@ -3442,6 +3442,59 @@ def test_bin():
     np.testing.assert_almost_equal((origin6.x, origin6.y), (origin1.x, origin1.y), 6,
                                    "Binning past the edge resulted in wrong wcs")
 
+@timer
+def test_pickle_buffers():
+    """Test that Images can be pickled with out-of-band buffers using pickle protocol 5.
+    """
+    import pickle
+    if pickle.HIGHEST_PROTOCOL < 5:
+        print('Skipping test_pickle_buffers, since pickle protocol 5 is not available.')
+        return
+
+    def roundtrip(obj):
+        buffers = []
+        data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+        # Receivers may give us read-only buffers.
+        obj2 = pickle.loads(data, buffers=[bytes(b.raw()) for b in buffers])
+        return obj2, data, buffers
+
+    im = galsim.Image(np.arange(64*48, dtype=float).reshape(48,64), scale=0.3, xmin=3, ymin=7)
+    im2, data, buffers = roundtrip(im)
+    assert im2 == im
+    assert len(buffers) == 1
+    assert len(data) < 1000
+    assert buffers[0].raw().nbytes == im.array.nbytes
+    # The unpickled image needs to be writeable.
+    im2.array[3,4] = 17.
+    im2.setValue(10,10, 23.)
+
+    # Subimages are not contiguous, but are also sent out of band (as a compact copy).
+    b = galsim.BoundsI(10,20,12,30)
+    sub = im[b]
+    sub2, data, buffers = roundtrip(sub)
+    assert sub2 == sub
+    assert len(buffers) == 1
+    assert buffers[0].raw().nbytes == sub.array.nbytes
+    sub2.array[:,:] = 0.
+    assert im[b] == sub
+
+    # Const images stay const.
+    cim = im.view(make_const=True)
+    cim2, data, buffers = roundtrip(cim)
+    assert cim2 == cim
+    assert cim2.isconst
+    with assert_raises(ValueError):
+        cim2.array[1,1] = 3.
+
+    # The images inside GSObjects also use out-of-band buffers.
+    ii = galsim.InterpolatedImage(im[b])
+    ii2, data, buffers = roundtrip(ii)
+    assert ii2 == ii
+    assert len(buffers) == 1
+    np.testing.assert_array_equal(ii2.drawImage(nx=16, ny=16, scale=0.3).array,
+                                  ii.drawImage(nx=16, ny=16, scale=0.3).array)
+
+
 if __name__ == "__main__":
     test_Image_basic()
     test_undefined_image()
@@ -3483,3 +3536,4 @@ if __name__ == "__main__":
     test_wrap()
     test_FITS_bad_type()
     test_bin()
+    test_pickle_buffers()
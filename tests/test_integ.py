@@ -209,6 +209,12 @@ def test_midpoint_basic():
         result/expected_val, 1.0, decimal=2, verbose=True,
         err_msg='Simple test of midptRule() method failed for f(x)=x^2 from 0 to 10')
 
+    # midptWeights gives the same thing as a weighted sum.
+    w = galsim.integ.midptWeights(x)
+    np.testing.assert_almost_equal(np.sum(w * f), result)
+    np.testing.assert_almost_equal(galsim.integ.midptWeights([1., 3.]), [2., 2.])
+    assert_raises(ValueError, galsim.integ.midptWeights, [1.])
+
 
 @timer
 def test_trapz_basic():
@@ -234,6 +240,13 @@ def test_trapz_basic():
         result/expected_val, 1.0, decimal=6, verbose=True,
         err_msg='Test of trapzRule() with points failed for f(x)=x^2 from 0 to 1')
 
+    # trapzWeights gives the same thing as a weighted sum.
+    x = np.linspace(0, 1, 1000)**2
+    w = galsim.integ.trapzWeights(x)
+    np.testing.assert_almost_equal(np.sum(w * func(x)), galsim.integ.trapzRule(func, x))
+    np.testing.assert_almost_equal(np.sum(w * func(x)), np.trapz(func(x), x))
+    assert_raises(ValueError, galsim.integ.trapzWeights, [1.])
+
     assert_raises(ValueError, galsim.integ.trapz, func, 0, 1, points=np.linspace(0, 1.1, 100))
     assert_raises(ValueError, galsim.integ.trapz, func, 0.1, 1, points=np.linspace(0, 1, 100))
     assert_raises(TypeError, galsim.integ.trapz, func, 0.1, 1, points=2.3)
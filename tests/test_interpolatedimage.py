@@ -1370,6 +1370,167 @@ def test_ne():
     all_obj_diff(gals)
 
 
+@timer
+def test_shoot_distribution():
+    """Test that photons are shot from each pixel with probability proportional to the absolute
+    value of its flux.
+    """
+    rng = galsim.UniformDeviate(1234)
+    # A small image with a wide range of pixel values, including a zero and some negative ones.
+    im = galsim.ImageD(7, 5, scale=1.)
+    im.addNoise(galsim.GaussianNoise(rng, sigma=1.))
+    im.array[2,3] = 20.
+    im.array[1,1] = 7.
+    im.array[4,6] = 0.
+    ii = galsim.InterpolatedImage(im, x_interpolant='nearest', calculate_stepk=False,
+                                  calculate_maxk=False)
+
+    N = 1000000
+    photons = galsim.PhotonArray(N)
+    ii._shoot(photons, rng)
+    # With the nearest interpolant, each photon lands in the pixel it was chosen from.
+    # The true center of the image is at the center of pixel (3,2).
+    ix = np.floor(photons.x + 0.5).astype(int) + 3
+    iy = np.floor(photons.y + 0.5).astype(int) + 2
+    counts = np.zeros(im.array.shape)
+    np.add.at(counts, (iy, ix), 1)
+    abs_flux = np.abs(im.array)
+    expected = abs_flux / np.sum(abs_flux) * N
+    print('counts = ',counts)
+    print('expected = ',expected)
+    assert counts[4,6] == 0
+    use = expected > 0
+    chisq = np.sum((counts[use]-expected[use])**2 / expected[use]) / np.sum(use)
+    print('chisq/dof = ',chisq)
+    assert chisq < 2.
+    # The sign of each photon's flux matches that of its pixel.
+    np.testing.assert_array_equal(np.sign(photons.flux), np.sign(im.array[iy, ix]))
+
+
+@timer
+def test_analysis_cache():
+    """Test that the stepk and maxk analysis is reused for identical images.
+    """
+    cache = galsim.InterpolatedImage._analysis_cache
+    cache.resize(10**8)
+    im = galsim.Gaussian(sigma=1.7, flux=100).drawImage(nx=41, ny=41, scale=0.3)
+    im.array[3,5] += 0.123  # Make it different from any other image in the cache.
+
+    s0 = cache.stats()
+    ii1 = galsim.InterpolatedImage(im)
+    s1 = cache.stats()
+    assert s1['misses'] == s0['misses'] + 1
+    assert s1['size'] == s0['size'] + 2  # The analysis and the SBInterpolatedImage
+    assert s1['nbytes'] > s0['nbytes']
+
+    # A new copy of the same image is a hit, and gives the same profile.
+    ii2 = galsim.InterpolatedImage(im.copy())
+    s2 = cache.stats()
+    assert s2['hits'] == s1['hits'] + 1
+    assert s2['misses'] == s1['misses']
+    assert ii2.stepk == ii1.stepk
+    assert ii2.maxk == ii1.maxk
+    assert ii2 == ii1
+    np.testing.assert_array_equal(ii2.drawImage(nx=32, ny=32, scale=0.2).array,
+                                  ii1.drawImage(nx=32, ny=32, scale=0.2).array)
+
+    # The cache is in pixel units, so a different pixel scale can also use it.
+    s2 = cache.stats()
+    ii3 = galsim.InterpolatedImage(im, scale=0.6)
+    assert cache.stats()['hits'] == s2['hits'] + 1
+    ii3b = galsim.InterpolatedImage(im, scale=0.6, use_cache=False)
+    np.testing.assert_allclose(ii3.stepk, ii3b.stepk, rtol=1.e-12)
+    np.testing.assert_allclose(ii3.maxk, ii3b.maxk, rtol=1.e-12)
+    np.testing.assert_allclose(ii3.drawImage(nx=32, ny=32, scale=0.2).array,
+                               ii3b.drawImage(nx=32, ny=32, scale=0.2).array, rtol=1.e-10)
+
+    # Different images, interpolants, or gsparams are misses.
+    s3 = cache.stats()
+    im2 = im.copy()
+    im2.array[20,20] += 1.
+    galsim.InterpolatedImage(im2)
+    galsim.InterpolatedImage(im, x_interpolant='lanczos5')
+    galsim.InterpolatedImage(im, gsparams=galsim.GSParams(folding_threshold=1.e-3))
+    galsim.InterpolatedImage(im, calculate_maxk=False)
+    s4 = cache.stats()
+    assert s4['misses'] == s3['misses'] + 4
+    assert s4['hits'] == s3['hits']
+
+    ii4 = galsim.InterpolatedImage(im)
+    do_pickle(ii4)
+
+    # Shrinking the cache removes the least recently used entries.
+    nbytes = 16 * ii1._xim.array.size
+    galsim.utilities.set_cache_size('interpolated_image', nbytes)
+    s5 = galsim.utilities.cache_stats()['interpolated_image']
+    assert s5['size'] < s4['size']
+    assert s5['maxbytes'] == nbytes
+    assert s5['nbytes'] <= nbytes
+    galsim.InterpolatedImage(im2)
+    assert cache.stats()['nbytes'] <= nbytes
+    cache.resize(10**8)
+
+
+@timer
+def test_shared_ktable():
+    """Test that identical InterpolatedImages share their k table.
+    """
+    import pickle
+    cache = galsim.InterpolatedImage._analysis_cache
+    cache.resize(10**8)
+    im = galsim.Moffat(beta=3, fwhm=0.9, flux=1).drawImage(nx=32, ny=32, scale=0.2)
+    im.array[4,7] += 0.0321  # Make it different from any other image in the cache.
+
+    psf1 = galsim.InterpolatedImage(im)
+    psf1.buildKTable()
+    gal = galsim.Exponential(half_light_radius=0.5)
+
+    # Transformations use the same SBInterpolatedImage, and so does a new InterpolatedImage
+    # made from the same image, or an unpickled copy.
+    psf2 = galsim.InterpolatedImage(im.copy()).shear(g1=0.1, g2=0.2).shift(0.1, 0.2)
+    psf3 = pickle.loads(pickle.dumps(psf1))
+    psf4 = galsim.InterpolatedImage(im, scale=0.3)
+    assert psf3 == psf1
+    for psf in [psf2, psf3, psf4]:
+        psf.drawImage(nx=24, ny=24, scale=0.2)
+    assert psf2.original._sbii is psf1._sbii
+    assert psf3._sbii is psf1._sbii
+    assert psf4._sbii is psf1._sbii
+
+    # Drawing is the same as for a profile with its own table.
+    psf5 = galsim.InterpolatedImage(im, use_cache=False)
+    conv1 = galsim.Convolve(gal, psf1)
+    conv5 = galsim.Convolve(gal, psf5)
+    np.testing.assert_array_equal(conv1.drawImage(nx=24, ny=24, scale=0.2).array,
+                                  conv5.drawImage(nx=24, ny=24, scale=0.2).array)
+    assert psf5._sbii is not psf1._sbii
+
+    # Different interpolants, gsparams or images get their own tables.
+    psf6 = galsim.InterpolatedImage(im, k_interpolant='lanczos5')
+    psf7 = galsim.InterpolatedImage(im, gsparams=galsim.GSParams(kvalue_accuracy=1.e-6))
+    psf8 = galsim.InterpolatedImage(im * 2)
+    for psf in [psf6, psf7, psf8]:
+        psf.drawImage(nx=24, ny=24, scale=0.2)
+        assert psf._sbii is not psf1._sbii
+
+    # A pinned table is kept even when it is removed from the cache.
+    psf1.buildKTable(pin=True)
+    cache.resize(0)
+    assert cache.stats()['size'] == 0
+    psf9 = galsim.InterpolatedImage(im)
+    psf9.drawImage(nx=24, ny=24, scale=0.2)
+    assert psf9._sbii is psf1._sbii
+    do_pickle(psf9)
+
+    psf1.unpinKTable()
+    psf10 = galsim.InterpolatedImage(im)
+    psf10.drawImage(nx=24, ny=24, scale=0.2)
+    assert psf10._sbii is not psf1._sbii
+    np.testing.assert_array_equal(psf10.drawImage(nx=24, ny=24, scale=0.2).array,
+                                  psf1.drawImage(nx=24, ny=24, scale=0.2).array)
+    cache.resize(10**8)
+
+
 if __name__ == "__main__":
     setup()
     test_roundtrip()
@@ -1390,3 +1551,6 @@ if __name__ == "__main__":
     test_kroundtrip()
     test_multihdu_readin()
     test_ne()
+    test_shoot_distribution()
+    test_analysis_cache()
+    test_shared_ktable()
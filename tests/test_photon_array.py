@@ -347,6 +347,66 @@ def test_wavelength_sampler():
     print('sum = ',im1.array.sum(),im2.array.sum())
     np.testing.assert_array_equal(im1.array, im2.array)
 
+@timer
+def test_wavelength_sampler_cache():
+    """Test that the wavelength tables are shared between objects and the batched sampler.
+    """
+    template = galsim.SED(os.path.join(sedpath, 'CWW_Sbc_ext.sed'), 'A', 'flambda')
+    bandpass = galsim.Bandpass(os.path.join(bppath, 'LSST_i.dat'), 'nm')
+
+    # SEDs with the same template and redshift, but different normalizations, share the same
+    # deviate, so only the first one needs to build it.
+    seds = [template.atRedshift(0.6).withMagnitude(mag, bandpass.withZeropoint('AB'))
+            for mag in [20, 21, 22]]
+    misses = galsim.SED._deviate_cache.misses
+    waves = []
+    for sed in seds:
+        sampler = galsim.WavelengthSampler(sed, bandpass, galsim.BaseDeviate(1234))
+        photon_array = galsim.PhotonArray(1000)
+        sampler.applyTo(photon_array)
+        waves.append(photon_array.wavelength)
+    assert galsim.SED._deviate_cache.misses <= misses + 1
+    np.testing.assert_array_equal(waves[1], waves[0])
+    np.testing.assert_array_equal(waves[2], waves[0])
+    misses = galsim.SED._deviate_cache.misses
+    template.atRedshift(0.6).sampleWavelength(10, bandpass)
+    assert galsim.SED._deviate_cache.misses == misses
+    template.atRedshift(0.7).sampleWavelength(10, bandpass)
+    assert galsim.SED._deviate_cache.misses == misses + 1
+
+    # A different normalization is still the same distribution.
+    np.testing.assert_allclose(np.mean(waves[0]),
+                               np.mean(template.atRedshift(0.6).sampleWavelength(
+                                   1000, bandpass, rng=galsim.BaseDeviate(1234))), rtol=1.e-12)
+
+    # applyToMany is equivalent to applyTo on each PhotonArray in turn.
+    photon_arrays = [galsim.PhotonArray(n) for n in [10, 0, 300, 47]]
+    sampler = galsim.WavelengthSampler(seds[1], bandpass, galsim.BaseDeviate(5678))
+    sampler.applyToMany(photon_arrays)
+    sampler = galsim.WavelengthSampler(seds[2], bandpass, galsim.BaseDeviate(5678))
+    for pa in photon_arrays:
+        pa2 = galsim.PhotonArray(len(pa))
+        sampler.applyTo(pa2)
+        np.testing.assert_array_equal(pa.wavelength, pa2.wavelength)
+    assert np.min(photon_arrays[2].wavelength) >= bandpass.blue_limit
+    assert np.max(photon_arrays[2].wavelength) <= bandpass.red_limit
+
+    # Sampling another SED without an rng doesn't use the rng from the previous caller.
+    a = seds[0].withFlux(1., bandpass)
+    b = seds[0].withFlux(5., bandpass)
+    rng = galsim.BaseDeviate(1357)
+    a1 = a.sampleWavelength(3, bandpass, rng=rng)
+    a2 = a.sampleWavelength(3, bandpass, rng=rng)
+    rng = galsim.BaseDeviate(1357)
+    np.testing.assert_array_equal(a.sampleWavelength(3, bandpass, rng=rng), a1)
+    b.sampleWavelength(10, bandpass)
+    np.testing.assert_array_equal(a.sampleWavelength(3, bandpass, rng=rng), a2)
+
+    galsim.SED.resize_deviate_cache(3)
+    assert galsim.utilities.cache_stats()['sed_deviate']['maxsize'] == 3
+    galsim.utilities.set_cache_size('sed_deviate', 100)
+    assert galsim.SED._deviate_cache.stats()['maxsize'] == 100
+
 @timer
 def test_photon_angles():
     """Test the photon_array function
@@ -862,13 +922,83 @@ def test_dcr_moments():
     assert moments['Mxy'] > 0  # e2 > 0
 
 
+@timer
+def test_photon_buffers():
+    """Test that drawPhot reuses its PhotonArray buffers, and the surface ops work in place.
+    """
+    obj = galsim.Convolve(galsim.Exponential(flux=1.7e4, half_light_radius=1.3),
+                          galsim.Moffat(beta=2.5, fwhm=0.9))
+    sed = galsim.SED(os.path.join(sedpath, 'CWW_E_ext.sed'), 'A', 'flambda').thin()
+    bandpass = galsim.Bandpass(os.path.join(bppath, 'LSST_r.dat'), 'nm').thin()
+    local_wcs = galsim.PixelScale(0.2).jacobian()
+
+    def make_ops():
+        return [galsim.WavelengthSampler(sed, bandpass, galsim.BaseDeviate(11)),
+                galsim.FRatioAngles(1.2, 0.6, galsim.BaseDeviate(12)),
+                galsim.PhotonDCR(base_wavelength=bandpass.effective_wavelength,
+                                 zenith_angle=30*galsim.degrees, alpha=-0.2)]
+
+    # Draw in chunks of maxN, with a smaller last chunk.
+    im1 = galsim.ImageD(64, 64, scale=1)
+    im1.setCenter(0,0)
+    added_flux, photons = obj.drawPhot(im1, n_photons=3500, rng=galsim.BaseDeviate(1234),
+                                       surface_ops=make_ops(), maxN=1000, local_wcs=local_wcs)
+    assert len(photons) == 500
+    assert photons.hasAllocatedWavelengths()
+    assert photons.hasAllocatedAngles()
+
+    # This should be the same as making new photon arrays for each chunk.
+    im2 = galsim.ImageD(64, 64, scale=1)
+    im2.setCenter(0,0)
+    rng = galsim.BaseDeviate(1234)
+    Ntot, g = obj._calculate_nphotons(3500, False, 0., rng)
+    ops = make_ops()
+    added_flux2 = 0.
+    for n in [1000, 1000, 1000, 500]:
+        photons2 = obj.shoot(n, rng)
+        photons2.scaleFlux(g * n / Ntot)
+        for op in ops:
+            op.applyTo(photons2, local_wcs)
+        added_flux2 += photons2.addTo(im2)
+    np.testing.assert_almost_equal(added_flux, added_flux2)
+    np.testing.assert_array_equal(im1.array, im2.array)
+    assert photons == photons2
+
+    # A PhotonArray of the right size gets reused.
+    photons3 = obj._shootInto(photons, 500, rng)
+    assert photons3 is photons
+    photons4 = obj._shootInto(photons, 400, rng)
+    assert photons4 is not photons
+    assert len(photons4) == 400
+
+    # FRatioAngles uses the dxdz, dydz arrays as work space, but the result should be the
+    # same as the straightforward calculation.
+    fratio = 1.2
+    obscuration = 0.6
+    galsim.FRatioAngles(fratio, obscuration, galsim.BaseDeviate(12)).applyTo(photons)
+    ud = galsim.UniformDeviate(12)
+    phi = np.empty(len(photons))
+    ud.generate(phi)
+    phi *= 2 * np.pi
+    u = np.empty(len(photons))
+    ud.generate(u)
+    pupil_angle = np.arctan(0.5 / fratio)
+    obscuration_angle = np.arctan(0.5 * obscuration / fratio)
+    sintheta = np.sin(obscuration_angle) + (np.sin(pupil_angle) - np.sin(obscuration_angle)) * u
+    tantheta = np.sqrt(np.square(sintheta) / (1. - np.square(sintheta)))
+    np.testing.assert_allclose(photons.dxdz, tantheta * np.sin(phi), rtol=1.e-12)
+    np.testing.assert_allclose(photons.dydz, tantheta * np.cos(phi), rtol=1.e-12)
+
+
 if __name__ == '__main__':
     test_photon_array()
     test_convolve()
     test_wavelength_sampler()
+    test_wavelength_sampler_cache()
     test_photon_angles()
     test_photon_io()
     test_dcr()
     if not no_astroplan:
         test_dcr_angles()
     test_dcr_moments()
+    test_photon_buffers()
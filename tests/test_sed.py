@@ -974,6 +974,219 @@ def test_thin():
     np.testing.assert_equal(s.wave_list, [0,1])
 
 
+@timer
+def test_photon_table():
+    """Check that the cached photon tables give the same results as evaluating the SED directly.
+    """
+    import pickle
+    bp = galsim.Bandpass(os.path.join(bppath, 'LSST_r.dat'), 'nm').withZeropoint('AB')
+    for z in [0, 0.5]:
+        sed = galsim.SED(os.path.join(sedpath, 'CWW_E_ext.sed'), 'A', 'flambda').atRedshift(z)
+        assert sed._photon_table is not None
+        x, f = sed._photon_table
+        np.testing.assert_allclose(x[[0,-1]], [sed.blue_limit, sed.red_limit], rtol=1.e-12)
+
+        # Evaluation matches the LookupTable the tables were made from.
+        waves = np.linspace(sed.blue_limit, sed.red_limit, 1234)
+        np.testing.assert_allclose(sed(waves), sed._fast_spec(waves/(1.+z)), rtol=1.e-12)
+        np.testing.assert_allclose(sed(500.), sed._fast_spec(500./(1.+z)), rtol=1.e-12)
+
+        # Flux matches the trapezoidal integral on the combined wave_list.
+        wave_list, _, _ = galsim.utilities.combine_wave_list(sed, bp)
+        flux = np.trapz(bp(wave_list) * sed._fast_spec(wave_list/(1.+z)), wave_list)
+        np.testing.assert_allclose(sed.calculateFlux(bp), flux, rtol=1.e-12)
+        slow_sed = galsim.SED(os.path.join(sedpath, 'CWW_E_ext.sed'), 'A', 'flambda',
+                              fast=False).atRedshift(z)
+        assert slow_sed._photon_table is None
+        np.testing.assert_allclose(slow_sed.calculateFlux(bp), flux, rtol=1.e-4)
+
+        # Rescaling the SED rescales the table rather than remaking it.
+        sed2 = sed.withMagnitude(20, bp)
+        assert '_photon_table' in sed2.__dict__
+        np.testing.assert_allclose(sed2.calculateMagnitude(bp), 20, rtol=1.e-12)
+        np.testing.assert_allclose(sed2._photon_table[1], f * sed2(500.) / sed(500.), rtol=1.e-12)
+
+        # The tables aren't pickled, but are remade as needed.
+        sed3 = pickle.loads(pickle.dumps(sed2))
+        assert '_photon_table' not in sed3.__dict__
+        np.testing.assert_allclose(sed3.calculateMagnitude(bp), 20, rtol=1.e-12)
+        bp3 = pickle.loads(pickle.dumps(bp))
+        assert '_tp_table' not in bp3.__dict__
+        np.testing.assert_allclose(sed3.calculateMagnitude(bp3), 20, rtol=1.e-12)
+
+    # Functional SEDs and Bandpasses don't have tables, but still work.
+    sed = galsim.SED('wave**-2', 'nm', 'fphotons')
+    assert sed._photon_table is None
+    bp2 = galsim.Bandpass('1', 'nm', blue_limit=500, red_limit=600)
+    assert bp2._tp_table is None
+    np.testing.assert_allclose(sed.calculateFlux(bp2), 1./500 - 1./600, rtol=1.e-6)
+    np.testing.assert_allclose(sed.calculateFlux(bp),
+                               galsim.integ.int1d(lambda w: sed(w) * bp(w),
+                                                  bp.blue_limit, bp.red_limit), rtol=2.e-3)
+
+    # A bandpass with limits inside the range of its table is zero outside of those limits.
+    bp4 = galsim.Bandpass(os.path.join(bppath, 'LSST_r.dat'), 'nm', blue_limit=600,
+                          red_limit=650)
+    sed = galsim.SED(os.path.join(sedpath, 'CWW_E_ext.sed'), 'A', 'flambda')
+    wave_list = np.linspace(bp.blue_limit, bp.red_limit, 500)
+    np.testing.assert_allclose(galsim.sed._integrate_product(sed, bp4, wave_list),
+                               np.trapz(bp4(wave_list) * sed(wave_list), wave_list), rtol=1.e-12)
+
+
+@timer
+def test_calculateFluxes():
+    """Check the batch flux and magnitude calculations against SED.calculateFlux.
+    """
+    bands = [galsim.Bandpass(os.path.join(bppath, 'LSST_%s.dat'%b), 'nm').withZeropoint('AB')
+             for b in 'ugrizy']
+    sed = galsim.SED(os.path.join(sedpath, 'CWW_Sbc_ext.sed'), 'A', 'flambda')
+    redshifts = np.linspace(0, 2, 11)
+    flux = galsim.sed.calculateFluxes(sed, redshifts, bands)
+    assert flux.shape == (len(redshifts), len(bands))
+    for i, z in enumerate(redshifts):
+        sedz = sed.atRedshift(z)
+        for j, bp in enumerate(bands):
+            np.testing.assert_allclose(flux[i,j], sedz.calculateFlux(bp), rtol=2.e-3)
+            # Compare to a very finely sampled integral.
+            x = np.linspace(bp.blue_limit, bp.red_limit, 20001)
+            np.testing.assert_allclose(flux[i,j], np.trapz(sedz(x) * bp(x), x), rtol=1.e-3)
+
+    # A list of SEDs uses each SED's own redshift, or the given redshifts.
+    sed2 = galsim.SED(os.path.join(sedpath, 'CWW_E_ext.sed'), 'A', 'flambda').atRedshift(0.3)
+    seds = [sed.atRedshift(0.7), sed2, sed.atRedshift(0.7)]
+    flux = galsim.sed.calculateFluxes(seds, None, bands[1:3])
+    assert flux.shape == (3, 2)
+    np.testing.assert_allclose(flux[0], flux[2], rtol=1.e-12)
+    np.testing.assert_allclose(flux[1], [sed2.calculateFlux(bp) for bp in bands[1:3]], rtol=5.e-3)
+    flux = galsim.sed.calculateFluxes(seds, 0.7, bands[2])
+    np.testing.assert_allclose(flux[:,0], [s.atRedshift(0.7).calculateFlux(bands[2])
+                                           for s in [sed, sed2, sed]], rtol=2.e-3)
+    flux2 = galsim.sed.calculateFluxes(seds, [0.7, 0.7, 0.7], bands[2], dwave=0.2)
+    np.testing.assert_allclose(flux2, flux, rtol=2.e-4)
+
+    # Magnitudes
+    mags = galsim.sed.calculateMagnitudes(sed, redshifts, bands)
+    np.testing.assert_allclose(mags, -2.5*np.log10(galsim.sed.calculateFluxes(sed, redshifts, bands))
+                               + [bp.zeropoint for bp in bands], rtol=1.e-12)
+    np.testing.assert_allclose(mags[3,2], sed.atRedshift(redshifts[3]).calculateMagnitude(bands[2]),
+                               atol=1.e-3)
+
+    # SEDs that aren't tabulated are evaluated directly.
+    sed3 = galsim.SED('wave**-2', 'nm', 'fphotons')
+    bp = galsim.Bandpass('1', 'nm', blue_limit=500, red_limit=600)
+    flux = galsim.sed.calculateFluxes(sed3, [0, 1], [bp, bands[2]])
+    np.testing.assert_allclose(flux[0,0], 1./500 - 1./600, rtol=1.e-4)
+    np.testing.assert_allclose(flux[1], [sed3.atRedshift(1).calculateFlux(bp),
+                                         sed3.atRedshift(1).calculateFlux(bands[2])], rtol=2.e-3)
+
+    assert_raises(galsim.GalSimSEDError, galsim.sed.calculateFluxes,
+                  galsim.SED('1', 'nm', '1'), None, bands)
+    assert_raises(galsim.GalSimIncompatibleValuesError, galsim.sed.calculateFluxes,
+                  seds, [0.1, 0.2], bands)
+    sed4 = galsim.SED(galsim.LookupTable([400, 800], [1, 1], interpolant='linear'), 'nm',
+                      'fphotons')
+    assert_raises(galsim.GalSimRangeError, galsim.sed.calculateFluxes, sed4, 0, bands[1:3])
+    assert_raises(galsim.GalSimRangeError, galsim.sed.calculateFluxes, sed4, [0, 0.5], bands[2])
+    assert_raises(galsim.GalSimRangeError, galsim.sed.calculateFluxes, sed, 0, bands, dwave=0)
+    assert_raises(galsim.GalSimError, galsim.sed.calculateMagnitudes, sed3, 0, bp)
+
+
+@timer
+def test_SEDTemplateBank():
+    """Test the interpolated fluxes from an SEDTemplateBank.
+    """
+    import pickle
+    bands = [galsim.Bandpass(os.path.join(bppath, 'LSST_%s.dat'%b), 'nm').withZeropoint('AB')
+             for b in 'gri']
+    sed_E = galsim.SED(os.path.join(sedpath, 'CWW_E_ext.sed'), 'A', 'flambda')
+    sed_Sbc = galsim.SED(os.path.join(sedpath, 'CWW_Sbc_ext.sed'), 'A', 'flambda')
+    templates = [sed_E, sed_Sbc]
+    bank = galsim.SEDTemplateBank(templates, bands)
+    np.testing.assert_allclose(bank.redshifts, np.linspace(0, 3, 301))
+
+    # At the grid redshifts, the fluxes are those from calculateFluxes.
+    z = bank.redshifts[[0, 17, 150, 300]]
+    np.testing.assert_allclose(bank.calculateFluxes(1, z),
+                               galsim.sed.calculateFluxes(sed_Sbc, z, bands), rtol=1.e-12)
+
+    # Elsewhere they are interpolated.
+    rng = np.random.RandomState(1234)
+    z = rng.uniform(0, 3, 50)
+    index = rng.randint(0, 2, 50)
+    flux = bank.calculateFluxes(index, z)
+    assert flux.shape == (50, 3)
+    np.testing.assert_allclose(flux, galsim.sed.calculateFluxes([templates[i] for i in index],
+                                                                z, bands), rtol=2.e-3)
+    for i in range(5):
+        sed = templates[index[i]].atRedshift(z[i])
+        np.testing.assert_allclose(flux[i], [sed.calculateFlux(bp) for bp in bands], rtol=5.e-3)
+    np.testing.assert_allclose(bank.calculateFluxes(index, z, [bands[2], bands[0]]),
+                               flux[:,[2,0]], rtol=1.e-12)
+    np.testing.assert_allclose(bank.calculateFluxes(index[3], z[3], bands[1])[0,0], flux[3,1],
+                               rtol=1.e-12)
+    np.testing.assert_array_equal(galsim.sed.calculateFluxes(bank, z, bands, templates=index),
+                                  flux)
+    np.testing.assert_array_equal(galsim.sed.calculateFluxes(bank, z, None, templates=index),
+                                  flux)
+    np.testing.assert_array_equal(galsim.sed.calculateFluxes(bank, z, bands[1], templates=1),
+                                  bank.calculateFluxes(1, z, bands[1]))
+    mags = bank.calculateMagnitudes(index, z)
+    np.testing.assert_array_equal(galsim.sed.calculateMagnitudes(bank, z, bands, templates=index),
+                                  mags)
+    np.testing.assert_allclose(mags, -2.5*np.log10(flux) + [bp.zeropoint for bp in bands],
+                               rtol=1.e-12)
+
+    # The SEDs from getSED know their fluxes through the bank's bandpasses.
+    sed = bank.getSED(index[3], z[3])
+    sed0 = templates[index[3]].atRedshift(z[3])
+    waves = np.linspace(sed.blue_limit, sed.red_limit, 100)
+    np.testing.assert_allclose(sed(waves), sed0(waves), rtol=1.e-10)
+    np.testing.assert_allclose(sed.calculateFlux(bands[1]), flux[3,1], rtol=1.e-12)
+    sed = sed.withMagnitude(22.1, bands[1])
+    np.testing.assert_allclose(sed.calculateMagnitude(bands[1]), 22.1, rtol=1.e-12)
+    np.testing.assert_allclose(sed.calculateMagnitude(bands[2]), mags[3,2] - mags[3,1] + 22.1,
+                               rtol=1.e-12)
+    np.testing.assert_allclose(pickle.loads(pickle.dumps(sed)).calculateFlux(bands[2]),
+                               sed.calculateFlux(bands[2]), rtol=1.e-12)
+    gal = galsim.Exponential(half_light_radius=0.5) * sed
+    np.testing.assert_allclose(gal.calculateFlux(bands[2]), sed.calculateFlux(bands[2]),
+                               rtol=1.e-12)
+    im = gal.drawImage(bands[2], nx=64, ny=64, scale=0.2, method='no_pixel', dtype=float)
+    sed0 = sed0.withFlux(sed.calculateFlux(bands[2]), bands[2])
+    im0 = (galsim.Exponential(half_light_radius=0.5) * sed0).drawImage(
+            bands[2], nx=64, ny=64, scale=0.2, method='no_pixel', dtype=float)
+    np.testing.assert_allclose(im.array, im0.array, rtol=1.e-10, atol=1.e-15)
+    # Other bandpasses are integrated as usual.
+    bp = galsim.Bandpass(os.path.join(bppath, 'LSST_z.dat'), 'nm')
+    np.testing.assert_allclose(sed.calculateFlux(bp), sed0.calculateFlux(bp) *
+                               sed.calculateFlux(bands[2]) / sed0.calculateFlux(bands[2]),
+                               rtol=2.e-3)
+
+    assert_raises(galsim.GalSimRangeError, bank.calculateFluxes, 0, 3.1)
+    assert_raises(galsim.GalSimRangeError, bank.calculateFluxes, 2, 1.)
+    assert_raises(galsim.GalSimRangeError, bank.getSED, -1, 1.)
+    assert_raises(galsim.GalSimValueError, bank.calculateFluxes, 0, 1., bp)
+    assert_raises(galsim.GalSimValueError, galsim.SEDTemplateBank, templates, bands, [0., 0.])
+    assert_raises(galsim.GalSimValueError, galsim.SEDTemplateBank, templates, bands, [0.])
+    assert_raises(galsim.GalSimRangeError, galsim.SEDTemplateBank, templates, bands, [-1, 1])
+    assert_raises(galsim.GalSimSEDError, galsim.SEDTemplateBank,
+                  galsim.SED('1', 'nm', '1'), bands)
+    bank2 = galsim.SEDTemplateBank(sed_E, bp, redshifts=[0, 0.5, 1])
+    np.testing.assert_allclose(bank2.calculateFluxes(0, 0.5)[0,0],
+                               sed_E.atRedshift(0.5).calculateFlux(bp), rtol=1.e-3)
+    assert_raises(galsim.GalSimError, bank2.calculateMagnitudes, 0, 0.7)
+    np.testing.assert_array_equal(galsim.sed.calculateFluxes(bank2, [0.2, 0.7], bp),
+                                  bank2.calculateFluxes(0, [0.2, 0.7]))
+    assert_raises(galsim.GalSimIncompatibleValuesError, galsim.sed.calculateFluxes, bank, 0.5,
+                  bands)
+    assert_raises(galsim.GalSimIncompatibleValuesError, galsim.sed.calculateFluxes, bank, None,
+                  bands, templates=0)
+    assert_raises(galsim.GalSimIncompatibleValuesError, galsim.sed.calculateMagnitudes, bank, 0.5,
+                  bands)
+    assert_raises(galsim.GalSimIncompatibleValuesError, galsim.sed.calculateFluxes, sed_E, 0.5,
+                  bands, templates=0)
+
+
 if __name__ == "__main__":
     test_SED_basic()
     test_SED_add()
@@ -994,3 +1207,6 @@ if __name__ == "__main__":
     test_fnu_vs_flambda()
     test_ne()
     test_thin()
+    test_photon_table()
+    test_calculateFluxes()
+    test_SEDTemplateBank()
@@ -496,6 +496,7 @@ def test_ne():
             galsim.Sersic(n=1.1, half_light_radius=1.0, flux=1.1),
             galsim.Sersic(n=1.1, half_light_radius=1.0, trunc=1.8),
             galsim.Sersic(n=1.1, half_light_radius=1.0, trunc=1.8, flux_untruncated=True),
+            galsim.Sersic(n=1.1, half_light_radius=1.0, interpolate_n=True),
             galsim.Sersic(n=1.1, half_light_radius=1.0, gsparams=gsp)]
     all_obj_diff(gals)
 
@@ -512,6 +513,52 @@ def test_ne():
     all_obj_diff(gals)
 
 
+@timer
+def test_sersic_interpolate_n():
+    """Test Sersic profiles interpolated between grid values of n.
+    """
+    hlr = 1.7
+    flux = 23.
+    for n in [0.3, 0.4123, 0.97, 1.0, 1.55, 2.8765, 4.0, 5.3, 6.2]:
+        exact = galsim.Sersic(n, half_light_radius=hlr, flux=flux)
+        interp = galsim.Sersic(n, half_light_radius=hlr, flux=flux, interpolate_n=True)
+        print('n = ',n)
+        assert interp.interpolate_n
+        assert interp != exact
+        np.testing.assert_almost_equal(interp.half_light_radius, hlr)
+        np.testing.assert_almost_equal(interp.scale_radius, exact.scale_radius)
+        np.testing.assert_almost_equal(interp.flux, flux)
+        assert interp.centroid == galsim.PositionD(0,0)
+        # maxk, stepk are taken from the grid profiles, so similar but not identical.
+        np.testing.assert_allclose(interp.maxk, exact.maxk, rtol=0.1)
+        np.testing.assert_allclose(interp.stepk, exact.stepk, rtol=0.1)
+
+        # The interpolated profile should be accurate to ~1.e-4 of the peak.
+        im1 = exact.drawImage(nx=64, ny=64, scale=0.3, method='no_pixel')
+        im2 = interp.drawImage(nx=64, ny=64, scale=0.3, method='no_pixel')
+        peak = im1.array.max()
+        print('max diff = ',np.max(np.abs(im1.array-im2.array))/peak)
+        np.testing.assert_allclose(im2.array, im1.array, rtol=0, atol=2.e-4*peak)
+        np.testing.assert_allclose(im2.added_flux, im1.added_flux, rtol=1.e-4)
+        for r in [0.1, 0.5, 1.7, 4.5]:
+            np.testing.assert_allclose(interp.xValue(r,0), exact.xValue(r,0),
+                                       rtol=1.e-3, atol=1.e-5*exact.max_sb)
+        for k in [0.1, 0.5, 1.7, 4.5]:
+            np.testing.assert_allclose(interp.kValue(k,0), exact.kValue(k,0),
+                                       rtol=0, atol=5.e-4*flux)
+
+        # Photon shooting draws from the same interpolated profile.
+        if n in [0.97, 4.0]:
+            do_shoot(interp, im2, "Interpolated Sersic")
+        do_pickle(interp)
+
+    # Truncated profiles ignore interpolate_n.
+    exact = galsim.Sersic(2.8765, half_light_radius=hlr, trunc=6.)
+    interp = galsim.Sersic(2.8765, half_light_radius=hlr, trunc=6., interpolate_n=True)
+    np.testing.assert_equal(interp.kValue(0.5,0.3), exact.kValue(0.5,0.3))
+    np.testing.assert_equal(interp.maxk, exact.maxk)
+
+
 if __name__ == "__main__":
     test_sersic()
     test_sersic_radii()
@@ -519,3 +566,4 @@ if __name__ == "__main__":
     test_sersic_05()
     test_sersic_1()
     test_ne()
+    test_sersic_interpolate_n()
@@ -844,6 +844,26 @@ def test_python_LRU_Cache():
     assert_raises(ValueError, cache.resize, 0)
     assert_raises(ValueError, cache.resize, -20)
 
+    # Check the statistics.
+    cache = galsim.utilities.LRU_Cache(lambda x: np.zeros(x), maxsize=size)
+    for i in range(5):
+        cache(i)
+        cache(i)
+        cache(i)
+    stats = cache.stats()
+    print('stats = ',stats)
+    assert stats['hits'] == cache.hits == 10
+    assert stats['misses'] == cache.misses == 5
+    assert stats['size'] == 5
+    assert stats['maxsize'] == size
+    assert stats['nbytes'] >= 10 * 8
+    for i in range(20):
+        cache(i)
+    stats = cache.stats()
+    assert stats['hits'] == 15
+    assert stats['misses'] == 20
+    assert stats['size'] == size
+
 
 @timer
 def test_rand_with_replacement():
@@ -1244,6 +1264,165 @@ def test_horner2d():
         galsim.utilities.horner2d(x, y[:10], coef)
 
 
+@timer
+def test_profile_cache_dir():
+    """Test the on-disk cache of the profile lookup tables.
+    """
+    import shutil
+    import subprocess
+    import glob
+    cache_dir = os.path.join('output', 'profile_cache')
+    if os.path.exists(cache_dir):
+        shutil.rmtree(cache_dir)
+
+    assert galsim.utilities.get_profile_cache_dir() is None
+    galsim.utilities.set_profile_cache_dir(cache_dir)
+    assert os.path.isdir(cache_dir)
+    assert galsim.utilities.get_profile_cache_dir() == cache_dir
+
+    try:
+        # Use parameters that are unlikely to have been used already in this process.
+        profs = [
+            galsim.Sersic(n=2.3456789, half_light_radius=1.3),
+            galsim.Sersic(n=1.8765432, half_light_radius=1.3, trunc=5.4321),
+            galsim.VonKarman(lam=712.345, r0=0.21, L0=23.456),
+            galsim.SecondKick(lam=712.345, r0=0.21, diam=4.321, obscuration=0.1234,
+                              kcrit=0.2345),
+            galsim.Kolmogorov(fwhm=0.7, gsparams=galsim.GSParams(xvalue_accuracy=1.234e-5)),
+        ]
+        code = "import galsim; profs = [%s]; print([(p.maxk, p.stepk, p.kValue(0.3,0.2).real," \
+               " p.xValue(0.2,0.1)) for p in profs])"%(', '.join(repr(p) for p in profs))
+        vals = [(p.maxk, p.stepk, p.kValue(0.3,0.2).real, p.xValue(0.2,0.1)) for p in profs]
+        print('vals = ',vals)
+        for kind in ['sersic', 'vonkarman', 'secondkick', 'kolmogorov']:
+            files = glob.glob(os.path.join(cache_dir, kind + '_*.dat'))
+            print(kind, files)
+            assert len(files) >= 1
+
+        # Another process should get the same values, reading the files from the cache.
+        env = dict(os.environ)
+        env['GALSIM_CACHE_DIR'] = cache_dir
+        mtimes = [os.path.getmtime(f) for f in glob.glob(os.path.join(cache_dir, '*'))]
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        vals2 = eval(out)
+        print('vals2 = ',vals2)
+        np.testing.assert_array_equal(vals2, vals)
+        assert mtimes == [os.path.getmtime(f) for f in glob.glob(os.path.join(cache_dir, '*'))]
+
+        # Check that it really is using the files by changing the Sersic maxk value in the file.
+        def read_maxk(data):
+            # The maxk value comes after kderiv2, kderiv4, ksq_min, ksq_max, highk_a, highk_b.
+            nkey = int(np.frombuffer(bytes(data[:8]), dtype=np.uint64)[0])
+            i_maxk = 8 + nkey + 8 + 6*8
+            return i_maxk, np.frombuffer(bytes(data[i_maxk:i_maxk+8]))[0]
+        maxk0 = vals[0][0] * profs[0].scale_radius
+        file_name = [f for f in glob.glob(os.path.join(cache_dir, 'sersic_*.dat'))
+                     if np.isclose(read_maxk(open(f,'rb').read())[1], maxk0)]
+        assert len(file_name) == 1
+        data = bytearray(open(file_name[0],'rb').read())
+        i_maxk, maxk = read_maxk(data)
+        data[i_maxk:i_maxk+8] = np.array([123.], dtype=float).tobytes()
+        with open(file_name[0],'wb') as f:
+            f.write(data)
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        vals3 = eval(out)
+        print('vals3 = ',vals3)
+        np.testing.assert_almost_equal(vals3[0][0] * profs[0].scale_radius, 123.)
+        np.testing.assert_array_equal(vals3[1:], vals[1:])
+
+        # With a corrupted file, it recalculates the values.
+        with open(file_name[0],'wb') as f:
+            f.write(data[:100])
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        vals4 = eval(out)
+        np.testing.assert_array_equal(vals4, vals)
+
+        # No cache dir turns it off.
+        env['GALSIM_CACHE_DIR'] = ''
+        shutil.rmtree(cache_dir)
+        out = subprocess.check_output([sys.executable, '-c', code], env=env)
+        np.testing.assert_array_equal(eval(out), vals)
+        assert not os.path.exists(cache_dir)
+    finally:
+        galsim.utilities.set_profile_cache_dir(None)
+    assert galsim.utilities.get_profile_cache_dir() is None
+
+
+@timer
+def test_cache_stats():
+    """Test cache_stats and set_cache_size.
+    """
+    stats = galsim.utilities.cache_stats()
+    print('stats = ',stats)
+    for name in ['sersic', 'spergel', 'airy', 'exponential', 'kolmogorov', 'vonkarman',
+                 'secondkick', 'enclosed_flux', 'convolution_kimage', 'chromatic_multiplier',
+                 'chromatic_effective_profile']:
+        assert name in stats
+        for key in ['hits', 'misses', 'size', 'maxsize', 'nbytes']:
+            assert key in stats[name]
+        assert 0 <= stats[name]['size'] <= stats[name]['maxsize']
+    assert stats['sersic']['maxsize'] == 100
+
+    # Making a new Sersic profile is a miss.  Making another one with the same n is a hit.
+    s0 = stats['sersic']
+    galsim.Sersic(n=1.23456, half_light_radius=1.).maxk
+    s1 = galsim.utilities.cache_stats()['sersic']
+    assert s1['misses'] == s0['misses'] + 1
+    assert s1['hits'] == s0['hits']
+    assert s1['size'] == min(s0['size'] + 1, 100)
+    assert s1['nbytes'] > s0['nbytes']
+    galsim.Sersic(n=1.23456, half_light_radius=2., flux=3.).maxk
+    s2 = galsim.utilities.cache_stats()['sersic']
+    assert s2['misses'] == s1['misses']
+    assert s2['hits'] == s1['hits'] + 1
+
+    # Reduce the size of the cache.
+    galsim.utilities.set_cache_size('sersic', 3)
+    s3 = galsim.utilities.cache_stats()['sersic']
+    assert s3['maxsize'] == 3
+    assert s3['size'] == min(s2['size'], 3)
+    for n in [1.1, 1.2, 1.3, 1.4, 1.23456]:
+        galsim.Sersic(n=n, half_light_radius=1.).maxk
+    s4 = galsim.utilities.cache_stats()['sersic']
+    assert s4['size'] == 3
+    # The last one was already bumped out of the cache.
+    assert s4['misses'] == s3['misses'] + 5
+    galsim.utilities.set_cache_size('sersic', 100)
+    assert galsim.utilities.cache_stats()['sersic']['maxsize'] == 100
+
+    # Python caches can be resized the same way.
+    galsim.utilities.set_cache_size('convolution_kimage', 5)
+    assert galsim.utilities.cache_stats()['convolution_kimage']['maxsize'] == 5
+    assert len(galsim.Convolution._kimage_cache.cache) == 5
+    galsim.utilities.set_cache_size('convolution_kimage', 10)
+
+    # All of the python LRU_Caches are included.
+    import sys
+    python_caches = galsim.utilities._python_caches()
+    registered = [ id(cache) for cache in python_caches.values() ]
+    for module_name, module in list(sys.modules.items()):
+        if not module_name.startswith('galsim.') or module is None: continue
+        for obj in list(vars(module).values()):
+            objs = [obj] + (list(vars(obj).values()) if isinstance(obj, type) else [])
+            for cache in objs:
+                if isinstance(cache, (galsim.utilities.LRU_Cache,
+                                      galsim.utilities.LRU_BytesCache)):
+                    assert id(cache) in registered, "%s cache not in _python_caches"%module_name
+    stats = galsim.utilities.cache_stats()
+    for name, cache in python_caches.items():
+        assert name in stats
+        key = 'maxbytes' if name == 'interpolated_image' else 'maxsize'
+        maxsize = stats[name][key]
+        galsim.utilities.set_cache_size(name, maxsize + 1)
+        assert cache.stats()[key] == maxsize + 1
+        galsim.utilities.set_cache_size(name, maxsize)
+        assert galsim.utilities.cache_stats()[name][key] == maxsize
+
+    assert_raises(ValueError, galsim.utilities.set_cache_size, 'invalid', 10)
+    assert_raises(ValueError, galsim.utilities.set_cache_size, 'sersic', 0)
+    assert_raises(ValueError, galsim.utilities.set_cache_size, 'enclosed_flux', -1)
+
+
 if __name__ == "__main__":
     test_pos()
     test_bounds()
@@ -1263,3 +1442,5 @@ if __name__ == "__main__":
     test_nCr()
     test_horner()
     test_horner2d()
+    test_profile_cache_dir()
+    test_cache_stats()